@@ -0,0 +1,7 @@
+"""Private utility mixins composed into ``FlextTapOracleWmsUtilities.TapOracleWms``.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
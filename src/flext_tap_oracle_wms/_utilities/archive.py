@@ -0,0 +1,191 @@
+"""Compressed archive of WMS responses for record and replay runs.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from datetime import datetime
+from pathlib import Path
+
+from flext_tap_oracle_wms import c, p, r, t
+
+
+class FlextTapOracleWmsUtilitiesArchive:
+    """Record and replay mixin composed into ``u.TapOracleWms``."""
+
+    class WmsArchive:
+        """Gzip JSON-lines archive of raw WMS responses.
+
+        Each line holds the operation, its request parameters, the elapsed
+        seconds and either the response value or the error. Recording
+        appends one gzip member per response, so an interrupted run leaves
+        a readable archive. Replaying answers identical requests in
+        recorded order and repeats the last answer once they run out.
+        """
+
+        def __init__(
+            self,
+            path: Path,
+            *,
+            replaying: bool,
+            replay_timing: bool = False,
+        ) -> None:
+            """Attach to the archive at ``path`` for recording or replaying."""
+            self.path = path
+            self.replaying = replaying
+            self.replay_timing = replay_timing
+            self._lock = threading.Lock()
+            self._recorded: dict[str, deque[t.JsonMapping]] | None = None
+
+        @classmethod
+        def request_key(cls, operation: str, params: t.JsonMapping) -> str:
+            """Return the replay key of one request.
+
+            Timestamp bounds are left out: the run-start upper bound and the
+            lookback lower bound both move with the clock, so a replay run
+            still matches the recorded requests.
+            """
+            filters = params.get("filters")
+            normalized = (
+                {
+                    **params,
+                    "filters": {
+                        name: value
+                        for name, value in filters.items()
+                        if not cls._time_bound(name, value)
+                    },
+                }
+                if isinstance(filters, Mapping)
+                else params
+            )
+            return json.dumps([operation, normalized], sort_keys=True, default=str)
+
+        @staticmethod
+        def _time_bound(name: str, value: t.JsonValue) -> bool:
+            """Whether a filter bounds a column by a timestamp."""
+            if not name.endswith((
+                c.TapOracleWms.Replication.LOWER_BOUND_FILTER_SUFFIX,
+                c.TapOracleWms.Replication.UPPER_BOUND_FILTER_SUFFIX,
+            )) or not isinstance(value, str):
+                return False
+            try:
+                datetime.fromisoformat(value)
+            except ValueError:
+                return False
+            return True
+
+        def record(
+            self,
+            operation: str,
+            params: t.JsonMapping,
+            *,
+            elapsed_seconds: float,
+            value: object = None,
+            error: str | None = None,
+        ) -> None:
+            """Append one response to the archive."""
+            line = json.dumps(
+                {
+                    "operation": operation,
+                    "params": params,
+                    "elapsed_seconds": elapsed_seconds,
+                    "value": value,
+                    "error": error,
+                },
+                default=str,
+            )
+            with self._lock:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with gzip.open(self.path, "at", encoding="utf-8") as handle:
+                    handle.write(line + "\n")
+
+        def exchange[T](
+            self,
+            operation: str,
+            params: t.JsonMapping,
+            request: Callable[[], p.Result[t.SequenceOf[T]]],
+            decode: Callable[[t.JsonValue], T],
+        ) -> p.Result[t.SequenceOf[T]]:
+            """Answer a request from the archive, or perform and record it.
+
+            Args:
+                operation: WMS client operation name.
+                params: Request parameters identifying the response.
+                request: Live request, only called when recording.
+                decode: Converts one archived item back to the result type.
+
+            Returns:
+                The live result, or the replayed one.
+
+            """
+            if not self.replaying:
+                started = time.perf_counter()
+                result = request()
+                self.record(
+                    operation,
+                    params,
+                    elapsed_seconds=time.perf_counter() - started,
+                    value=list(result.value) if result.success else None,
+                    error=None if result.success else result.error or "",
+                )
+                return result
+            replayed = self.replay(operation, params)
+            if replayed is None:
+                return r[t.SequenceOf[T]].fail(
+                    f"No recorded response for {operation} "
+                    f"{json.dumps(params, sort_keys=True, default=str)}",
+                )
+            value, error = replayed
+            if error is not None:
+                return r[t.SequenceOf[T]].fail(error)
+            items = value if isinstance(value, list) else []
+            return r[t.SequenceOf[T]].ok([decode(item) for item in items])
+
+        def replay(
+            self,
+            operation: str,
+            params: t.JsonMapping,
+        ) -> tuple[t.JsonValue, str | None] | None:
+            """Return the recorded ``(value, error)`` of a request, if any.
+
+            With ``replay_timing`` the recorded elapsed time is slept first,
+            so concurrency and throttling behave as in the recorded run.
+            """
+            key = self.request_key(operation, params)
+            with self._lock:
+                if self._recorded is None:
+                    self._recorded = self._load()
+                responses = self._recorded.get(key)
+                if not responses:
+                    return None
+                response = responses.popleft() if len(responses) > 1 else responses[0]
+            elapsed = response.get("elapsed_seconds")
+            if self.replay_timing and isinstance(elapsed, (int, float)):
+                time.sleep(elapsed)
+            error = response.get("error")
+            return response.get("value"), str(error) if error is not None else None
+
+        def _load(self) -> dict[str, deque[t.JsonMapping]]:
+            recorded: dict[str, deque[t.JsonMapping]] = {}
+            with gzip.open(self.path, "rt", encoding="utf-8") as handle:
+                for line in handle:
+                    entry = json.loads(line)
+                    if not isinstance(entry, Mapping):
+                        continue
+                    params = entry.get("params")
+                    if not isinstance(params, Mapping):
+                        continue
+                    key = self.request_key(str(entry.get("operation")), params)
+                    recorded.setdefault(key, deque()).append(entry)
+            return recorded
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesArchive"]
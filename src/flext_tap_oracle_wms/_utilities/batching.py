@@ -0,0 +1,91 @@
+"""Parent key collection and ``__in`` filter batching for child entities.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+from urllib.parse import quote
+
+from flext_tap_oracle_wms import t
+
+
+class FlextTapOracleWmsUtilitiesBatching:
+    """Child entity batching mixin composed into ``u.TapOracleWms``."""
+
+    class ParentKeys:
+        """Thread-safe registry of parent keys emitted during a tap run.
+
+        Keys are tracked per parent entity and key field, so children joining
+        on different parent columns do not share a key set. A key set is only
+        handed out once the parent has finished emitting it.
+        """
+
+        def __init__(self) -> None:
+            """Create an empty registry."""
+            self._keys: dict[tuple[str, str], set[str]] = {}
+            self._finished: set[tuple[str, str]] = set()
+            self._lock = threading.Lock()
+
+        def start(self, parent: str, field: str) -> None:
+            """Mark ``parent`` as extracted in this run, with no keys yet."""
+            with self._lock:
+                self._keys.setdefault((parent, field), set())
+
+        def add(self, parent: str, field: str, key: str) -> None:
+            """Record one emitted ``field`` value of ``parent``."""
+            with self._lock:
+                self._keys.setdefault((parent, field), set()).add(key)
+
+        def finish(self, parent: str, field: str) -> None:
+            """Mark the keys of ``parent`` as complete."""
+            with self._lock:
+                self._keys.setdefault((parent, field), set())
+                self._finished.add((parent, field))
+
+        def collected(self, parent: str, field: str) -> frozenset[str] | None:
+            """Return the keys of ``parent``, or None until it finished extracting."""
+            with self._lock:
+                if (parent, field) not in self._finished:
+                    return None
+                return frozenset(self._keys[parent, field])
+
+    class KeyBatching:
+        """Split key lists into ``__in`` filter values within a URL budget."""
+
+        @staticmethod
+        def chunk(keys: t.IterableOf[str], max_length: int) -> t.StrSequence:
+            """Join sorted keys into comma-separated values of bounded length.
+
+            The URL-encoded length of each value stays within ``max_length``;
+            a single key longer than that still gets its own value.
+
+            Args:
+                keys: Parent keys to filter on.
+                max_length: Maximum URL-encoded length of one filter value.
+
+            Returns:
+                Comma-separated filter values, one per request batch.
+
+            """
+            separator = len(quote(","))
+            chunks: list[str] = []
+            current: list[str] = []
+            length = 0
+            for key in sorted(keys):
+                encoded = len(quote(key, safe=""))
+                added = encoded if not current else encoded + separator
+                if current and length + added > max_length:
+                    chunks.append(",".join(current))
+                    current, length = [], 0
+                    added = encoded
+                current.append(key)
+                length += added
+            if current:
+                chunks.append(",".join(current))
+            return chunks
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesBatching"]
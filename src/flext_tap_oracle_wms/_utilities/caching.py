@@ -0,0 +1,112 @@
+"""On-disk WMS response cache revalidated by change probes or a TTL.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+
+from flext_tap_oracle_wms import t
+
+
+class FlextTapOracleWmsUtilitiesCaching:
+    """Response cache mixin composed into ``u.TapOracleWms``."""
+
+    class ResponseCache:
+        """Record pages cached in one JSON file per request.
+
+        An entry stored with a validator (a change probe fingerprint) stays
+        valid while the caller presents the same validator; entries stored
+        without one expire after ``ttl_seconds``. Files are replaced
+        atomically, so tap processes on one host can share a directory.
+        """
+
+        def __init__(self, directory: Path, ttl_seconds: float) -> None:
+            """Use ``directory`` for cache files, creating it when needed."""
+            self.directory = directory
+            self.ttl_seconds = ttl_seconds
+
+        @staticmethod
+        def key(
+            entity: str,
+            limit: int,
+            filters: t.ScalarMapping | None,
+        ) -> str:
+            """Return the cache key of one entity data request."""
+            request = json.dumps(
+                {"entity": entity, "limit": limit, "filters": dict(filters or {})},
+                sort_keys=True,
+                default=str,
+            )
+            return hashlib.sha256(request.encode("utf-8")).hexdigest()
+
+        def get(
+            self,
+            key: str,
+            validator: str | None = None,
+        ) -> t.SequenceOf[t.JsonMapping] | None:
+            """Return cached records for ``key`` if still valid, else None.
+
+            Args:
+                key: Request cache key.
+                validator: Current change probe, or None to fall back to TTL.
+
+            Returns:
+                Cached records, or None on a miss or a stale entry.
+
+            """
+            path = self.directory / f"{key}.json"
+            try:
+                entry = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            if not isinstance(entry, Mapping):
+                return None
+            records = entry.get("records")
+            if not isinstance(records, list):
+                return None
+            if validator is not None:
+                fresh = entry.get("validator") == validator
+            else:
+                stored_at = entry.get("stored_at")
+                fresh = (
+                    isinstance(stored_at, (int, float))
+                    and time.time() - stored_at < self.ttl_seconds
+                )
+            return records if fresh else None
+
+        def put(
+            self,
+            key: str,
+            records: t.SequenceOf[t.JsonMapping],
+            validator: str | None = None,
+        ) -> None:
+            """Store ``records`` for ``key``, tagged with ``validator``."""
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self.directory / f"{key}.json"
+            staging = path.with_name(
+                f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp",
+            )
+            staging.write_text(
+                json.dumps(
+                    {
+                        "validator": validator,
+                        "stored_at": time.time(),
+                        "records": list(records),
+                    },
+                    default=str,
+                ),
+                encoding="utf-8",
+            )
+            staging.replace(path)
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesCaching"]
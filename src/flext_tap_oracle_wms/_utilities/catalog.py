@@ -0,0 +1,284 @@
+"""Single-pass Singer catalog loading and writing.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TextIO
+
+from flext_tap_oracle_wms import t
+
+
+class _JsonReader:
+    """Incremental reader of JSON values from a text stream.
+
+    Holds at most one value plus one read chunk in memory, so a catalog
+    file can be walked entry by entry.
+    """
+
+    _WHITESPACE = frozenset(" \t\r\n")
+
+    def __init__(self, handle: TextIO, chunk_chars: int) -> None:
+        self._handle = handle
+        self._chunk_chars = chunk_chars
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Append the next chunk, dropping consumed text; False at the end."""
+        if self._eof:
+            return False
+        chunk = self._handle.read(self._chunk_chars)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos :] + chunk
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or ``""`` at the end."""
+        while True:
+            while (
+                self._pos < len(self._buffer)
+                and self._buffer[self._pos] in self._WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, token: str) -> None:
+        """Consume ``token`` as the next non-whitespace character."""
+        if self.peek() != token:
+            msg = f"Expected {token!r}"
+            raise json.JSONDecodeError(msg, self._buffer, self._pos)
+        self._pos += 1
+
+    def skip(self, token: str) -> None:
+        """Consume ``token`` if it is the next non-whitespace character."""
+        if self.peek() == token:
+            self._pos += 1
+
+    def value(self) -> t.JsonValue:
+        """Decode the next complete JSON value, reading more text as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            if end < len(self._buffer) or not self._fill():
+                self._pos = end
+                return value
+
+
+class FlextTapOracleWmsUtilitiesCatalog:
+    """Catalog codec mixin composed into ``u.TapOracleWms``."""
+
+    class CatalogCodec:
+        """Single-pass Singer catalog reader and incremental writer.
+
+        Only the catalog skeleton (stream identifiers, metadata and breadcrumbs)
+        is normalized; schema bodies are passed through by reference, so the
+        cost of loading grows with the number of streams instead of the size
+        of their schemas. Catalog files are read one stream entry at a time.
+        """
+
+        READ_CHUNK_CHARS: int = 1 << 16
+
+        OPTIONAL_ENTRY_KEYS: tuple[str, ...] = (
+            "replication_key",
+            "replication_method",
+            "is_view",
+            "table_name",
+            "database_name",
+            "row_count",
+        )
+
+        @staticmethod
+        def _as_list(value: t.JsonValue) -> t.JsonList:
+            if isinstance(value, Sequence) and not isinstance(value, t.STR_BYTES_TYPES):
+                return list(value)
+            return []
+
+        @classmethod
+        def normalize_entry(cls, raw_stream: t.JsonMapping) -> t.JsonDict:
+            """Normalize one raw catalog stream entry.
+
+            Args:
+                raw_stream: Raw Singer catalog entry.
+
+            Returns:
+                Entry with canonical Singer keys; the schema is not copied.
+
+            """
+            metadata: t.JsonList = []
+            for raw_entry in cls._as_list(raw_stream.get("metadata")):
+                if not isinstance(raw_entry, Mapping):
+                    continue
+                metadata_map = raw_entry.get("metadata")
+                metadata.append({
+                    "breadcrumb": [
+                        str(item) for item in cls._as_list(raw_entry.get("breadcrumb"))
+                    ],
+                    "metadata": dict(metadata_map)
+                    if isinstance(metadata_map, Mapping)
+                    else {},
+                })
+            schema = raw_stream.get("schema")
+            stream_name = str(raw_stream.get("stream", ""))
+            entry: t.JsonDict = {
+                "tap_stream_id": str(raw_stream.get("tap_stream_id") or stream_name),
+                "stream": stream_name,
+                "schema": schema if isinstance(schema, Mapping) else {},
+                "metadata": metadata,
+                "key_properties": [
+                    str(key) for key in cls._as_list(raw_stream.get("key_properties"))
+                ],
+            }
+            for key in cls.OPTIONAL_ENTRY_KEYS:
+                value = raw_stream.get(key)
+                if value is not None:
+                    entry[key] = value
+            return entry
+
+        @classmethod
+        def iter_entries(cls, raw_catalog: t.JsonMapping) -> Iterator[t.JsonDict]:
+            """Yield normalized entries of a raw catalog one at a time.
+
+            Args:
+                raw_catalog: Raw Singer catalog mapping.
+
+            Yields:
+                Normalized catalog entries; non-mapping entries are skipped.
+
+            """
+            for raw_stream in cls._as_list(raw_catalog.get("streams")):
+                if isinstance(raw_stream, Mapping):
+                    yield cls.normalize_entry(raw_stream)
+
+        @classmethod
+        def load(cls, raw_catalog: t.JsonMapping) -> t.MutableJsonMapping:
+            """Load a raw catalog into a Singer catalog dict in a single pass.
+
+            Args:
+                raw_catalog: Raw Singer catalog mapping.
+
+            Returns:
+                Singer catalog dict with normalized stream entries; other
+                top-level keys such as ``type`` are kept as they are.
+
+            """
+            streams: t.JsonList = list(cls.iter_entries(raw_catalog))
+            return {
+                **{
+                    key: value for key, value in raw_catalog.items() if key != "streams"
+                },
+                "streams": streams,
+            }
+
+        @staticmethod
+        def write(entries: Iterable[t.JsonMapping], out: TextIO) -> int:
+            """Write catalog entries as one JSON document, entry by entry.
+
+            Args:
+                entries: Catalog entries, typically from :meth:`iter_entries`.
+                out: Text stream receiving the JSON catalog.
+
+            Returns:
+                Number of entries written.
+
+            """
+            written = 0
+            out.write('{"streams": [')
+            for entry in entries:
+                if written:
+                    out.write(",")
+                out.write(json.dumps(entry, separators=(",", ":")))
+                written += 1
+            out.write("]}\n")
+            return written
+
+        @classmethod
+        def read_file(cls, path: Path) -> Iterator[t.JsonDict]:
+            """Yield normalized entries of a catalog file; nothing if it is absent.
+
+            The ``streams`` array is decoded one entry at a time, so only the
+            entry being yielded is held in memory.
+
+            Args:
+                path: Catalog JSON file.
+
+            Yields:
+                Normalized catalog entries.
+
+            Raises:
+                json.JSONDecodeError: If the file is not a valid JSON catalog.
+
+            """
+            if not path.is_file():
+                return
+            with path.open(encoding="utf-8") as handle:
+                for raw_stream in cls._iter_raw_streams(
+                    _JsonReader(handle, cls.READ_CHUNK_CHARS),
+                ):
+                    if isinstance(raw_stream, Mapping):
+                        yield cls.normalize_entry(raw_stream)
+
+        @staticmethod
+        def _iter_raw_streams(reader: _JsonReader) -> Iterator[t.JsonValue]:
+            """Yield the raw ``streams`` items of a catalog document in order.
+
+            Other top-level values are decoded and dropped; a document that is
+            not an object yields nothing.
+            """
+            if reader.peek() != "{":
+                reader.value()
+                return
+            reader.expect("{")
+            while reader.peek() not in {"}", ""}:
+                key = reader.value()
+                reader.expect(":")
+                if key == "streams" and reader.peek() == "[":
+                    reader.expect("[")
+                    while reader.peek() not in {"]", ""}:
+                        yield reader.value()
+                        reader.skip(",")
+                    reader.expect("]")
+                else:
+                    reader.value()
+                reader.skip(",")
+            reader.expect("}")
+
+        @classmethod
+        def write_file(cls, path: Path, entries: Iterable[t.JsonMapping]) -> int:
+            """Atomically replace a catalog file with the given entries.
+
+            Args:
+                path: Catalog JSON file.
+                entries: Catalog entries to write.
+
+            Returns:
+                Number of entries written.
+
+            """
+            path.parent.mkdir(parents=True, exist_ok=True)
+            staging = path.with_name(f"{path.name}.tmp")
+            with staging.open("w", encoding="utf-8") as handle:
+                written = cls.write(entries, handle)
+            staging.replace(path)
+            return written
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesCatalog"]
@@ -0,0 +1,129 @@
+"""Circuit breaker shared by every WMS request of a tap.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flext_tap_oracle_wms import c
+from flext_tap_oracle_wms._utilities.retry import FlextTapOracleWmsUtilitiesRetry
+
+
+class FlextTapOracleWmsUtilitiesCircuit:
+    """Circuit breaker mixin composed into ``u.TapOracleWms``."""
+
+    class CircuitBreaker:
+        """Thread-safe closed/open/half-open circuit breaker.
+
+        After ``failure_threshold`` consecutive failures the circuit opens and
+        requests fail fast for ``recovery_timeout`` seconds. Then one caller
+        is admitted as a half-open probe: success closes the circuit, failure
+        opens it again.
+        """
+
+        def __init__(self, failure_threshold: int, recovery_timeout: float) -> None:
+            """Create a closed circuit."""
+            if failure_threshold < 1 or recovery_timeout < 0:
+                msg = "Circuit breaker needs failure_threshold >= 1 and recovery_timeout >= 0"
+                raise ValueError(msg)
+            self.failure_threshold = failure_threshold
+            self.recovery_timeout = recovery_timeout
+            self._failures = 0
+            self._opened_at: float | None = None
+            self._probe_owner: int | None = None
+            self._lock = threading.Lock()
+            self._probe_done = threading.Condition(self._lock)
+
+        @property
+        def state(self) -> str:
+            """Circuit state: ``closed``, ``open`` or ``half_open``."""
+            with self._lock:
+                if self._opened_at is None:
+                    return c.TapOracleWms.CircuitBreaker.STATE_CLOSED
+                if self._probe_owner is not None or self._open_for() <= 0:
+                    return c.TapOracleWms.CircuitBreaker.STATE_HALF_OPEN
+                return c.TapOracleWms.CircuitBreaker.STATE_OPEN
+
+        def _open_for(self) -> float:
+            if self._opened_at is None:
+                return 0.0
+            return self._opened_at + self.recovery_timeout - time.monotonic()
+
+        def _end_probe(self) -> None:
+            self._probe_owner = None
+            self._probe_done.notify_all()
+
+        def admit(self) -> float:
+            """Admit one request, or return the seconds to wait before trying again.
+
+            Returns 0.0 when the request may proceed, including the single
+            half-open probe. While the probe is in flight other callers block
+            until its outcome is known, instead of being rejected.
+            """
+            with self._lock:
+                while self._probe_owner is not None:
+                    self._probe_done.wait()
+                if self._opened_at is None:
+                    return 0.0
+                open_for = self._open_for()
+                if open_for > 0:
+                    return open_for
+                self._probe_owner = threading.get_ident()
+                return 0.0
+
+        def record(self, *, success: bool) -> None:
+            """Record the outcome of an admitted request.
+
+            While a half-open probe is in flight only the probing thread
+            settles the circuit; outcomes of requests admitted before the
+            circuit opened are stale and ignored.
+            """
+            with self._lock:
+                probing = self._probe_owner is not None
+                if probing:
+                    if self._probe_owner != threading.get_ident():
+                        return
+                    self._end_probe()
+                if success:
+                    self._failures = 0
+                    self._opened_at = None
+                    return
+                self._failures += 1
+                if probing or self._failures >= self.failure_threshold:
+                    self._opened_at = time.monotonic()
+
+        def release(self) -> None:
+            """End an admitted request whose outcome was not recorded.
+
+            Lets waiting callers in when the calling thread's half-open probe
+            raised instead of returning; otherwise does nothing.
+            """
+            with self._lock:
+                if self._probe_owner == threading.get_ident():
+                    self._end_probe()
+
+        @staticmethod
+        def succeeded(*, success: bool, error: str | None) -> bool:
+            """Return whether a request outcome counts as a success for the circuit.
+
+            Client errors such as 404 show the server is answering, so only
+            failures a retry could fix count against it.
+            """
+            return (
+                success
+                or not FlextTapOracleWmsUtilitiesRetry.RetryBackoff.retryable(
+                    error or "",
+                )
+            )
+
+        @staticmethod
+        def open_error(open_for: float) -> str:
+            """Return the failure message of a request rejected by the circuit."""
+            return f"Oracle WMS circuit breaker is open; retry in {open_for:.1f}s"
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesCircuit"]
@@ -0,0 +1,135 @@
+"""AIMD adaptive concurrency control for WMS page requests.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from flext_tap_oracle_wms import c, m
+
+
+class FlextTapOracleWmsUtilitiesConcurrency:
+    """Concurrency mixin composed into ``u.TapOracleWms``."""
+
+    class AdaptiveConcurrency:
+        """Additive-increase/multiplicative-decrease limit on in-flight requests.
+
+        Each healthy response grows the limit by ``1 / limit``, so about one
+        slot per round of requests. An overload response (HTTP 429/503) or a
+        latency spike over the smoothed baseline multiplies the limit by
+        ``decrease_factor``; a ``Retry-After`` pauses new requests until it
+        elapses.
+        """
+
+        def __init__(
+            self,
+            max_limit: int,
+            min_limit: int = 1,
+            decrease_factor: float = c.TapOracleWms.Concurrency.DECREASE_FACTOR,
+            latency_spike_ratio: float = (
+                c.TapOracleWms.Concurrency.LATENCY_SPIKE_RATIO
+            ),
+        ) -> None:
+            """Start at ``min_limit`` in-flight requests."""
+            if not 1 <= min_limit <= max_limit:
+                msg = "Concurrency limits need 1 <= min_limit <= max_limit"
+                raise ValueError(msg)
+            self.max_limit = max_limit
+            self.min_limit = min_limit
+            self._decrease_factor = decrease_factor
+            self._latency_spike_ratio = latency_spike_ratio
+            self._limit = float(min_limit)
+            self._in_flight = 0
+            self._max_in_flight = 0
+            self._overloads = 0
+            self._baseline: float | None = None
+            self._resume_at = 0.0
+            self._condition = threading.Condition()
+
+        @property
+        def limit(self) -> int:
+            """Current number of requests allowed in flight."""
+            with self._condition:
+                return int(self._limit)
+
+        def acquire(self) -> None:
+            """Block until a request slot is free and no Retry-After is pending."""
+            with self._condition:
+                while True:
+                    pause = self._resume_at - time.monotonic()
+                    if pause <= 0 and self._in_flight < int(self._limit):
+                        break
+                    self._condition.wait(timeout=pause if pause > 0 else None)
+                self._in_flight += 1
+                self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+        def release(
+            self,
+            latency_seconds: float,
+            *,
+            overloaded: bool = False,
+            retry_after: float | None = None,
+        ) -> None:
+            """Free a slot and adapt the limit to the request outcome."""
+            with self._condition:
+                self._in_flight -= 1
+                baseline = self._baseline
+                spiked = (
+                    baseline is not None
+                    and latency_seconds > baseline * self._latency_spike_ratio
+                )
+                if overloaded or spiked:
+                    self._overloads += 1
+                    self._limit = max(
+                        float(self.min_limit),
+                        self._limit * self._decrease_factor,
+                    )
+                else:
+                    self._limit = min(
+                        float(self.max_limit),
+                        self._limit + 1.0 / self._limit,
+                    )
+                if not overloaded:
+                    weight = c.TapOracleWms.Concurrency.LATENCY_EWMA_WEIGHT
+                    self._baseline = (
+                        latency_seconds
+                        if baseline is None
+                        else baseline + weight * (latency_seconds - baseline)
+                    )
+                if retry_after:
+                    self._resume_at = max(
+                        self._resume_at,
+                        time.monotonic() + retry_after,
+                    )
+                self._condition.notify_all()
+
+        def metrics(self) -> m.TapOracleWms.ConcurrencyMetrics:
+            """Snapshot of the current and peak in-flight requests."""
+            with self._condition:
+                return m.TapOracleWms.ConcurrencyMetrics(
+                    limit=int(self._limit),
+                    max_limit=self.max_limit,
+                    in_flight=self._in_flight,
+                    max_in_flight=self._max_in_flight,
+                    overloads=self._overloads,
+                )
+
+        @staticmethod
+        def overload_signal(error: str) -> tuple[bool, float | None]:
+            """Read an overload status and Retry-After seconds from a client error.
+
+            The WMS client reports failures as text, so the HTTP status and
+            the ``Retry-After`` header are recovered from the message.
+            """
+            overloaded = (
+                c.TapOracleWms.Concurrency.OVERLOAD_STATUS_RE.search(error) is not None
+            )
+            match = c.TapOracleWms.Concurrency.RETRY_AFTER_RE.search(error)
+            return overloaded, float(match.group(1)) if match else None
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesConcurrency"]
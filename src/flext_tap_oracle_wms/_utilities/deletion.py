@@ -0,0 +1,81 @@
+"""Compact primary key snapshots for delete detection.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import contextlib
+import time
+from array import array
+from pathlib import Path
+
+from flext_tap_oracle_wms import c, t
+
+
+class FlextTapOracleWmsUtilitiesDeletion:
+    """Delete detection mixin composed into ``u.TapOracleWms``."""
+
+    class KeySnapshot:
+        """Sorted integer primary keys of one entity in a binary file.
+
+        Keys are stored as a packed array of 64-bit integers, about 8 bytes
+        per row, and replaced atomically so an interrupted pass keeps the
+        previous snapshot.
+        """
+
+        def __init__(self, path: Path) -> None:
+            """Attach to the snapshot at ``path``; it may not exist yet."""
+            self.path = path
+
+        def age_seconds(self) -> float | None:
+            """Seconds since the snapshot was written, or None if missing."""
+            try:
+                return time.time() - self.path.stat().st_mtime
+            except FileNotFoundError:
+                return None
+
+        def load(self) -> array[int]:
+            """Read the stored sorted keys; empty when no snapshot exists."""
+            keys = array(c.TapOracleWms.Deletion.KEY_TYPECODE)
+            with contextlib.suppress(FileNotFoundError):
+                keys.frombytes(self.path.read_bytes())
+            return keys
+
+        def save(self, keys: t.IterableOf[int]) -> None:
+            """Replace the snapshot with ``keys`` in sorted order."""
+            packed = array(c.TapOracleWms.Deletion.KEY_TYPECODE, sorted(keys))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            staging.write_bytes(packed.tobytes())
+            staging.replace(self.path)
+
+        @staticmethod
+        def missing(
+            previous: t.SequenceOf[int],
+            current: t.SequenceOf[int],
+        ) -> list[int]:
+            """Return keys of ``previous`` absent from ``current``.
+
+            Both sequences must be sorted; they are merged in one pass.
+
+            Args:
+                previous: Keys of the last snapshot.
+                current: Keys seen by this pass.
+
+            Returns:
+                Sorted keys that were deleted since the last snapshot.
+
+            """
+            deleted: list[int] = []
+            index = 0
+            for key in previous:
+                while index < len(current) and current[index] < key:
+                    index += 1
+                if index == len(current) or current[index] != key:
+                    deleted.append(key)
+            return deleted
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesDeletion"]
@@ -0,0 +1,115 @@
+"""Budgeted request hedging for tail-latency WMS pages.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+
+from flext_tap_oracle_wms import c
+
+
+class FlextTapOracleWmsUtilitiesHedging:
+    """Hedging mixin composed into ``u.TapOracleWms``."""
+
+    class HedgePolicy:
+        """When to duplicate a slow page request, within a request budget.
+
+        The hedge threshold is the ``percentile`` of recent page latencies,
+        available once ``MIN_SAMPLES`` pages completed. Hedges are limited to
+        ``budget_ratio`` of the primary page requests issued so far; the
+        hedges themselves do not grow the budget.
+        """
+
+        def __init__(
+            self,
+            percentile: float,
+            budget_ratio: float,
+            window: int = c.TapOracleWms.Hedging.LATENCY_WINDOW,
+        ) -> None:
+            """Create a policy with no latency samples and an empty budget."""
+            if (
+                not 0 < percentile < c.TapOracleWms.Hedging.MAX_PERCENTILE
+                or budget_ratio < 0
+            ):
+                msg = "Hedging needs 0 < percentile < 100 and budget_ratio >= 0"
+                raise ValueError(msg)
+            self.percentile = percentile
+            self.budget_ratio = budget_ratio
+            self._latencies: deque[float] = deque(maxlen=window)
+            self._started: dict[int, float] = {}
+            self._requests = 0
+            self._hedges = 0
+            self._lock = threading.Lock()
+
+        @property
+        def hedges(self) -> int:
+            """Number of hedged requests sent."""
+            with self._lock:
+                return self._hedges
+
+        @property
+        def requests(self) -> int:
+            """Number of primary page requests completed, hedges excluded."""
+            with self._lock:
+                return self._requests
+
+        def begin(self, page: int, *, primary: bool) -> float:
+            """Note that a request for ``page`` is being sent; return its start."""
+            begun = time.perf_counter()
+            if primary:
+                with self._lock:
+                    self._started[page] = begun
+            return begun
+
+        def started(self, page: int) -> float | None:
+            """Return when the primary request for ``page`` was sent, if in flight."""
+            with self._lock:
+                return self._started.get(page)
+
+        def finish(self, page: int, begun: float, *, primary: bool) -> None:
+            """Record the latency of a request started by ``begin``."""
+            latency_seconds = time.perf_counter() - begun
+            if primary:
+                with self._lock:
+                    self._started.pop(page, None)
+            self.record(latency_seconds, primary=primary)
+
+        def record(self, latency_seconds: float, *, primary: bool = True) -> None:
+            """Record the latency of one completed page request."""
+            with self._lock:
+                if primary:
+                    self._requests += 1
+                self._latencies.append(latency_seconds)
+
+        def threshold(self) -> float | None:
+            """Return the latency past which a page is hedged, once known."""
+            with self._lock:
+                if len(self._latencies) < c.TapOracleWms.Hedging.MIN_SAMPLES:
+                    return None
+                ordered = sorted(self._latencies)
+            rank = (
+                math.ceil(
+                    self.percentile
+                    / c.TapOracleWms.Hedging.MAX_PERCENTILE
+                    * len(ordered),
+                )
+                - 1
+            )
+            return ordered[max(rank, 0)]
+
+        def try_spend(self) -> bool:
+            """Take one hedge from the budget, if it is not used up."""
+            with self._lock:
+                if self._hedges + 1 > self.budget_ratio * self._requests:
+                    return False
+                self._hedges += 1
+                return True
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesHedging"]
@@ -0,0 +1,47 @@
+"""Jittered exponential backoff for WMS page request retries.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import secrets
+
+from flext_tap_oracle_wms import c
+
+_JITTER = secrets.SystemRandom()
+
+
+class FlextTapOracleWmsUtilitiesRetry:
+    """Retry mixin composed into ``u.TapOracleWms``."""
+
+    class RetryBackoff:
+        """Backoff schedule for retrying one failed page request."""
+
+        @staticmethod
+        def retryable(error: str) -> bool:
+            """Return False for client errors a retry cannot fix (400/401/403/404/422)."""
+            return c.TapOracleWms.Retry.NON_RETRYABLE_STATUS_RE.search(error) is None
+
+        @staticmethod
+        def delay(
+            attempt: int,
+            base_delay: float,
+            retry_after: float | None = None,
+        ) -> float:
+            """Return the wait before retry number ``attempt`` (1-based).
+
+            The exponential delay ``base_delay * 2 ** (attempt - 1)`` is capped
+            at ``MAX_DELAY_SECONDS`` and jittered into its upper half so
+            concurrent retries spread out; a server ``Retry-After`` is a floor.
+            """
+            ceiling = min(
+                c.TapOracleWms.Retry.MAX_DELAY_SECONDS,
+                base_delay * 2 ** (attempt - 1),
+            )
+            jittered = _JITTER.uniform(ceiling / 2, ceiling)
+            return max(jittered, retry_after or 0.0)
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesRetry"]
@@ -0,0 +1,230 @@
+"""Run history and longest-processing-time-first stream scheduling.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import statistics
+import threading
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from pathlib import Path
+
+from flext_tap_oracle_wms import c, m, t
+
+
+class FlextTapOracleWmsUtilitiesScheduling:
+    """Scheduling mixin composed into ``u.TapOracleWms``."""
+
+    class RunHistory:
+        """Per-stream run statistics kept in a small local JSON store.
+
+        Statistics of the current run accumulate in memory and are appended
+        to the store by :meth:`commit`; only the latest ``depth`` runs of each
+        stream are kept.
+        """
+
+        def __init__(
+            self,
+            path: Path,
+            depth: int = c.TapOracleWms.Scheduling.RUN_HISTORY_DEPTH,
+        ) -> None:
+            """Load the store at ``path``; a missing or unreadable store is empty."""
+            self._path = path
+            self._depth = depth
+            self._lock = threading.Lock()
+            self._runs: dict[str, list[m.TapOracleWms.StreamRunStats]] = self._load()
+            self._current: dict[str, m.TapOracleWms.StreamRunStats] = {}
+
+        def _load(self) -> dict[str, list[m.TapOracleWms.StreamRunStats]]:
+            try:
+                payload = json.loads(self._path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return {}
+            streams = payload.get("streams") if isinstance(payload, Mapping) else None
+            if not isinstance(streams, Mapping):
+                return {}
+            runs: dict[str, list[m.TapOracleWms.StreamRunStats]] = {}
+            for name, entries in streams.items():
+                if not isinstance(entries, list):
+                    continue
+                runs[str(name)] = [
+                    m.TapOracleWms.StreamRunStats.model_validate(entry)
+                    for entry in entries
+                    if isinstance(entry, Mapping)
+                ]
+            return runs
+
+        def add(
+            self,
+            stream: str,
+            *,
+            duration_seconds: float,
+            records: int,
+            byte_count: int,
+        ) -> None:
+            """Accumulate extraction statistics of ``stream`` for this run."""
+            with self._lock:
+                current = self._current.get(stream)
+                if current is None:
+                    current = m.TapOracleWms.StreamRunStats(stream=stream)
+                self._current[stream] = current.model_copy(
+                    update={
+                        "duration_seconds": current.duration_seconds + duration_seconds,
+                        "records": current.records + records,
+                        "byte_count": current.byte_count + byte_count,
+                    },
+                )
+
+        def record_probe(self, stream: str, probe: str) -> None:
+            """Keep the change probe of ``stream`` seen by this run."""
+            with self._lock:
+                current = self._current.get(stream)
+                if current is None:
+                    current = m.TapOracleWms.StreamRunStats(stream=stream)
+                self._current[stream] = current.model_copy(update={"probe": probe})
+
+        def last_probe(self, stream: str) -> str:
+            """Return the change probe of the last committed run of ``stream``."""
+            runs = self.runs(stream)
+            return runs[-1].probe if runs else ""
+
+        def runs(self, stream: str) -> t.SequenceOf[m.TapOracleWms.StreamRunStats]:
+            """Return committed runs of ``stream``, oldest first."""
+            with self._lock:
+                return tuple(self._runs.get(stream, ()))
+
+        def estimate(self, stream: str) -> float | None:
+            """Return the median committed duration of ``stream``, if known."""
+            durations = [run.duration_seconds for run in self.runs(stream)]
+            return statistics.median(durations) if durations else None
+
+        def commit(self) -> None:
+            """Append this run's statistics to the store and persist it."""
+            finished_at = datetime.now(UTC).isoformat()
+            with self._lock:
+                for name, stats in self._current.items():
+                    history = self._runs.setdefault(name, [])
+                    history.append(
+                        stats.model_copy(update={"finished_at": finished_at})
+                    )
+                    del history[: -self._depth]
+                self._current = {}
+                payload = {
+                    "streams": {
+                        name: [run.model_dump(mode="json") for run in history]
+                        for name, history in self._runs.items()
+                    },
+                }
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            staging = self._path.with_name(f"{self._path.name}.tmp")
+            staging.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+            staging.replace(self._path)
+
+    class StreamScheduler:
+        """Dependency and longest-processing-time-first ordering of streams."""
+
+        @staticmethod
+        def longest_first(
+            names: t.StrSequence,
+            estimates: t.MappingKV[str, float | None],
+        ) -> t.StrSequence:
+            """Order streams by descending expected duration.
+
+            Streams without history come first, since they may be the long pole.
+
+            Args:
+                names: Stream names in discovery order.
+                estimates: Expected duration per stream, None when unknown.
+
+            Returns:
+                Stream names in scheduling order.
+
+            """
+            unknown = [name for name in names if estimates.get(name) is None]
+            known = sorted(
+                (name for name in names if estimates.get(name) is not None),
+                key=lambda name: -(estimates.get(name) or 0.0),
+            )
+            return [*unknown, *known]
+
+        @staticmethod
+        def parents_first(
+            names: t.StrSequence,
+            parents: t.StrMapping,
+        ) -> t.StrSequence:
+            """Order streams so every parent precedes its children.
+
+            Otherwise the input order is kept. Parents outside ``names`` are
+            ignored, and a cyclic parent chain is broken where it loops back.
+
+            Args:
+                names: Stream names in preferred order.
+                parents: Parent stream name per child stream name.
+
+            Returns:
+                Stream names in dependency order.
+
+            """
+            present = set(names)
+            ordered: list[str] = []
+            placed: set[str] = set()
+            visiting: set[str] = set()
+
+            def place(name: str) -> None:
+                if name in placed or name in visiting:
+                    return
+                visiting.add(name)
+                parent = parents.get(name)
+                if parent is not None and parent in present:
+                    place(parent)
+                visiting.discard(name)
+                placed.add(name)
+                ordered.append(name)
+
+            for name in names:
+                place(name)
+            return ordered
+
+        @classmethod
+        def pack(
+            cls,
+            names: t.StrSequence,
+            estimates: t.MappingKV[str, float | None],
+            slots: int,
+        ) -> t.SequenceOf[t.StrSequence]:
+            """Assign streams to slots with the LPT greedy rule.
+
+            Each stream, longest first, goes to the slot that frees up first,
+            which is how a worker pool fed in :meth:`longest_first` order runs.
+            Streams without history are costed as the longest known stream.
+
+            Args:
+                names: Stream names.
+                estimates: Expected duration per stream, None when unknown.
+                slots: Number of parallel slots.
+
+            Returns:
+                Stream names assigned to each slot, in start order.
+
+            """
+            known = [value for value in estimates.values() if value is not None]
+            fallback = max(known, default=0.0)
+            lanes: list[list[str]] = [[] for _ in range(max(slots, 1))]
+            loads = [(0.0, index) for index in range(len(lanes))]
+            for name in cls.longest_first(names, estimates):
+                load, index = heapq.heappop(loads)
+                lanes[index].append(name)
+                cost = estimates.get(name)
+                heapq.heappush(
+                    loads,
+                    (load + (fallback if cost is None else cost), index),
+                )
+            return lanes
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesScheduling"]
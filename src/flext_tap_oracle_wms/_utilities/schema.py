@@ -0,0 +1,220 @@
+"""Sample-based schema inference and schema drift detection.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+
+from flext_tap_oracle_wms import c, m, t
+
+
+class FlextTapOracleWmsUtilitiesSchema:
+    """Schema inference and drift mixin composed into ``u.TapOracleWms``."""
+
+    class SchemaInference:
+        """Infer Singer JSON schemas from sampled WMS records."""
+
+        @staticmethod
+        def json_type(value: t.JsonValue) -> str | None:
+            """Return the JSON schema type of a sampled value.
+
+            Args:
+                value: Sampled column value.
+
+            Returns:
+                JSON schema type name, or None for nulls.
+
+            """
+            if value is None:
+                return None
+            if isinstance(value, bool):
+                return c.TapOracleWms.SCHEMA_TYPE_BOOLEAN
+            if isinstance(value, int):
+                return c.TapOracleWms.SCHEMA_TYPE_INTEGER
+            if isinstance(value, float):
+                return "number"
+            return c.TapOracleWms.SCHEMA_TYPE_STRING
+
+        @staticmethod
+        def is_timestamp(value: t.JsonValue) -> bool:
+            """Return whether a sampled value is an ISO 8601 date and time.
+
+            Args:
+                value: Sampled column value.
+
+            Returns:
+                True for strings such as ``2025-01-01T10:00:00`` with an
+                optional fraction and offset; dates without a time are not
+                timestamps.
+
+            """
+            if not isinstance(value, str) or len(value) <= len("YYYY-MM-DD"):
+                return False
+            if value[len("YYYY-MM-DD")] not in {"T", " "}:
+                return False
+            try:
+                datetime.fromisoformat(value)
+            except ValueError:
+                return False
+            return True
+
+        @classmethod
+        def infer(cls, records: Iterable[t.JsonMapping]) -> t.JsonDict:
+            """Infer an object schema whose columns are all nullable.
+
+            Integer and number samples widen to number; any other mix of
+            types widens to string, which is how the stream normalizes them.
+            Columns that are null in every sample carry no type evidence and
+            get an unconstrained schema. String columns whose samples are all
+            ISO timestamps, such as ``mod_ts``, get ``format: date-time``.
+
+            Args:
+                records: Sampled records.
+
+            Returns:
+                Singer JSON schema with one property per sampled column.
+
+            """
+            column_types: dict[str, set[str]] = {}
+            not_timestamps: set[str] = set()
+            for record in records:
+                for column, value in record.items():
+                    seen = column_types.setdefault(column, set())
+                    json_type = cls.json_type(value)
+                    if json_type is not None:
+                        seen.add(json_type)
+                        if not cls.is_timestamp(value):
+                            not_timestamps.add(column)
+            properties: t.JsonDict = {}
+            for column, seen in column_types.items():
+                if not seen:
+                    properties[column] = {}
+                    continue
+                if seen == {c.TapOracleWms.SCHEMA_TYPE_INTEGER, "number"}:
+                    json_type = "number"
+                elif len(seen) == 1:
+                    json_type = next(iter(seen))
+                else:
+                    json_type = c.TapOracleWms.SCHEMA_TYPE_STRING
+                properties[column] = (
+                    {
+                        "type": ["null", json_type],
+                        "format": c.TapOracleWms.SCHEMA_FORMAT_DATE_TIME,
+                    }
+                    if column not in not_timestamps
+                    else {"type": ["null", json_type]}
+                )
+            return {
+                "type": c.TapOracleWms.SCHEMA_TYPE_OBJECT,
+                "properties": properties,
+            }
+
+    class SchemaDrift:
+        """Compare cached and live entity schemas column by column."""
+
+        @staticmethod
+        def column_types(schema: t.JsonMapping) -> t.StrMapping:
+            """Map each schema property to its non-null type signature.
+
+            Args:
+                schema: Singer JSON schema.
+
+            Returns:
+                Column name to sorted, ``|``-joined non-null type names; empty
+                for columns of unknown type.
+
+            """
+            properties = schema.get("properties")
+            if not isinstance(properties, Mapping):
+                return {}
+            signatures: t.MutableStrMapping = {}
+            for column, definition in properties.items():
+                raw_type = (
+                    definition.get("type") if isinstance(definition, Mapping) else None
+                )
+                names = [raw_type] if isinstance(raw_type, str) else raw_type
+                signatures[column] = (
+                    "|".join(sorted(str(n) for n in names if n != "null"))
+                    if isinstance(names, list)
+                    else ""
+                )
+            return signatures
+
+        @classmethod
+        def diff(
+            cls,
+            entity: str,
+            cached: t.JsonMapping,
+            live: t.JsonMapping,
+        ) -> m.TapOracleWms.SchemaDrift:
+            """Report added, removed and retyped columns of an entity.
+
+            A live schema without properties (for example an empty sample)
+            carries no evidence and is reported as no drift; neither is a
+            column whose type is unknown on either side.
+
+            Args:
+                entity: Entity name.
+                cached: Schema from the catalog cache.
+                live: Freshly described schema.
+
+            Returns:
+                Drift report for the entity.
+
+            """
+            cached_types = cls.column_types(cached)
+            live_types = cls.column_types(live)
+            if not live_types:
+                return m.TapOracleWms.SchemaDrift(entity=entity)
+            return m.TapOracleWms.SchemaDrift(
+                entity=entity,
+                added=tuple(sorted(live_types.keys() - cached_types.keys())),
+                removed=tuple(sorted(cached_types.keys() - live_types.keys())),
+                retyped=tuple(
+                    (column, cached_types[column], live_types[column])
+                    for column in sorted(cached_types.keys() & live_types.keys())
+                    if cached_types[column]
+                    and live_types[column]
+                    and cached_types[column] != live_types[column]
+                ),
+            )
+
+        @classmethod
+        def merge(cls, cached: t.JsonMapping, live: t.JsonMapping) -> t.JsonDict:
+            """Return ``live`` with cached definitions for its untyped columns.
+
+            Args:
+                cached: Schema from the catalog cache.
+                live: Freshly described schema.
+
+            Returns:
+                The live schema, keeping the cached type of every column the
+                live sample only saw as null.
+
+            """
+            cached_properties = cached.get("properties")
+            live_properties = live.get("properties")
+            if not isinstance(cached_properties, Mapping) or not isinstance(
+                live_properties,
+                Mapping,
+            ):
+                return dict(live)
+            live_types = cls.column_types(live)
+            return {
+                **live,
+                "properties": {
+                    column: (
+                        cached_properties[column]
+                        if not live_types[column] and column in cached_properties
+                        else definition
+                    )
+                    for column, definition in live_properties.items()
+                },
+            }
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesSchema"]
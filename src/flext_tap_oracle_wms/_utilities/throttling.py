@@ -0,0 +1,144 @@
+"""Token-bucket request throttling shared by threads and host processes.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import threading
+import time
+from pathlib import Path
+
+from flext_tap_oracle_wms import c
+
+
+class FlextTapOracleWmsUtilitiesThrottling:
+    """Throttling mixin composed into ``u.TapOracleWms``."""
+
+    class TokenBucket:
+        """Thread-safe token bucket refilled at a constant rate.
+
+        Up to ``capacity`` requests may burst; sustained throughput is
+        ``rate_per_second``.
+        """
+
+        def __init__(self, rate_per_second: float, capacity: float) -> None:
+            """Create a full bucket."""
+            if rate_per_second <= 0 or capacity < 1:
+                msg = "Token bucket needs a positive rate and capacity >= 1"
+                raise ValueError(msg)
+            self.rate_per_second = rate_per_second
+            self.capacity = capacity
+            self._tokens = capacity
+            self._updated = time.monotonic()
+            self._lock = threading.Lock()
+
+        @classmethod
+        def per_minute(
+            cls,
+            requests_per_minute: int,
+            burst: int,
+        ) -> FlextTapOracleWmsUtilitiesThrottling.TokenBucket:
+            """Build a bucket from a per-minute quota."""
+            return cls(
+                requests_per_minute / c.TapOracleWms.Throttling.SECONDS_PER_MINUTE,
+                burst,
+            )
+
+        def try_acquire(self, tokens: float = 1.0) -> float:
+            """Take ``tokens`` if available; otherwise return seconds to wait."""
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated) * self.rate_per_second,
+                )
+                self._updated = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return 0.0
+                return (tokens - self._tokens) / self.rate_per_second
+
+        def acquire(self, tokens: float = 1.0) -> float:
+            """Block until ``tokens`` are taken; return the seconds waited."""
+            waited = 0.0
+            while (delay := self.try_acquire(tokens)) > 0:
+                time.sleep(delay)
+                waited += delay
+            return waited
+
+    class FileTokenBucket(TokenBucket):
+        """Token bucket whose state lives in a file shared by host processes.
+
+        Every process opening the same ``path`` draws from one bucket; an
+        exclusive ``flock`` serializes refills, and wall-clock time is used so
+        all processes agree on elapsed time. ``flock`` needs the POSIX
+        ``fcntl`` module; see :meth:`supported`.
+        """
+
+        def __init__(
+            self,
+            path: Path,
+            rate_per_second: float,
+            capacity: float,
+        ) -> None:
+            """Attach to the bucket at ``path``, creating it full if missing."""
+            super().__init__(rate_per_second, capacity)
+            self.path = path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.touch(exist_ok=True)
+
+        @staticmethod
+        def supported() -> bool:
+            """Return whether this platform can lock a shared bucket file."""
+            return importlib.util.find_spec("fcntl") is not None
+
+        @classmethod
+        def shared_per_minute(
+            cls,
+            path: Path,
+            requests_per_minute: int,
+            burst: int,
+        ) -> FlextTapOracleWmsUtilitiesThrottling.FileTokenBucket:
+            """Build a shared bucket from a per-minute quota."""
+            return cls(
+                path,
+                requests_per_minute / c.TapOracleWms.Throttling.SECONDS_PER_MINUTE,
+                burst,
+            )
+
+        def try_acquire(self, tokens: float = 1.0) -> float:
+            """Take ``tokens`` from the shared bucket, or return seconds to wait."""
+            fcntl = importlib.import_module("fcntl")
+            with self._lock, self.path.open("r+", encoding="utf-8") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    now = time.time()
+                    try:
+                        state = json.loads(handle.read() or "{}")
+                        available = float(state["tokens"])
+                        updated = float(state["updated"])
+                    except (ValueError, KeyError, TypeError):
+                        available, updated = self.capacity, now
+                    available = min(
+                        self.capacity,
+                        available + max(now - updated, 0.0) * self.rate_per_second,
+                    )
+                    delay = 0.0
+                    if available >= tokens:
+                        available -= tokens
+                    else:
+                        delay = (tokens - available) / self.rate_per_second
+                    handle.seek(0)
+                    handle.truncate()
+                    handle.write(json.dumps({"tokens": available, "updated": now}))
+                    handle.flush()
+                    return delay
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+__all__: list[str] = ["FlextTapOracleWmsUtilitiesThrottling"]
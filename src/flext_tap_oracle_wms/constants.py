@@ -40,6 +40,7 @@ class FlextTapOracleWmsConstants(FlextMeltanoConstants, FlextOracleWmsConstants)
         SCHEMA_TYPE_OBJECT: Final[str] = "object"
         SCHEMA_TYPE_BOOLEAN: Final[str] = "boolean"
         SCHEMA_TYPE_INTEGER: Final[str] = "integer"
+        SCHEMA_FORMAT_DATE_TIME: Final[str] = "date-time"
 
         class Authentication(
             FlextOracleWmsConstants.OracleWms.Authentication,
@@ -49,6 +50,93 @@ class FlextTapOracleWmsConstants(FlextMeltanoConstants, FlextOracleWmsConstants)
         class Extraction:
             """WMS-specific extraction configuration."""
 
+        class CircuitBreaker:
+            """WMS circuit breaker constants."""
+
+            STATE_CLOSED: Final[str] = "closed"
+            STATE_OPEN: Final[str] = "open"
+            STATE_HALF_OPEN: Final[str] = "half_open"
+            DEFAULT_FAILURE_THRESHOLD: Final[int] = 5
+            DEFAULT_RECOVERY_TIMEOUT: Final[float] = 60.0
+
+        class Checkpoint:
+            """Resumable page checkpoint constants."""
+
+            STATE_KEY: Final[str] = "wms_checkpoint"
+
+        class Concurrency:
+            """Adaptive page request concurrency constants."""
+
+            DECREASE_FACTOR: Final[float] = 0.5
+            LATENCY_SPIKE_RATIO: Final[float] = 2.0
+            LATENCY_EWMA_WEIGHT: Final[float] = 0.2
+            OVERLOAD_STATUS_RE: ClassVar[t.RegexPattern] = re.compile(
+                r"\b(?:429|503)\b",
+            )
+            RETRY_AFTER_RE: ClassVar[t.RegexPattern] = re.compile(
+                r"retry[-_ ]after\W*(\d+(?:\.\d+)?)",
+                re.IGNORECASE,
+            )
+
+        class Archive:
+            """WMS response record and replay constants."""
+
+            MODE_RECORD: Final[str] = "record"
+            MODE_REPLAY: Final[str] = "replay"
+            MODES: Final[frozenset[str]] = frozenset({MODE_RECORD, MODE_REPLAY})
+            OPERATION_ENTITY_DATA: Final[str] = "get_entity_data"
+            OPERATION_DISCOVER: Final[str] = "discover_entities"
+
+        class Deletion:
+            """Key snapshot delete detection constants."""
+
+            DELETED_AT_COLUMN: Final[str] = "_sdc_deleted_at"
+            KEY_FIELD: Final[str] = "id"
+            KEY_TYPECODE: Final[str] = "q"
+            SNAPSHOT_SUFFIX: Final[str] = ".keys"
+            SECONDS_PER_HOUR: Final[float] = 3600.0
+
+        class Hedging:
+            """Hedged page request constants."""
+
+            MAX_PERCENTILE: Final[float] = 100.0
+            MIN_SAMPLES: Final[int] = 20
+            LATENCY_WINDOW: Final[int] = 200
+            MAX_IN_FLIGHT: Final[int] = 2
+
+        class Replication:
+            """Replication method and WMS filter constants."""
+
+            METHOD_INCREMENTAL: Final[str] = "INCREMENTAL"
+            METHOD_FULL_TABLE: Final[str] = "FULL_TABLE"
+            LOWER_BOUND_FILTER_SUFFIX: Final[str] = "__gte"
+            UPPER_BOUND_FILTER_SUFFIX: Final[str] = "__lt"
+            IN_FILTER_SUFFIX: Final[str] = "__in"
+            DEFAULT_PARENT_KEY: Final[str] = "id"
+            ORDERING_PARAM: Final[str] = "ordering"
+            DESCENDING_PREFIX: Final[str] = "-"
+            FIELDS_PARAM: Final[str] = "fields"
+            FIELD_TRAVERSAL_SEPARATOR: Final[str] = "__"
+            SYNTHETIC_COLUMN_PREFIX: Final[str] = "_sdc_"
+
+        class Retry:
+            """Page request retry constants."""
+
+            MAX_DELAY_SECONDS: Final[float] = 60.0
+            NON_RETRYABLE_STATUS_RE: ClassVar[t.RegexPattern] = re.compile(
+                r"\b(?:400|401|403|404|422)\b",
+            )
+
+        class Scheduling:
+            """Run history and stream scheduling constants."""
+
+            RUN_HISTORY_DEPTH: Final[int] = 10
+
+        class Throttling:
+            """Request rate limiting constants."""
+
+            SECONDS_PER_MINUTE: Final[float] = 60.0
+
         class Settings:
             """Configuration constants for tap settings."""
 
@@ -61,16 +149,35 @@ class FlextTapOracleWmsConstants(FlextMeltanoConstants, FlextOracleWmsConstants)
             TAP_DEFAULT_PAGE_SIZE: Final[int] = 10
             DEFAULT_DISCOVERY_SAMPLE_SIZE: Final[int] = 100
             DEFAULT_MAX_PARALLEL_STREAMS: Final[int] = 5
+            DEFAULT_RECORD_PROCESSING_WORKERS: Final[int] = 0
             DEFAULT_FLATTENING_DEPTH: Final[int] = 10
             DEFAULT_VERIFY_SSL: Final[bool] = True
             DEFAULT_ENABLE_PARALLEL_EXTRACTION: Final[bool] = False
-            DEFAULT_ENABLE_RATE_LIMITING: Final[bool] = True
+            DEFAULT_ENABLE_RATE_LIMITING: Final[bool] = False
             DEFAULT_MAX_REQUESTS_PER_MINUTE: Final[int] = 60
+            DEFAULT_RATE_LIMIT_BURST: Final[int] = 5
+            DEFAULT_MAX_CONCURRENT_PAGE_REQUESTS: Final[int] = 1
+            DEFAULT_CHECKPOINT_INTERVAL_PAGES: Final[int] = 0
+            DEFAULT_ENABLE_INCREMENTAL: Final[bool] = False
+            DEFAULT_SNAPSHOT_MODE: Final[bool] = False
+            DEFAULT_SKIP_UNCHANGED_STREAMS: Final[bool] = False
+            DEFAULT_RESPONSE_CACHE_TTL_SECONDS: Final[int] = 3600
+            DEFAULT_WMS_ARCHIVE_MODE: Final[str] = "record"
+            DEFAULT_WMS_ARCHIVE_REPLAY_TIMING: Final[bool] = False
+            DEFAULT_DELETE_DETECTION_INTERVAL_HOURS: Final[int] = 24
+            DEFAULT_DELETE_DETECTION_PAGE_SIZE: Final[int] = 1000
+            DEFAULT_REPLICATION_KEY: Final[str] = "mod_ts"
+            DEFAULT_REPLICATION_LOOKBACK_MINUTES: Final[int] = 0
+            DEFAULT_MAX_IN_FILTER_LENGTH: Final[int] = 1500
+            DEFAULT_ENABLE_REQUEST_HEDGING: Final[bool] = False
+            DEFAULT_HEDGE_LATENCY_PERCENTILE: Final[float] = 95.0
+            DEFAULT_HEDGE_BUDGET_PERCENT: Final[float] = 5.0
             DEFAULT_ENABLE_SCHEMA_FLATTENING: Final[bool] = True
             DEFAULT_LOG_LEVEL: Final[str] = "INFO"
             DEFAULT_ENABLE_REQUEST_LOGGING: Final[bool] = False
             DEFAULT_VALIDATE_CONFIG: Final[bool] = True
             DEFAULT_VALIDATE_SCHEMAS: Final[bool] = True
+            DEFAULT_CHECK_SCHEMA_DRIFT: Final[bool] = False
             ISO_DATE_PATTERN: Final[str] = (
                 r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})$"
             )
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from flext_meltano import FlextMeltanoModels
 from flext_oracle_wms import FlextOracleWmsModels
+from flext_tap_oracle_wms import c
 
 
 class FlextTapOracleWmsModels(FlextMeltanoModels, FlextOracleWmsModels):
@@ -17,7 +18,76 @@ class FlextTapOracleWmsModels(FlextMeltanoModels, FlextOracleWmsModels):
         serialization at the Singer dict boundary.
         """
 
-        pass
+        class ChildEntity(FlextMeltanoModels.BaseModel):
+            """Detail entity extracted by the keys of its changed parents."""
+
+            parent: str
+            foreign_key: str
+            parent_key: str = c.TapOracleWms.Replication.DEFAULT_PARENT_KEY
+
+        class CircuitBreakerSettings(FlextMeltanoModels.BaseModel):
+            """``circuit_breaker`` configuration block."""
+
+            enabled: bool = False
+            failure_threshold: int = (
+                c.TapOracleWms.CircuitBreaker.DEFAULT_FAILURE_THRESHOLD
+            )
+            recovery_timeout: float = (
+                c.TapOracleWms.CircuitBreaker.DEFAULT_RECOVERY_TIMEOUT
+            )
+
+        class PageCheckpoint(FlextMeltanoModels.BaseModel):
+            """Resume position of an interrupted stream kept in Singer state."""
+
+            page: int = 1
+            upper_bound: str = ""
+
+        class PageRequest(FlextMeltanoModels.BaseModel):
+            """What a page request asks for instead of the stream's next rows."""
+
+            key_pass: bool = False
+            """Request only primary keys, for delete detection."""
+            probe_column: str | None = None
+            """Request the latest value of this column, for change probes."""
+            key_batch: tuple[str, str] | None = None
+            """``(in_filter, keys)`` restricting a child entity to parent keys."""
+            checkpointed: bool = False
+            """Rows are paged for resumable page checkpoints."""
+            hedge: bool = False
+            """The request duplicates a slow page request."""
+
+        class SchemaDrift(FlextMeltanoModels.BaseModel):
+            """Column-level differences between a cached and a live entity schema."""
+
+            entity: str
+            added: tuple[str, ...] = ()
+            removed: tuple[str, ...] = ()
+            retyped: tuple[tuple[str, str, str], ...] = ()
+            """``(column, cached_type, live_type)`` triples."""
+
+            @property
+            def drifted(self) -> bool:
+                """Whether any column was added, removed or retyped."""
+                return bool(self.added or self.removed or self.retyped)
+
+        class StreamRunStats(FlextMeltanoModels.BaseModel):
+            """Extraction statistics of one stream in one tap run."""
+
+            stream: str
+            duration_seconds: float = 0.0
+            records: int = 0
+            byte_count: int = 0
+            probe: str = ""
+            finished_at: str = ""
+
+        class ConcurrencyMetrics(FlextMeltanoModels.BaseModel):
+            """In-flight page request metrics of the adaptive limiter."""
+
+            limit: int
+            max_limit: int
+            in_flight: int
+            max_in_flight: int
+            overloads: int
 
 
 m = FlextTapOracleWmsModels
@@ -12,12 +12,15 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import Executor
+from contextlib import AbstractContextManager
 from typing import Protocol, runtime_checkable
 
 from flext_meltano import p as meltano_p
 from flext_oracle_wms import FlextOracleWmsProtocols
 from flext_oracle_wms.utilities import FlextOracleWmsUtilities
-from flext_tap_oracle_wms import t
+from flext_tap_oracle_wms import m, t
 
 
 class FlextTapOracleWmsProtocols(meltano_p, FlextOracleWmsProtocols):
@@ -41,6 +44,218 @@ class FlextTapOracleWmsProtocols(meltano_p, FlextOracleWmsProtocols):
 
                 settings: t.JsonMapping
 
+            @runtime_checkable
+            class TapWithMessageLock(Protocol):
+                """Protocol for tap instances that serialize Singer output."""
+
+                message_lock: AbstractContextManager[bool]
+
+            @runtime_checkable
+            class TapWithRunStart(Protocol):
+                """Protocol for tap instances sharing one run-start timestamp."""
+
+                run_started_at: str
+
+            @runtime_checkable
+            class ParentKeyRegistry(Protocol):
+                """Protocol for registries of parent keys emitted in a run."""
+
+                def start(self, parent: str, field: str) -> None:
+                    """Mark a parent entity as extracted in this run."""
+                    ...
+
+                def add(self, parent: str, field: str, key: str) -> None:
+                    """Record one emitted parent key."""
+                    ...
+
+                def finish(self, parent: str, field: str) -> None:
+                    """Mark the keys of a parent as complete."""
+                    ...
+
+                def collected(
+                    self,
+                    parent: str,
+                    field: str,
+                ) -> frozenset[str] | None:
+                    """Return the keys of a parent, or None until it finished."""
+                    ...
+
+            @runtime_checkable
+            class TapWithParentKeys(Protocol):
+                """Protocol for tap instances sharing a parent key registry."""
+
+                parent_keys: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.ParentKeyRegistry
+                )
+
+            @runtime_checkable
+            class ResponseArchive(Protocol):
+                """Protocol for archives recording or replaying WMS responses."""
+
+                def exchange[T](
+                    self,
+                    operation: str,
+                    params: t.JsonMapping,
+                    request: Callable[[], meltano_p.Result[t.SequenceOf[T]]],
+                    decode: Callable[[t.JsonValue], T],
+                ) -> meltano_p.Result[t.SequenceOf[T]]:
+                    """Answer a request from the archive, or perform and record it."""
+                    ...
+
+            @runtime_checkable
+            class TapWithWmsArchive(Protocol):
+                """Protocol for tap instances recording or replaying WMS responses."""
+
+                wms_archive: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.ResponseArchive
+                    | None
+                )
+
+            @runtime_checkable
+            class ResponseStore(Protocol):
+                """Protocol for caches of WMS record pages."""
+
+                def get(
+                    self,
+                    key: str,
+                    validator: str | None = None,
+                ) -> t.SequenceOf[t.JsonMapping] | None:
+                    """Return valid cached records, or None."""
+                    ...
+
+                def put(
+                    self,
+                    key: str,
+                    records: t.SequenceOf[t.JsonMapping],
+                    validator: str | None = None,
+                ) -> None:
+                    """Store records under a request key."""
+                    ...
+
+            @runtime_checkable
+            class TapWithResponseCache(Protocol):
+                """Protocol for tap instances sharing an on-disk response cache."""
+
+                response_cache: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.ResponseStore
+                    | None
+                )
+
+            @runtime_checkable
+            class StreamRunRecorder(Protocol):
+                """Protocol for stores accumulating per-stream run statistics."""
+
+                def add(
+                    self,
+                    stream: str,
+                    *,
+                    duration_seconds: float,
+                    records: int,
+                    byte_count: int,
+                ) -> None:
+                    """Accumulate statistics of one stream extraction."""
+                    ...
+
+                def record_probe(self, stream: str, probe: str) -> None:
+                    """Keep the change probe of one stream for the next run."""
+                    ...
+
+                def last_probe(self, stream: str) -> str:
+                    """Return the change probe stored by the last run."""
+                    ...
+
+            @runtime_checkable
+            class TapWithRunHistory(Protocol):
+                """Protocol for tap instances recording per-stream run history."""
+
+                run_history: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.StreamRunRecorder
+                    | None
+                )
+
+            @runtime_checkable
+            class RequestGate(Protocol):
+                """Protocol for limiters admitting one WMS request at a time."""
+
+                def acquire(self, tokens: float = 1.0) -> float:
+                    """Block until the request may proceed; return seconds waited."""
+                    ...
+
+            @runtime_checkable
+            class TapWithRateLimiter(Protocol):
+                """Protocol for tap instances sharing a request rate limiter."""
+
+                rate_limiter: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.RequestGate | None
+                )
+
+            @runtime_checkable
+            class CircuitGate(Protocol):
+                """Protocol for circuit breakers guarding WMS requests."""
+
+                def admit(self) -> float:
+                    """Return 0.0 to admit a request, else seconds to wait."""
+                    ...
+
+                def record(self, *, success: bool) -> None:
+                    """Record the outcome of an admitted request."""
+                    ...
+
+                def release(self) -> None:
+                    """End an admitted request whose outcome was not recorded."""
+                    ...
+
+                def open_error(self, open_for: float) -> str:
+                    """Return the failure message of a rejected request."""
+                    ...
+
+            @runtime_checkable
+            class TapWithCircuitBreaker(Protocol):
+                """Protocol for tap instances sharing a WMS circuit breaker."""
+
+                circuit_breaker: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.CircuitGate | None
+                )
+
+            @runtime_checkable
+            class ConcurrencyLimiter(Protocol):
+                """Protocol for limiters adapting in-flight page requests."""
+
+                max_limit: int
+
+                def acquire(self) -> None:
+                    """Block until a request slot is free."""
+                    ...
+
+                def release(
+                    self,
+                    latency_seconds: float,
+                    *,
+                    overloaded: bool = False,
+                    retry_after: float | None = None,
+                ) -> None:
+                    """Free a slot and adapt to the request outcome."""
+                    ...
+
+                def metrics(self) -> m.TapOracleWms.ConcurrencyMetrics:
+                    """Snapshot of the current and peak in-flight requests."""
+                    ...
+
+            @runtime_checkable
+            class TapWithPageConcurrency(Protocol):
+                """Protocol for tap instances sharing a page concurrency limiter."""
+
+                page_concurrency: (
+                    FlextTapOracleWmsProtocols.TapOracleWms.OracleWms.ConcurrencyLimiter
+                    | None
+                )
+
+            @runtime_checkable
+            class TapWithRecordProcessor(Protocol):
+                """Protocol for tap instances that may normalize pages off-process."""
+
+                record_processor: Executor | None
+
 
 p = FlextTapOracleWmsProtocols
 __all__: list[str] = ["FlextTapOracleWmsProtocols", "p"]
@@ -91,6 +91,128 @@ class FlextTapOracleWmsSettings(FlextSettingsBase):
         t.StrSequence,
         u.Field(description="Entities to exclude."),
     ] = u.Field(default_factory=list)
+    enable_incremental: Annotated[
+        bool,
+        u.Field(
+            description=(
+                "Replicate timestamped entities incrementally on replication_key."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_ENABLE_INCREMENTAL
+    replication_key: Annotated[
+        str,
+        u.Field(
+            min_length=1,
+            description="Timestamp column bookmarked by incremental streams.",
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_REPLICATION_KEY
+    replication_lookback_minutes: Annotated[
+        int,
+        u.Field(
+            ge=0,
+            description=(
+                "Minutes re-read before the bookmark to catch late-committed rows."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_REPLICATION_LOOKBACK_MINUTES
+    snapshot_mode: Annotated[
+        bool,
+        u.Field(
+            description=(
+                "Bound every stream, full-table ones included, by the run "
+                "start on replication_key for a consistent snapshot."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_SNAPSHOT_MODE
+    skip_unchanged_streams: Annotated[
+        bool,
+        u.Field(
+            description=(
+                "Probe full-table streams for their latest replication_key and "
+                "id and skip them when both match the last run's history."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_SKIP_UNCHANGED_STREAMS
+    response_cache_path: Annotated[
+        str | None,
+        u.Field(
+            description=(
+                "Directory caching full-table pages and discovery samples "
+                "across runs and tap processes on one host."
+            ),
+        ),
+    ] = None
+    response_cache_ttl_seconds: Annotated[
+        int,
+        u.Field(
+            ge=0,
+            description=(
+                "Lifetime of cached responses that no change probe can revalidate."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_RESPONSE_CACHE_TTL_SECONDS
+    wms_archive_path: Annotated[
+        str | None,
+        u.Field(
+            description=(
+                "Gzip archive of raw WMS responses written in record mode and "
+                "read instead of the WMS in replay mode."
+            ),
+        ),
+    ] = None
+    wms_archive_mode: Annotated[
+        str,
+        u.Field(description="Archive mode: record or replay."),
+    ] = c.TapOracleWms.Settings.DEFAULT_WMS_ARCHIVE_MODE
+    wms_archive_replay_timing: Annotated[
+        bool,
+        u.Field(description="Sleep the recorded response time when replaying."),
+    ] = c.TapOracleWms.Settings.DEFAULT_WMS_ARCHIVE_REPLAY_TIMING
+    delete_detection_path: Annotated[
+        str | None,
+        u.Field(
+            description=(
+                "Directory of per-entity key snapshots; enables delete "
+                "detection for incremental streams."
+            ),
+        ),
+    ] = None
+    delete_detection_interval_hours: Annotated[
+        int,
+        u.Field(
+            ge=0,
+            description="Minimum hours between key passes of one entity.",
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_DELETE_DETECTION_INTERVAL_HOURS
+    delete_detection_page_size: Annotated[
+        int,
+        u.Field(ge=1, description="Page size of key-only delete detection passes."),
+    ] = c.TapOracleWms.Settings.DEFAULT_DELETE_DETECTION_PAGE_SIZE
+    child_entities: Annotated[
+        t.MappingKV[str, m.TapOracleWms.ChildEntity],
+        u.Field(
+            description=(
+                "Detail entities fetched only for parent records emitted in "
+                "the same run, keyed by child entity name."
+            ),
+        ),
+    ] = u.Field(default_factory=dict)
+    max_in_filter_length: Annotated[
+        int,
+        u.Field(
+            ge=1,
+            description="Maximum URL-encoded length of one parent key filter.",
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_MAX_IN_FILTER_LENGTH
+    related_fields: Annotated[
+        t.MappingKV[str, t.StrSequence],
+        u.Field(
+            description=(
+                "Foreign key traversals such as item_id__code fetched with "
+                "each stream's records, keyed by stream name."
+            ),
+        ),
+    ] = u.Field(default_factory=dict)
     start_date: Annotated[
         str | None,
         u.Field(description="Start date for incremental extraction."),
@@ -107,6 +229,24 @@ class FlextTapOracleWmsSettings(FlextSettingsBase):
         t.StrSequence,
         u.Field(description="Columns to ignore during extraction."),
     ] = u.Field(default_factory=list)
+    catalog_cache_path: Annotated[
+        str | None,
+        u.Field(
+            description=(
+                "Catalog cache file; when set, discovered entity schemas are "
+                "described once and reused across runs."
+            ),
+        ),
+    ] = None
+    check_schema_drift: Annotated[
+        bool,
+        u.Field(
+            description=(
+                "Compare cached schemas with a fresh describe before each run "
+                "and refresh only drifted entities."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_CHECK_SCHEMA_DRIFT
     enable_parallel_extraction: Annotated[
         bool,
         u.Field(description="Enable parallel stream extraction."),
@@ -118,6 +258,26 @@ class FlextTapOracleWmsSettings(FlextSettingsBase):
             description="Maximum parallel streams.",
         ),
     ] = c.TapOracleWms.Settings.DEFAULT_MAX_PARALLEL_STREAMS
+    run_history_path: Annotated[
+        str | None,
+        u.Field(
+            description=(
+                "Local run history store; when set, per-stream durations, rows "
+                "and bytes are recorded and parallel runs start the longest "
+                "streams first."
+            ),
+        ),
+    ] = None
+    record_processing_workers: Annotated[
+        int,
+        u.Field(
+            ge=0,
+            description=(
+                "Worker processes normalizing record pages; 0 keeps "
+                "normalization in the extraction process."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_RECORD_PROCESSING_WORKERS
     enable_rate_limiting: Annotated[
         bool,
         u.Field(description="Enable API rate limiting."),
@@ -126,6 +286,72 @@ class FlextTapOracleWmsSettings(FlextSettingsBase):
         int,
         u.Field(ge=1, description="Maximum API requests per minute."),
     ] = c.TapOracleWms.Settings.DEFAULT_MAX_REQUESTS_PER_MINUTE
+    max_concurrent_page_requests: Annotated[
+        int,
+        u.Field(
+            ge=1,
+            description=(
+                "Upper bound of adaptive in-flight page requests; 1 fetches "
+                "pages sequentially."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_MAX_CONCURRENT_PAGE_REQUESTS
+    enable_request_hedging: Annotated[
+        bool,
+        u.Field(
+            description=(
+                "Duplicate page requests slower than hedge_latency_percentile "
+                "during concurrent page fetching."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_ENABLE_REQUEST_HEDGING
+    hedge_latency_percentile: Annotated[
+        float,
+        u.Field(
+            gt=0,
+            lt=100,
+            description="Page latency percentile past which a request is hedged.",
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_HEDGE_LATENCY_PERCENTILE
+    hedge_budget_percent: Annotated[
+        float,
+        u.Field(
+            ge=0,
+            le=100,
+            description="Maximum hedged requests as a percent of page requests.",
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_HEDGE_BUDGET_PERCENT
+    checkpoint_interval_pages: Annotated[
+        int,
+        u.Field(
+            ge=0,
+            description=(
+                "Pages between resumable checkpoints written to Singer state; "
+                "0 disables checkpoints."
+            ),
+        ),
+    ] = c.TapOracleWms.Settings.DEFAULT_CHECKPOINT_INTERVAL_PAGES
+    circuit_breaker: Annotated[
+        m.TapOracleWms.CircuitBreakerSettings,
+        u.Field(
+            description=(
+                "Circuit breaker shared by all WMS requests: failure_threshold "
+                "consecutive failures open it for recovery_timeout seconds."
+            ),
+        ),
+    ] = u.Field(default_factory=m.TapOracleWms.CircuitBreakerSettings)
+    rate_limit_burst: Annotated[
+        int,
+        u.Field(ge=1, description="Requests allowed in a burst above the rate."),
+    ] = c.TapOracleWms.Settings.DEFAULT_RATE_LIMIT_BURST
+    rate_limit_state_path: Annotated[
+        str | None,
+        u.Field(
+            description=(
+                "File holding a rate limit bucket shared by tap processes on this host."
+            ),
+        ),
+    ] = None
     enable_schema_flattening: Annotated[
         bool,
         u.Field(description="Enable schema flattening."),
@@ -170,6 +396,43 @@ class FlextTapOracleWmsSettings(FlextSettingsBase):
             raise ValueError(msg)
         return v
 
+    @u.field_validator("circuit_breaker")
+    @classmethod
+    def _check_circuit_breaker(
+        cls,
+        v: m.TapOracleWms.CircuitBreakerSettings,
+    ) -> m.TapOracleWms.CircuitBreakerSettings:
+        if v.failure_threshold < 1 or v.recovery_timeout < 0:
+            msg = (
+                "circuit_breaker needs failure_threshold >= 1 and recovery_timeout >= 0"
+            )
+            raise ValueError(msg)
+        return v
+
+    @u.field_validator("related_fields")
+    @classmethod
+    def _check_related_fields(
+        cls,
+        v: t.MappingKV[str, t.StrSequence],
+    ) -> t.MappingKV[str, t.StrSequence]:
+        separator = c.TapOracleWms.Replication.FIELD_TRAVERSAL_SEPARATOR
+        for stream, fields in v.items():
+            invalid = [
+                field for field in fields if separator not in field.strip(separator)
+            ]
+            if invalid:
+                msg = f"related_fields for {stream} are not traversals: {invalid}"
+                raise ValueError(msg)
+        return v
+
+    @u.field_validator("wms_archive_mode")
+    @classmethod
+    def _check_wms_archive_mode(cls, v: str) -> str:
+        if v not in c.TapOracleWms.Archive.MODES:
+            msg = f"wms_archive_mode must be one of {sorted(c.TapOracleWms.Archive.MODES)}"
+            raise ValueError(msg)
+        return v
+
     @u.field_validator("start_date", "end_date")
     @classmethod
     def _check_iso_date(cls, v: str | None) -> str | None:
@@ -7,7 +7,21 @@ SPDX-License-Identifier: MIT
 
 from __future__ import annotations
 
+import json
+import time
+from collections import deque
+from collections.abc import Callable, Mapping
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import AbstractContextManager, nullcontext
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
+from types import MappingProxyType
 from typing import ClassVar, override
 
 from flext_oracle_wms.utilities import FlextOracleWmsUtilities
@@ -16,6 +30,9 @@ from flext_tap_oracle_wms.errors import FlextTapOracleWmsError
 
 logger = u.fetch_logger(__name__)
 
+_EMPTY_SETTINGS: t.JsonMapping = MappingProxyType({})
+_ROW_PAGES = m.TapOracleWms.PageRequest()
+
 
 class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
     """Dynamic stream for Oracle WMS entities.
@@ -39,8 +56,14 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
         name: str | None = None,
         schema: t.JsonMapping | None = None,
         _path: str | None = None,
+        replication_key: str | None = None,
+        primary_keys: t.StrSequence | None = None,
+        client: FlextOracleWmsUtilities.OracleWms.Client | None = None,
     ) -> None:
-        """Initialize stream."""
+        """Initialize stream, incremental on ``replication_key`` when given.
+
+        ``client`` replaces the tap's WMS client for this stream's requests.
+        """
         schema_dict: t.JsonDict | None = (
             t.json_dict_adapter().validate_python(schema)
             if schema is not None
@@ -53,11 +76,25 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
             schema=schema_dict,
         )
         self._typed_schema: t.JsonDict | None = schema_dict
-        self._client: FlextOracleWmsUtilities.OracleWms.Client | None = None
+        if replication_key:
+            self.stream_replication_key = replication_key
+            self.replication_key = replication_key
+        if primary_keys:
+            self.primary_keys = list(primary_keys)
+        self._client: FlextOracleWmsUtilities.OracleWms.Client | None = client
+        self._record_plan_source: t.JsonMapping | None = None
+        self._record_plan: tuple[t.StrMapping, t.StrSequence] = ({}, ())
+        self._snapshot_upper_bound: str | None = None
+        self._cache_validator: str | None = None
+        self._hedging_source: t.JsonMapping | None = None
+        self._hedging: u.TapOracleWms.HedgePolicy | None = None
         tap_instance = self._tap
-        settings_map: t.JsonMapping = {}
-        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithWmsClientSettings):
-            settings_map = tap_instance.settings
+        self._message_lock: AbstractContextManager[bool] = (
+            tap_instance.message_lock
+            if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithMessageLock)
+            else nullcontext(True)
+        )
+        settings_map = self._settings_map()
         page_size_raw = settings_map.get("page_size", 100)
         page_size = (
             int(page_size_raw) if isinstance(page_size_raw, (int, float, str)) else 100
@@ -143,29 +180,805 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
         self,
         context: t.ScalarMapping | None,
     ) -> t.IterableOf[t.JsonDict]:
-        """Get records from Oracle WMS."""
-        page = 1
+        """Get records from Oracle WMS.
+
+        With ``checkpoint_interval_pages`` set, extraction resumes from the
+        page checkpoint left in state by an interrupted run.
+        """
+        try:
+            yield from self._extract_rows(context)
+        except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
+            msg = f"Error getting records for {self.name}: {exc}"
+            logger.exception(msg)
+            raise FlextTapOracleWmsError(msg) from exc
+
+    def _extract_rows(
+        self,
+        context: t.ScalarMapping | None,
+    ) -> t.IterableOf[t.JsonDict]:
+        """Chain page fetching, normalization, checkpoints and run statistics.
+
+        Full-table streams whose change probe matches the last run are
+        skipped when ``skip_unchanged_streams`` is set; otherwise the probe
+        revalidates their cached pages.
+
+        A configured child entity whose parent ran first is fetched only for
+        the parent keys emitted in this run, without page checkpoints.
+        """
+        probe = self._change_probe(context)
+        if probe is not None and self._unchanged_since_last_run(probe):
+            return
+        self._cache_validator = probe
+        key_batches = self._parent_key_batches()
+        interval = (
+            u.to_int(
+                self._settings_map().get("checkpoint_interval_pages"),
+                default=c.TapOracleWms.Settings.DEFAULT_CHECKPOINT_INTERVAL_PAGES,
+            )
+            if key_batches is None
+            else 0
+        )
+        checkpoint = self._load_checkpoint(context) if interval > 0 else None
+        if checkpoint is not None:
+            self._snapshot_upper_bound = checkpoint.upper_bound
+        elif self.stream_replication_key or self._snapshot_key():
+            self._snapshot_upper_bound = self._run_started_at()
+        else:
+            self._snapshot_upper_bound = None
+        processor = self._record_processor()
+        pages = (
+            self._iter_pages(
+                context,
+                checkpoint.page if checkpoint is not None else 1,
+                m.TapOracleWms.PageRequest(checkpointed=checkpoint is not None),
+            )
+            if key_batches is None
+            else self._iter_key_batches(context, key_batches)
+        )
+        row_pages = (
+            (self._process_page_records(records, context) for records in pages)
+            if processor is None
+            else self._process_pages_in_pool(pages, processor)
+        )
+        rows = (
+            (row for page_rows in row_pages for row in page_rows)
+            if checkpoint is None
+            else self._checkpoint_rows(row_pages, context, checkpoint, interval)
+        )
+        snapshot = self._due_key_snapshot()
+        if snapshot is not None:
+            rows = self._append_deletions(rows, context, snapshot)
+        rows = self._collect_parent_keys(rows)
+        yield from self._record_run_stats(rows)
+
+    def _change_probe(self, context: t.ScalarMapping | None) -> str | None:
+        """Probe a full-table stream when skipping or caching needs it."""
+        if self.stream_replication_key:
+            return None
+        skips = (
+            self._settings_map().get("skip_unchanged_streams") is True
+            and self._run_history() is not None
+        )
+        if not skips and self._response_cache() is None:
+            return None
+        return self._probe_changes(context)
+
+    def _unchanged_since_last_run(self, probe: str) -> bool:
+        """Report whether ``probe`` matches the last run, then store it.
+
+        Only applies with ``skip_unchanged_streams``; a failed probe never
+        reaches here and counts as changed.
+        """
+        if self._settings_map().get("skip_unchanged_streams") is not True:
+            return False
+        history = self._run_history()
+        if history is None:
+            return False
+        unchanged = probe == history.last_probe(self.name)
+        history.record_probe(self.name, probe)
+        if unchanged:
+            logger.info("Skipping %s: unchanged since the last run", self.name)
+        return unchanged
+
+    def _probe_changes(self, context: t.ScalarMapping | None) -> str | None:
+        """Return the latest replication key and id values as one fingerprint.
+
+        Each value costs a single-row request ordered descending on its
+        column; None when a request fails.
+        """
+        columns = (
+            str(
+                self._settings_map().get("replication_key")
+                or c.TapOracleWms.Settings.DEFAULT_REPLICATION_KEY,
+            ),
+            c.TapOracleWms.Deletion.KEY_FIELD,
+        )
+        latest: dict[str, t.JsonValue] = {}
+        for column in columns:
+            probe_result = self._fetch_page_with_retry(
+                1,
+                context,
+                None,
+                m.TapOracleWms.PageRequest(probe_column=column),
+            )
+            if probe_result.failure:
+                logger.warning(
+                    "Change probe failed for %s: %s",
+                    self.name,
+                    probe_result.error,
+                )
+                return None
+            records, _ = probe_result.value
+            latest[column] = records[0].get(column) if records else None
+        return json.dumps(latest, sort_keys=True, default=str)
+
+    def _child_entities(self) -> t.MappingKV[str, m.TapOracleWms.ChildEntity]:
+        """Return the configured child entities keyed by child name."""
+        configured = self._settings_map().get("child_entities")
+        if not isinstance(configured, Mapping):
+            return {}
+        return {
+            name: m.TapOracleWms.ChildEntity.model_validate(entity)
+            for name, entity in configured.items()
+        }
+
+    def _parent_key_batches(self) -> t.StrSequence | None:
+        """Return the ``__in`` filter values of a batched child, or None.
+
+        None means a normal extraction: the stream is not a configured child,
+        or its parent did not finish extracting earlier in this run.
+        """
+        child = self._child_entities().get(self.name)
+        registry = self._parent_keys()
+        if child is None or registry is None:
+            return None
+        keys = registry.collected(child.parent, child.parent_key)
+        if keys is None:
+            logger.info(
+                "Parent %s of %s did not finish extracting in this run; "
+                "extracting %s unbatched",
+                child.parent,
+                self.name,
+                self.name,
+            )
+            return None
+        batches = u.TapOracleWms.KeyBatching.chunk(
+            keys,
+            u.to_int(
+                self._settings_map().get("max_in_filter_length"),
+                default=c.TapOracleWms.Settings.DEFAULT_MAX_IN_FILTER_LENGTH,
+            ),
+        )
+        logger.info(
+            "Extracting %s for %s changed %s keys in %s batches",
+            self.name,
+            len(keys),
+            child.parent,
+            len(batches),
+        )
+        return batches
+
+    def _iter_key_batches(
+        self,
+        context: t.ScalarMapping | None,
+        batches: t.StrSequence,
+    ) -> t.IterableOf[t.SequenceOf[t.JsonMapping]]:
+        """Yield the record pages of every parent key batch in turn."""
+        child = self._child_entities()[self.name]
+        in_filter = child.foreign_key + c.TapOracleWms.Replication.IN_FILTER_SUFFIX
+        for batch in batches:
+            yield from self._iter_pages(
+                context,
+                request=m.TapOracleWms.PageRequest(key_batch=(in_filter, batch)),
+            )
+
+    def _due_key_snapshot(self) -> u.TapOracleWms.KeySnapshot | None:
+        """Return this stream's key snapshot when a key pass is due.
+
+        Only incremental streams need delete detection; a missing snapshot
+        is due at once so the first pass records the baseline.
+        """
+        settings_map = self._settings_map()
+        snapshot_dir = settings_map.get("delete_detection_path")
+        if not snapshot_dir or not self.stream_replication_key:
+            return None
+        snapshot = u.TapOracleWms.KeySnapshot(
+            Path(str(snapshot_dir))
+            / f"{self.name}{c.TapOracleWms.Deletion.SNAPSHOT_SUFFIX}",
+        )
+        interval_seconds = (
+            u.to_int(
+                settings_map.get("delete_detection_interval_hours"),
+                default=(
+                    c.TapOracleWms.Settings.DEFAULT_DELETE_DETECTION_INTERVAL_HOURS
+                ),
+            )
+            * c.TapOracleWms.Deletion.SECONDS_PER_HOUR
+        )
+        age = snapshot.age_seconds()
+        return snapshot if age is None or age >= interval_seconds else None
+
+    def _append_deletions(
+        self,
+        rows: t.IterableOf[t.JsonDict],
+        context: t.ScalarMapping | None,
+        snapshot: u.TapOracleWms.KeySnapshot,
+    ) -> t.IterableOf[t.JsonDict]:
+        """Pass rows through, then emit rows deleted since the last key pass.
+
+        The key pass requests only ``id`` with a large page size. The new
+        snapshot is saved after every deletion record has been emitted, so
+        an interrupted run reports the same deletions again.
+        """
+        yield from rows
+        current = self._fetch_current_keys(context)
+        if current is None:
+            return
+        deleted = snapshot.missing(snapshot.load(), current)
+        logger.info(
+            "Key pass for %s: %s keys, %s deleted",
+            self.name,
+            len(current),
+            len(deleted),
+        )
+        deleted_at = self._run_started_at()
+        for key in deleted:
+            yield {
+                c.TapOracleWms.Deletion.KEY_FIELD: key,
+                c.TapOracleWms.Deletion.DELETED_AT_COLUMN: deleted_at,
+            }
+        snapshot.save(current)
+
+    def _fetch_current_keys(self, context: t.ScalarMapping | None) -> list[int] | None:
+        """Fetch every current primary key sorted, or None if not integers."""
+        keys: list[int] = []
+        for records in self._iter_pages(
+            context,
+            request=m.TapOracleWms.PageRequest(key_pass=True),
+        ):
+            for record in records:
+                key = record.get(c.TapOracleWms.Deletion.KEY_FIELD)
+                if not isinstance(key, int) or isinstance(key, bool):
+                    logger.warning(
+                        "Skipping delete detection for %s: non-integer key %r",
+                        self.name,
+                        key,
+                    )
+                    return None
+                keys.append(key)
+        keys.sort()
+        return keys
+
+    def _collect_parent_keys(
+        self,
+        rows: t.IterableOf[t.JsonDict],
+    ) -> t.IterableOf[t.JsonDict]:
+        """Pass rows through, recording the keys child entities filter on."""
+        registry = self._parent_keys()
+        fields = {
+            child.parent_key
+            for child in self._child_entities().values()
+            if child.parent == self.name
+        }
+        if registry is None or not fields:
+            yield from rows
+            return
+        for field in fields:
+            registry.start(self.name, field)
+        for row in rows:
+            for field in fields:
+                key = row.get(field)
+                if key is not None:
+                    registry.add(self.name, field, str(key))
+            yield row
+        for field in fields:
+            registry.finish(self.name, field)
+
+    def _load_checkpoint(
+        self,
+        context: t.ScalarMapping | None,
+    ) -> m.TapOracleWms.PageCheckpoint:
+        """Return the saved resume position, or a fresh one bounded at run start."""
+        saved = self.get_context_state(context).get(
+            c.TapOracleWms.Checkpoint.STATE_KEY,
+        )
+        if isinstance(saved, Mapping):
+            checkpoint = m.TapOracleWms.PageCheckpoint.model_validate(saved)
+            logger.info(
+                "Resuming %s from page %s (upper bound %s)",
+                self.name,
+                checkpoint.page,
+                checkpoint.upper_bound,
+            )
+            return checkpoint
+        return m.TapOracleWms.PageCheckpoint(upper_bound=self._run_started_at())
+
+    def _run_started_at(self) -> str:
+        """Return the tap's run-start timestamp, or now for foreign taps."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithRunStart):
+            return tap_instance.run_started_at
+        return datetime.now(UTC).isoformat()
+
+    def _checkpoint_rows(
+        self,
+        row_pages: t.IterableOf[t.IterableOf[t.JsonDict]],
+        context: t.ScalarMapping | None,
+        checkpoint: m.TapOracleWms.PageCheckpoint,
+        interval: int,
+    ) -> t.IterableOf[t.JsonDict]:
+        """Pass each page's rows through, saving the next page every ``interval``.
+
+        A page counts as consumed once the SDK asks for the row after its
+        last one, so the checkpoint never skips unwritten rows. It is cleared
+        when the stream completes.
+        """
+        for consumed, page_rows in enumerate(row_pages, start=1):
+            yield from page_rows
+            if consumed % interval == 0:
+                self._write_checkpoint(
+                    context,
+                    checkpoint.model_copy(
+                        update={"page": checkpoint.page + consumed},
+                    ),
+                )
+        self._write_checkpoint(context, None)
+
+    def _write_checkpoint(
+        self,
+        context: t.ScalarMapping | None,
+        checkpoint: m.TapOracleWms.PageCheckpoint | None,
+    ) -> None:
+        """Store or clear the resume position and emit a STATE message."""
+        with self._message_lock:
+            state = self.get_context_state(context)
+            if checkpoint is None:
+                state.pop(c.TapOracleWms.Checkpoint.STATE_KEY, None)
+            else:
+                state[c.TapOracleWms.Checkpoint.STATE_KEY] = checkpoint.model_dump(
+                    mode="json",
+                )
+            self._write_state_message()
+
+    def _record_run_stats(
+        self,
+        rows: t.IterableOf[t.JsonDict],
+    ) -> t.IterableOf[t.JsonDict]:
+        """Pass rows through while reporting duration, rows and bytes.
+
+        Bytes are estimated from the serialized size of one row per page.
+        """
+        history = self._run_history()
+        if history is None:
+            yield from rows
+            return
+        started = time.perf_counter()
+        records = 0
+        byte_count = 0
+        try:
+            for row in rows:
+                if records % self._page_size == 0:
+                    byte_count += len(json.dumps(row, default=str)) * self._page_size
+                records += 1
+                yield row
+        finally:
+            history.add(
+                self.name,
+                duration_seconds=time.perf_counter() - started,
+                records=records,
+                byte_count=byte_count,
+            )
+
+    def _iter_pages(
+        self,
+        context: t.ScalarMapping | None,
+        start_page: int = 1,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
+    ) -> t.IterableOf[t.SequenceOf[t.JsonMapping]]:
+        """Yield raw record pages from ``start_page`` until the source is exhausted."""
+        limiter = self._page_concurrency()
+        if limiter is not None:
+            yield from self._iter_pages_concurrently(
+                context,
+                limiter,
+                start_page,
+                request,
+            )
+            return
+        page = start_page
         has_more = True
         while has_more:
+            page_result = self._fetch_page_with_retry(page, context, None, request)
+            if page_result.failure:
+                raise self._page_failure(page, page_result.error)
+            records, has_more = page_result.value
+            if not records:
+                break
+            yield records
+            page += 1
+
+    def _iter_pages_concurrently(
+        self,
+        context: t.ScalarMapping | None,
+        limiter: p.TapOracleWms.OracleWms.ConcurrencyLimiter,
+        start_page: int = 1,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
+    ) -> t.IterableOf[t.SequenceOf[t.JsonMapping]]:
+        """Fetch pages ahead under the adaptive limiter and yield them in order.
+
+        Up to ``max_limit`` pages are queued ahead of the page being yielded;
+        the limiter decides how many of them are actually in flight. Pages
+        queued past the last one are cancelled or discarded. With request
+        hedging enabled, a slow head page is requested a second time.
+        """
+        pending: deque[
+            tuple[int, Future[p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]]]
+        ] = deque()
+        hedging = self._hedge_policy()
+        next_page = start_page
+        with (
+            ThreadPoolExecutor(
+                max_workers=limiter.max_limit,
+                thread_name_prefix="tap-oracle-wms-page",
+            ) as pool,
+            ThreadPoolExecutor(
+                max_workers=c.TapOracleWms.Hedging.MAX_IN_FLIGHT,
+                thread_name_prefix="tap-oracle-wms-hedge",
+            ) as hedge_pool,
+        ):
             try:
-                page_result = self._fetch_page_data(page, context)
-                if page_result.failure:
-                    logger.error(
-                        "Failed to fetch page %s for %s: %s",
-                        page,
+                while True:
+                    while len(pending) < limiter.max_limit:
+                        pending.append((
+                            next_page,
+                            pool.submit(
+                                self._fetch_page_with_retry,
+                                next_page,
+                                context,
+                                limiter,
+                                request,
+                                hedging,
+                            ),
+                        ))
+                        next_page += 1
+                    page, future = pending.popleft()
+                    page_result = (
+                        future.result()
+                        if hedging is None
+                        else self._await_hedged(
+                            page,
+                            future,
+                            context,
+                            hedging,
+                            hedge_pool,
+                            request,
+                        )
+                    )
+                    if page_result.failure:
+                        raise self._page_failure(page, page_result.error)
+                    records, has_more = page_result.value
+                    if not records:
+                        return
+                    yield records
+                    if not has_more:
+                        return
+            finally:
+                for _, queued in pending:
+                    queued.cancel()
+                logger.info(
+                    "Page concurrency for %s: %s",
+                    self.name,
+                    limiter.metrics().model_dump(),
+                )
+                if hedging is not None:
+                    logger.info(
+                        "Hedged %s of %s page requests for %s",
+                        hedging.hedges,
+                        hedging.requests,
                         self.name,
+                    )
+
+    def _hedge_policy(self) -> u.TapOracleWms.HedgePolicy | None:
+        """Return this stream's hedging policy, rebuilt only when settings change.
+
+        One policy serves every page run of the stream, key batches included,
+        so its latency window keeps filling across calls.
+        """
+        settings_map = self._settings_map()
+        if settings_map is not self._hedging_source:
+            self._hedging = self._build_hedge_policy(settings_map)
+            self._hedging_source = settings_map
+        return self._hedging
+
+    @staticmethod
+    def _build_hedge_policy(
+        settings_map: t.JsonMapping,
+    ) -> u.TapOracleWms.HedgePolicy | None:
+        """Build a hedging policy when request hedging is enabled."""
+        if settings_map.get("enable_request_hedging") is not True:
+            return None
+        percentile = settings_map.get("hedge_latency_percentile")
+        budget = settings_map.get("hedge_budget_percent")
+        return u.TapOracleWms.HedgePolicy(
+            float(percentile)
+            if isinstance(percentile, (int, float))
+            else c.TapOracleWms.Settings.DEFAULT_HEDGE_LATENCY_PERCENTILE,
+            (
+                float(budget)
+                if isinstance(budget, (int, float))
+                else c.TapOracleWms.Settings.DEFAULT_HEDGE_BUDGET_PERCENT
+            )
+            / c.TapOracleWms.Hedging.MAX_PERCENTILE,
+        )
+
+    def _fetch_page_timed(
+        self,
+        page: int,
+        context: t.ScalarMapping | None,
+        request: m.TapOracleWms.PageRequest,
+        hedging: u.TapOracleWms.HedgePolicy | None,
+    ) -> p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]:
+        """Fetch one page's data, feeding the request latency to ``hedging``.
+
+        Only the request itself is timed: throttling, limiter slots and
+        retry backoff neither count as latency nor trigger hedges.
+        """
+        if hedging is None:
+            return self._fetch_page_data(page, context, request)
+        primary = not request.hedge
+        begun = hedging.begin(page, primary=primary)
+        page_result = self._fetch_page_data(page, context, request)
+        hedging.finish(page, begun, primary=primary)
+        return page_result
+
+    def _await_hedged(
+        self,
+        page: int,
+        future: Future[p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]],
+        context: t.ScalarMapping | None,
+        hedging: u.TapOracleWms.HedgePolicy,
+        hedge_pool: Executor,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
+    ) -> p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]:
+        """Wait for a page, duplicating the request once it runs past threshold.
+
+        The first successful response wins; the other one is discarded.
+        """
+        while not future.done():
+            threshold = hedging.threshold()
+            if threshold is None:
+                break
+            begun = hedging.started(page)
+            remaining = (
+                threshold if begun is None else begun + threshold - time.perf_counter()
+            )
+            if remaining > 0:
+                wait([future], timeout=remaining)
+                continue
+            if not hedging.try_spend():
+                break
+            logger.info(
+                "Hedging page %s for %s after %.2fs",
+                page,
+                self.name,
+                threshold,
+            )
+            hedge = hedge_pool.submit(
+                self._fetch_page_with_retry,
+                page,
+                context,
+                None,
+                request.model_copy(update={"hedge": True}),
+                hedging,
+            )
+            done, _ = wait([future, hedge], return_when=FIRST_COMPLETED)
+            first = future if future in done else hedge
+            other = hedge if first is future else future
+            first_result = first.result()
+            return first_result if first_result.success else other.result()
+        return future.result()
+
+    def _fetch_page_adaptively(
+        self,
+        page: int,
+        context: t.ScalarMapping | None,
+        limiter: p.TapOracleWms.OracleWms.ConcurrencyLimiter,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
+        hedging: u.TapOracleWms.HedgePolicy | None = None,
+    ) -> p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]:
+        """Fetch one page inside a limiter slot and report its outcome."""
+        self._throttle()
+        limiter.acquire()
+        started = time.perf_counter()
+        overloaded = False
+        retry_after: float | None = None
+        try:
+            page_result = self._fetch_page_timed(page, context, request, hedging)
+            if page_result.failure:
+                overloaded, retry_after = (
+                    u.TapOracleWms.AdaptiveConcurrency.overload_signal(
                         page_result.error or "",
                     )
-                    break
-                records, has_more = page_result.value
-                yield from self._process_page_records(records, context)
-                page += 1
-                if not records:
-                    break
-            except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
-                msg = f"Error getting records for {self.name}: {exc}"
-                logger.exception(msg)
-                raise FlextTapOracleWmsError(msg) from exc
+                )
+            return page_result
+        finally:
+            limiter.release(
+                time.perf_counter() - started,
+                overloaded=overloaded,
+                retry_after=retry_after,
+            )
+
+    def _fetch_page_with_retry(
+        self,
+        page: int,
+        context: t.ScalarMapping | None,
+        limiter: p.TapOracleWms.OracleWms.ConcurrencyLimiter | None,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
+        hedging: u.TapOracleWms.HedgePolicy | None = None,
+    ) -> p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]:
+        """Fetch one page, retrying only that page with jittered backoff.
+
+        Up to ``max_retries`` retries wait ``retry_delay`` seconds doubled per
+        attempt; client errors such as 404 are returned without retrying.
+        While the tap's circuit breaker is open, attempts fail fast and the
+        next one waits until the half-open probe is due; waiting for another
+        caller's probe costs no attempt. Pages served by the response cache
+        skip throttling, the breaker and the limiter altogether.
+        """
+        cached = self._cached_page(page, context, request)
+        if cached is not None:
+            return cached
+        settings_map = self._settings_map()
+        max_retries = u.to_int(
+            settings_map.get("max_retries"),
+            default=c.TapOracleWms.Settings.TAP_DEFAULT_MAX_RETRIES,
+        )
+        retry_delay = u.to_int(
+            settings_map.get("retry_delay"),
+            default=int(c.TapOracleWms.Settings.TAP_DEFAULT_RETRY_DELAY),
+        )
+        backoff = u.TapOracleWms.RetryBackoff
+        breaker = self._circuit_breaker()
+        attempt = 0
+        while True:
+            open_for = breaker.admit() if breaker is not None else 0.0
+            if breaker is not None and open_for > 0:
+                page_result = r[tuple[t.SequenceOf[t.JsonMapping], bool]].fail(
+                    breaker.open_error(open_for),
+                )
+                retry_after: float | None = open_for
+            else:
+                try:
+                    if limiter is None:
+                        self._throttle()
+                        page_result = self._fetch_page_timed(
+                            page,
+                            context,
+                            request,
+                            hedging,
+                        )
+                    else:
+                        page_result = self._fetch_page_adaptively(
+                            page,
+                            context,
+                            limiter,
+                            request,
+                            hedging,
+                        )
+                    if breaker is not None:
+                        breaker.record(
+                            success=u.TapOracleWms.CircuitBreaker.succeeded(
+                                success=page_result.success,
+                                error=page_result.error,
+                            ),
+                        )
+                finally:
+                    if breaker is not None:
+                        breaker.release()
+                _, retry_after = u.TapOracleWms.AdaptiveConcurrency.overload_signal(
+                    page_result.error or "",
+                )
+            error = page_result.error or ""
+            if (
+                page_result.success
+                or attempt >= max_retries
+                or not backoff.retryable(error)
+            ):
+                return page_result
+            attempt += 1
+            delay = backoff.delay(attempt, retry_delay, retry_after)
+            logger.warning(
+                "Retrying page %s for %s in %.1fs (attempt %s of %s): %s",
+                page,
+                self.name,
+                delay,
+                attempt,
+                max_retries,
+                error,
+            )
+            time.sleep(delay)
+
+    def _page_failure(self, page: int, error: str | None) -> FlextTapOracleWmsError:
+        """Build the error ending a stream whose page could not be fetched."""
+        return FlextTapOracleWmsError(
+            f"Failed to fetch page {page} for {self.name}: {error or ''}",
+        )
+
+    def _run_history(self) -> p.TapOracleWms.OracleWms.StreamRunRecorder | None:
+        """Return the tap's run history store, if configured."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithRunHistory):
+            return tap_instance.run_history
+        return None
+
+    def _response_cache(self) -> p.TapOracleWms.OracleWms.ResponseStore | None:
+        """Return the tap's on-disk response cache, if configured."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithResponseCache):
+            return tap_instance.response_cache
+        return None
+
+    def _circuit_breaker(self) -> p.TapOracleWms.OracleWms.CircuitGate | None:
+        """Return the tap's shared circuit breaker, if enabled."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithCircuitBreaker):
+            return tap_instance.circuit_breaker
+        return None
+
+    def _page_concurrency(
+        self,
+    ) -> p.TapOracleWms.OracleWms.ConcurrencyLimiter | None:
+        """Return the tap's adaptive page concurrency limiter, if enabled."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithPageConcurrency):
+            return tap_instance.page_concurrency
+        return None
+
+    def _parent_keys(self) -> p.TapOracleWms.OracleWms.ParentKeyRegistry | None:
+        """Return the tap's parent key registry, if it keeps one."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithParentKeys):
+            return tap_instance.parent_keys
+        return None
+
+    def _throttle(self) -> None:
+        """Wait for the tap's shared rate limiter before a WMS request."""
+        tap_instance = self._tap
+        if not isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithRateLimiter):
+            return
+        limiter = tap_instance.rate_limiter
+        if limiter is not None:
+            limiter.acquire()
+
+    def _record_processor(self) -> Executor | None:
+        """Return the tap's record processing pool, if one is configured."""
+        tap_instance = self._tap
+        if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithRecordProcessor):
+            return tap_instance.record_processor
+        return None
+
+    def _process_pages_in_pool(
+        self,
+        pages: t.IterableOf[t.SequenceOf[t.JsonMapping]],
+        processor: Executor,
+    ) -> t.IterableOf[list[t.JsonDict]]:
+        """Normalize pages on worker processes and yield them in page order.
+
+        Up to two pages per worker are in flight, so fetching the next page
+        overlaps with normalizing the previous ones.
+        """
+        workers = u.to_int(
+            self._settings_map().get("record_processing_workers"),
+            default=1,
+        )
+        window = max(2 * workers, 1)
+        in_flight: deque[Future[list[t.JsonDict]]] = deque()
+        for records in pages:
+            in_flight.append(processor.submit(self.normalize_page, records))
+            if len(in_flight) >= window:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
 
     def get_replication_key(self) -> str | None:
         """Get replication key for this stream."""
@@ -178,11 +991,115 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
         context: t.ScalarMapping | None = None,
     ) -> t.JsonDict:
         """Post-process a record."""
-        conv = u.TapOracleWms.MappingConversion
+        column_mapping, ignored_columns = self._resolve_record_plan()
+        for old_name, new_name in column_mapping.items():
+            if old_name in row:
+                row[new_name] = row.pop(old_name)
+        for column_name in ignored_columns:
+            row.pop(column_name, None)
+        if context:
+            row["context"] = str({k: str(v) for k, v in context.items()})
+        return row
+
+    @override
+    def _increment_stream_state(
+        self,
+        latest_record: t.JsonMapping,
+        *,
+        context: t.ScalarMapping | None = None,
+    ) -> None:
+        """Advance this stream's bookmark under the tap message lock.
+
+        Deletion records carry no replication key and leave it unchanged.
+        """
+        if (
+            c.TapOracleWms.Deletion.DELETED_AT_COLUMN in latest_record
+            and self.replication_key not in latest_record
+        ):
+            return
+        parent_increment: Callable[..., None] = getattr(
+            super(),
+            "_increment_stream_state",
+        )
+        with self._message_lock:
+            parent_increment(latest_record, context=context)
+
+    @override
+    def _write_state_message(self) -> None:
+        """Write a STATE message from a consistent snapshot of tap state."""
+        parent_write: Callable[[], None] = getattr(super(), "_write_state_message")
+        with self._message_lock:
+            parent_write()
+
+    def write_tap_state(self) -> None:
+        """Write a STATE message with the tap state even if already emitted.
+
+        Parallel syncs use it for the STATE message ``sync_all`` writes first.
+        """
+        with self._message_lock:
+            self._is_state_flushed = False
+            self._last_emitted_state = None
+            self._write_state_message()
+
+    @override
+    def get_context_state(self, context: t.ScalarMapping | None) -> t.JsonDict:
+        """Return the writable state of ``context``, created under the lock."""
+        parent_state: Callable[..., t.JsonDict] = getattr(
+            super(),
+            "get_context_state",
+        )
+        with self._message_lock:
+            return parent_state(context)
+
+    @property
+    @override
+    def stream_state(self) -> t.JsonDict:
+        """Writable state of this stream, created under the lock."""
+        with self._message_lock:
+            return getattr(super(), "stream_state")
+
+    @override
+    def _write_starting_replication_value(
+        self,
+        context: t.ScalarMapping | None,
+    ) -> None:
+        """Record the starting bookmark under the tap message lock."""
+        parent_write: Callable[..., None] = getattr(
+            super(),
+            "_write_starting_replication_value",
+        )
+        with self._message_lock:
+            parent_write(context)
+
+    @override
+    def _finalize_state(self, state: t.JsonDict | None = None) -> None:
+        """Promote progress markers under the tap message lock."""
+        parent_finalize: Callable[..., None] = getattr(super(), "_finalize_state")
+        with self._message_lock:
+            parent_finalize(state)
+
+    def _settings_map(self) -> t.JsonMapping:
+        """Return the tap settings snapshot, or an empty mapping for foreign taps."""
         tap_instance = self._tap
-        config_map: t.JsonMapping = {}
         if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithWmsClientSettings):
-            config_map = tap_instance.settings
+            return tap_instance.settings
+        return _EMPTY_SETTINGS
+
+    def _resolve_record_plan(self) -> tuple[t.StrMapping, t.StrSequence]:
+        """Return column renames and drops, rebuilt only when settings change."""
+        settings_map = self._settings_map()
+        if settings_map is not self._record_plan_source:
+            self._record_plan = self._build_record_plan(settings_map)
+            self._record_plan_source = settings_map
+        return self._record_plan
+
+    def _build_record_plan(
+        self,
+        config_map: t.JsonMapping,
+    ) -> tuple[t.StrMapping, t.StrSequence]:
+        """Resolve this stream's column mappings and ignored columns."""
+        conv = u.TapOracleWms.MappingConversion
+        column_mapping: t.MutableStrMapping = {}
         column_mappings_raw = config_map.get("column_mappings")
         column_mappings = (
             conv.as_map(
@@ -205,10 +1122,9 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
                 else None
             )
             if mapping is not None:
-                for old_name, new_name in mapping.items():
-                    new_name_str = str(new_name)
-                    if old_name in row:
-                        row[new_name_str] = row.pop(old_name)
+                column_mapping = {
+                    old_name: str(new_name) for old_name, new_name in mapping.items()
+                }
         ignored_columns_raw = config_map.get("ignored_columns")
         ignored_columns = (
             conv.as_list(
@@ -219,61 +1135,260 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
             if ignored_columns_raw
             else None
         )
-        if ignored_columns is not None:
-            for column_name in ignored_columns:
-                if isinstance(column_name, str):
-                    row.pop(column_name, None)
-        if context:
-            row["context"] = str({k: str(v) for k, v in context.items()})
-        return row
+        ignored: t.StrSequence = (
+            tuple(name for name in ignored_columns if isinstance(name, str))
+            if ignored_columns is not None
+            else ()
+        )
+        return column_mapping, ignored
 
     def _build_operation_kwargs(
         self,
         page: int,
         context: t.ScalarMapping | None,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
     ) -> t.MutableScalarMapping:
-        """Build kwargs for the operation call."""
+        """Build the page request parameters, filters included.
+
+        Incremental streams are ordered by their replication key, then
+        ``id`` so rows sharing a timestamp keep their page, and are bounded
+        below by the bookmark (or ``start_date``) minus the lookback window
+        with ``<key>__gte`` and above by the run start with ``<key>__lt``;
+        in snapshot mode full-table streams get the same upper bound. Full-table
+        pages behind page checkpoints are ordered by ``id`` and keep the
+        checkpoint's upper bound, so a resumed run sees the same pages. A
+        child entity batch is filtered by parent keys instead of the
+        bookmark, so unchanged details of changed parents are included.
+        Streams with ``related_fields`` list their columns in ``fields``.
+        ``request`` turns the page into a delete detection key pass, which
+        requests only ``id`` in ``id`` order, or a change probe, which
+        requests the latest value of one column.
+        """
         result_kwargs: t.MutableScalarMapping = {}
         result_kwargs["page"] = page
+        if request.key_pass:
+            result_kwargs["limit"] = u.to_int(
+                self._settings_map().get("delete_detection_page_size"),
+                default=c.TapOracleWms.Settings.DEFAULT_DELETE_DETECTION_PAGE_SIZE,
+            )
+            result_kwargs[c.TapOracleWms.Replication.FIELDS_PARAM] = (
+                c.TapOracleWms.Deletion.KEY_FIELD
+            )
+            result_kwargs[c.TapOracleWms.Replication.ORDERING_PARAM] = (
+                c.TapOracleWms.Deletion.KEY_FIELD
+            )
+            return result_kwargs
+        probe_column = request.probe_column
+        if probe_column:
+            result_kwargs["limit"] = 1
+            result_kwargs[c.TapOracleWms.Replication.ORDERING_PARAM] = (
+                c.TapOracleWms.Replication.DESCENDING_PREFIX + probe_column
+            )
+            result_kwargs[c.TapOracleWms.Replication.FIELDS_PARAM] = probe_column
+            return result_kwargs
         result_kwargs["limit"] = self._page_size
-        if self.stream_replication_key:
+        fields = self._expanded_fields()
+        if fields:
+            result_kwargs[c.TapOracleWms.Replication.FIELDS_PARAM] = fields
+        key_batch_filter = request.key_batch
+        if key_batch_filter is not None:
+            in_filter, batch = key_batch_filter
+            result_kwargs[in_filter] = batch
+        replication_key = self.stream_replication_key
+        if replication_key:
+            result_kwargs[c.TapOracleWms.Replication.ORDERING_PARAM] = (
+                f"{replication_key},{c.TapOracleWms.Deletion.KEY_FIELD}"
+            )
             starting_timestamp = self.get_starting_timestamp(context)
-            if starting_timestamp:
-                kwargs_filter = (
-                    f"{self.stream_replication_key}>={starting_timestamp.isoformat()}"
+            if starting_timestamp and key_batch_filter is None:
+                lookback = timedelta(
+                    minutes=u.to_int(
+                        self._settings_map().get("replication_lookback_minutes"),
+                        default=(
+                            c.TapOracleWms.Settings.DEFAULT_REPLICATION_LOOKBACK_MINUTES
+                        ),
+                    ),
                 )
-                result_kwargs["filter"] = kwargs_filter
+                result_kwargs[
+                    replication_key
+                    + c.TapOracleWms.Replication.LOWER_BOUND_FILTER_SUFFIX
+                ] = (starting_timestamp - lookback).isoformat()
+        elif request.checkpointed:
+            result_kwargs[c.TapOracleWms.Replication.ORDERING_PARAM] = (
+                c.TapOracleWms.Deletion.KEY_FIELD
+            )
+        snapshot_key = replication_key or self._snapshot_key(
+            checkpointed=request.checkpointed,
+        )
+        if snapshot_key and self._snapshot_upper_bound:
+            result_kwargs[
+                snapshot_key + c.TapOracleWms.Replication.UPPER_BOUND_FILTER_SUFFIX
+            ] = self._snapshot_upper_bound
         return result_kwargs
 
+    def _snapshot_key(self, *, checkpointed: bool = False) -> str | None:
+        """Return the column bounding a full-table stream.
+
+        Streams are bounded in snapshot mode and behind page checkpoints.
+        Entities whose described schema lacks ``replication_key`` cannot be
+        bounded and are read unbounded.
+        """
+        settings_map = self._settings_map()
+        if settings_map.get("snapshot_mode") is not True and not checkpointed:
+            return None
+        key = str(
+            settings_map.get("replication_key")
+            or c.TapOracleWms.Settings.DEFAULT_REPLICATION_KEY,
+        )
+        properties = (
+            self._typed_schema.get("properties")
+            if self._typed_schema is not None
+            else None
+        )
+        if isinstance(properties, Mapping) and properties and key not in properties:
+            return None
+        return key
+
+    def _get_entity_data(
+        self,
+        limit: int,
+        filters: t.MutableScalarMapping,
+    ) -> p.Result[t.SequenceOf[t.JsonMapping]]:
+        """Request one page, recorded to or replayed from the tap's archive."""
+
+        def request() -> p.Result[t.SequenceOf[t.JsonMapping]]:
+            return self.client.get_entity_data(
+                entity_name=self.name,
+                limit=limit,
+                filters=filters,
+            )
+
+        tap_instance = self._tap
+        archive = (
+            tap_instance.wms_archive
+            if isinstance(tap_instance, p.TapOracleWms.OracleWms.TapWithWmsArchive)
+            else None
+        )
+        if archive is None:
+            return request()
+        return archive.exchange(
+            c.TapOracleWms.Archive.OPERATION_ENTITY_DATA,
+            {"entity": self.name, "limit": limit, "filters": dict(filters)},
+            request,
+            lambda item: item if isinstance(item, Mapping) else {},
+        )
+
+    def _expanded_fields(self) -> str | None:
+        """Return the ``fields`` value adding related traversals, if any.
+
+        The lgfapi returns only the listed fields, so the stream's schema
+        columns are requested alongside the traversals, except columns the
+        tap adds itself such as ``_sdc_deleted_at``; without a described
+        schema the expansion is skipped.
+        """
+        related = self._settings_map().get("related_fields")
+        traversals = related.get(self.name) if isinstance(related, Mapping) else None
+        if not isinstance(traversals, (list, tuple)) or not traversals:
+            return None
+        properties = self.schema.get("properties")
+        if not isinstance(properties, Mapping) or not properties:
+            logger.warning(
+                "Skipping related_fields for %s: its schema lists no columns",
+                self.name,
+            )
+            return None
+        columns = [
+            str(name)
+            for name in properties
+            if not str(name).startswith(
+                c.TapOracleWms.Replication.SYNTHETIC_COLUMN_PREFIX,
+            )
+        ]
+        return ",".join(
+            dict.fromkeys([*columns, *(str(field) for field in traversals)]),
+        )
+
+    def _page_cache_entry(
+        self,
+        page: int,
+        context: t.ScalarMapping | None,
+        request: m.TapOracleWms.PageRequest,
+    ) -> tuple[p.TapOracleWms.OracleWms.ResponseStore, str, int] | None:
+        """Return the response cache, key and page limit serving a page.
+
+        Only full-table pages are cached. The snapshot upper bound is left
+        out of the cache key, since the change probe or TTL decides whether
+        rows changed.
+        """
+        if (
+            self.stream_replication_key
+            or request.key_pass
+            or request.probe_column is not None
+        ):
+            return None
+        cache = self._response_cache()
+        if cache is None:
+            return None
+        kwargs = self._build_operation_kwargs(page, context, request)
+        limit = u.to_int(kwargs.pop("limit", None), default=self._page_size)
+        cache_key = u.TapOracleWms.ResponseCache.key(
+            self.name,
+            limit,
+            {
+                name: value
+                for name, value in kwargs.items()
+                if not name.endswith(
+                    c.TapOracleWms.Replication.UPPER_BOUND_FILTER_SUFFIX,
+                )
+            },
+        )
+        return cache, cache_key, limit
+
+    def _cached_page(
+        self,
+        page: int,
+        context: t.ScalarMapping | None,
+        request: m.TapOracleWms.PageRequest,
+    ) -> p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]] | None:
+        """Return a page served by the response cache, if it holds one."""
+        entry = self._page_cache_entry(page, context, request)
+        if entry is None:
+            return None
+        cache, cache_key, limit = entry
+        cached = cache.get(cache_key, self._cache_validator)
+        if cached is None:
+            return None
+        return r[tuple[t.SequenceOf[t.JsonMapping], bool]].ok((
+            cached,
+            len(cached) == limit,
+        ))
+
     def _fetch_page_data(
         self,
         page: int,
         context: t.ScalarMapping | None,
+        request: m.TapOracleWms.PageRequest = _ROW_PAGES,
     ) -> p.Result[tuple[t.SequenceOf[t.JsonMapping], bool]]:
-        """Fetch data for a specific page."""
-        kwargs = self._build_operation_kwargs(page, context)
-        limit_raw = kwargs.get("limit")
-        limit = u.to_int(limit_raw, default=self._page_size)
-        filters: t.MutableScalarMapping = {}
-        filter_raw = kwargs.get("filter")
-        if isinstance(filter_raw, str) and self.stream_replication_key:
-            filters[self.stream_replication_key] = filter_raw
-        result = self.client.get_entity_data(
-            entity_name=self.name,
-            limit=limit,
-            filters=filters or None,
-        )
+        """Request data for a specific page from the WMS.
+
+        Full-table pages are stored in the response cache when one is
+        configured; :meth:`_cached_page` serves them back.
+        """
+        kwargs = self._build_operation_kwargs(page, context, request)
+        limit = u.to_int(kwargs.pop("limit", None), default=self._page_size)
+        result = self._get_entity_data(limit, kwargs)
         if result.failure:
             return r[tuple[t.SequenceOf[t.JsonMapping], bool]].fail(
                 f"Failed to get records for {self.name}: {result.error}",
             )
-        normalized: t.SequenceOf[t.JsonMapping] = [
-            {key: self.normalize_json_value(value) for key, value in record.items()}
-            for record in result.value
-        ]
-        has_more = len(normalized) == self._page_size
+        records = list(result.value)
+        entry = self._page_cache_entry(page, context, request)
+        if entry is not None:
+            cache, cache_key, _ = entry
+            cache.put(cache_key, records, self._cache_validator)
+        has_more = len(records) == limit
         return r[tuple[t.SequenceOf[t.JsonMapping], bool]].ok((
-            normalized,
+            records,
             has_more,
         ))
 
@@ -282,11 +1397,27 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
         records: t.SequenceOf[t.JsonMapping],
         context: t.ScalarMapping | None,
     ) -> t.IterableOf[t.JsonDict]:
-        """Process and yield records from a page."""
+        """Process and yield records from a page.
+
+        ``post_process`` is applied afterwards by the Singer SDK sync loop.
+        """
+        _ = context
+        yield from self.normalize_page(records)
+
+    @staticmethod
+    def normalize_page(records: t.SequenceOf[t.JsonMapping]) -> list[t.JsonDict]:
+        """Normalize a raw record page into Singer-compatible JSON rows.
+
+        Pure and picklable, so pages can be normalized on worker processes.
+        """
         conv = u.TapOracleWms.MappingConversion
+        normalize_json = FlextTapOracleWmsStream.normalize_json_value
+        normalize_scalar = FlextTapOracleWmsStream.normalize_scalar_value
+        rows: list[t.JsonDict] = []
         for record in records:
             record_dict = t.json_dict_adapter().validate_python({
-                key: self.normalize_scalar_value(value) for key, value in record.items()
+                key: normalize_scalar(normalize_json(value))
+                for key, value in record.items()
             })
             processed_record: t.JsonMapping = (
                 u.TapOracleWms.DataProcessing.process_wms_record(
@@ -295,16 +1426,18 @@ class FlextTapOracleWmsStream(m.Meltano.SingerStreamBase):
             )
             processed_map = conv.as_map(
                 processed_record,
-                normalizer=self.normalize_json_value,
+                normalizer=normalize_json,
                 map_adapter=t.CONTAINER_VALUE_MAP_ADAPTER,
                 error_cls=FlextTapOracleWmsError,
             )
             if processed_map is None:
                 continue
-            json_row = t.json_dict_adapter().validate_python({
-                k: self.normalize_scalar_value(v) for k, v in processed_map.items()
-            })
-            yield self.post_process(json_row, context)
+            rows.append(
+                t.json_dict_adapter().validate_python({
+                    k: normalize_scalar(v) for k, v in processed_map.items()
+                }),
+            )
+        return rows
 
     def _run(self, value: t.Scalar) -> t.Scalar:
         return value
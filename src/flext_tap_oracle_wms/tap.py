@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import (
     Callable,
     Mapping,
-    MutableSequence,
-    Sequence,
 )
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import AbstractContextManager
+from datetime import UTC, datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import ClassVar, override
 
 from flext_oracle_wms import (
@@ -28,6 +38,17 @@ from flext_tap_oracle_wms import (
 from flext_tap_oracle_wms.errors import FlextTapOracleWmsConfigurationError
 from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
 
+logger = u.fetch_logger(__name__)
+
+
+class _FrozenSettings(FlextTapOracleWmsSettings):
+    """Tap settings snapshot rejecting field assignment."""
+
+    model_config: ClassVar[m.SettingsConfigDict] = m.SettingsConfigDict(
+        **FlextTapOracleWmsSettings.model_config,
+        frozen=True,
+    )
+
 
 class FlextTapOracleWms(m.Meltano.SingerTapBase):
     """Singer-compatible tap implementation backed by flext_oracle_wms."""
@@ -61,6 +82,17 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
     }
 
     _wms_client: FlextOracleWmsUtilities.OracleWms.Client | None = None
+    _settings_snapshot: t.JsonMapping | None = None
+    _flext_config_snapshot: FlextTapOracleWmsSettings | None = None
+    _record_processor: ProcessPoolExecutor | None = None
+    _run_history: u.TapOracleWms.RunHistory | None = None
+    _rate_limiter: u.TapOracleWms.TokenBucket | None = None
+    _page_concurrency: u.TapOracleWms.AdaptiveConcurrency | None = None
+    _circuit_breaker: u.TapOracleWms.CircuitBreaker | None = None
+    _run_started_at: str | None = None
+    _parent_keys: u.TapOracleWms.ParentKeys | None = None
+    _response_cache: u.TapOracleWms.ResponseCache | None = None
+    _wms_archive: u.TapOracleWms.WmsArchive | None = None
     _discovery: t.JsonValue | None = None
     _schema_generator: t.JsonValue | None = None
     _discovery_mode: bool = False
@@ -84,6 +116,7 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
             )
         else:
             raw_config = t.json_dict_adapter().validate_python(effective_config or {})
+        self._message_lock = threading.RLock()
         parent_init: Callable[..., None] = getattr(super(), "__init__")
         parent_init(
             config=raw_config,
@@ -95,129 +128,308 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
 
     @property
     def settings(self) -> t.JsonMapping:
-        """Expose tap configuration through legacy settings contract."""
-        config = self.config
-        return t.json_dict_adapter().validate_python(config)
+        """Read-only tap configuration, validated once per tap instance.
 
-    @property
-    def catalog_dict_typed(self) -> t.MutableJsonMapping:
-        """Return a validated Singer catalog mapping with recursive contracts."""
-        raw_catalog_dict: t.JsonMapping = getattr(super(), "catalog_dict", {})
-        try:
-            validated_catalog = t.CONTAINER_VALUE_MAP_ADAPTER.validate_python(
-                raw_catalog_dict,
+        The snapshot is memoized until :meth:`invalidate_settings` is called,
+        so streams may read it on hot paths and compare it by identity to
+        detect a configuration refresh.
+        """
+        if self._settings_snapshot is None:
+            self._settings_snapshot = MappingProxyType(
+                t.json_dict_adapter().validate_python(self.config),
             )
-        except c.ValidationError as exc:
-            msg = f"Invalid catalog_dict format: {exc}"
-            raise FlextTapOracleWmsConfigurationError(msg) from exc
-        return self._to_typed_catalog(
-            u.TapOracleWms.MappingConversion.safe_str_dict(validated_catalog)
-        )
+        return self._settings_snapshot
 
-    @staticmethod
-    def _to_typed_catalog(
-        raw: t.JsonMapping,
-    ) -> t.MutableJsonMapping:
-        """Convert a raw catalog mapping into a validated Singer catalog dict."""
-        raw_streams = raw.get("streams")
-        raw_streams_seq: t.JsonList = (
-            raw_streams
-            if isinstance(raw_streams, Sequence)
-            and not isinstance(raw_streams, t.STR_BYTES_TYPES)
-            else []
+    @property
+    def message_lock(self) -> AbstractContextManager[bool]:
+        """Lock serializing Singer message output and stream state updates."""
+        return self._message_lock
+
+    def write_message(self, message: object) -> None:
+        """Write one Singer message; safe to call from parallel stream workers."""
+        parent_write: Callable[[object], None] = getattr(super(), "write_message")
+        with self._message_lock:
+            parent_write(message)
+
+    @property
+    def record_processor(self) -> Executor | None:
+        """Process pool normalizing record pages, if workers are configured."""
+        workers = self.flext_config.record_processing_workers
+        if workers <= 0:
+            return None
+        with self._message_lock:
+            if self._record_processor is None:
+                self._record_processor = ProcessPoolExecutor(max_workers=workers)
+            return self._record_processor
+
+    @property
+    def run_started_at(self) -> str:
+        """ISO timestamp of this run's start, shared by every stream.
+
+        Incremental streams read rows strictly before it, so all streams see
+        one consistent snapshot and rows committed during the run are left
+        for the next one.
+        """
+        with self._message_lock:
+            if self._run_started_at is None:
+                self._run_started_at = datetime.now(UTC).isoformat()
+            return self._run_started_at
+
+    @property
+    def _replaying(self) -> bool:
+        """Whether WMS responses are replayed from an archive."""
+        settings = self.flext_config
+        return bool(settings.wms_archive_path) and (
+            settings.wms_archive_mode == c.TapOracleWms.Archive.MODE_REPLAY
         )
-        stream_entries: MutableSequence[m.Meltano.SingerCatalogEntry] = []
-        for raw_stream in raw_streams_seq:
-            if not isinstance(raw_stream, Mapping):
-                continue
-            s_dict: t.JsonMapping = u.TapOracleWms.MappingConversion.safe_str_mapping(
-                raw_stream
-            )
-            metadata_raw: t.JsonValue = s_dict.get("metadata", [])
-            metadata_entries: MutableSequence[m.Meltano.SingerCatalogMetadata] = []
-            if isinstance(metadata_raw, Sequence) and not isinstance(
-                metadata_raw, t.STR_BYTES_TYPES
-            ):
-                for raw_entry in metadata_raw:
-                    if not isinstance(raw_entry, Mapping):
-                        continue
-                    entry_dict = u.TapOracleWms.MappingConversion.safe_str_mapping(
-                        raw_entry
+
+    @property
+    def wms_archive(self) -> u.TapOracleWms.WmsArchive | None:
+        """Archive recording or replaying WMS responses, if configured."""
+        settings = self.flext_config
+        archive_path = settings.wms_archive_path
+        if not archive_path:
+            return None
+        replaying = self._replaying
+        if replaying and not Path(archive_path).is_file():
+            msg = f"WMS archive to replay not found: {archive_path}"
+            raise FlextTapOracleWmsConfigurationError(msg)
+        with self._message_lock:
+            if self._wms_archive is None:
+                self._wms_archive = u.TapOracleWms.WmsArchive(
+                    Path(archive_path),
+                    replaying=replaying,
+                    replay_timing=settings.wms_archive_replay_timing,
+                )
+            return self._wms_archive
+
+    @property
+    def response_cache(self) -> u.TapOracleWms.ResponseCache | None:
+        """On-disk response cache, if ``response_cache_path`` is configured."""
+        settings = self.flext_config
+        if not settings.response_cache_path:
+            return None
+        with self._message_lock:
+            if self._response_cache is None:
+                self._response_cache = u.TapOracleWms.ResponseCache(
+                    Path(settings.response_cache_path),
+                    settings.response_cache_ttl_seconds,
+                )
+            return self._response_cache
+
+    @property
+    def parent_keys(self) -> u.TapOracleWms.ParentKeys:
+        """Keys emitted by parent entities, read by batched child streams."""
+        with self._message_lock:
+            if self._parent_keys is None:
+                self._parent_keys = u.TapOracleWms.ParentKeys()
+            return self._parent_keys
+
+    @property
+    def run_history(self) -> u.TapOracleWms.RunHistory | None:
+        """Local per-stream run history, if ``run_history_path`` is configured."""
+        history_path = self.flext_config.run_history_path
+        if not history_path:
+            return None
+        with self._message_lock:
+            if self._run_history is None:
+                self._run_history = u.TapOracleWms.RunHistory(Path(history_path))
+            return self._run_history
+
+    @property
+    def rate_limiter(self) -> u.TapOracleWms.TokenBucket | None:
+        """Token bucket shared by every WMS request of this tap, if enabled.
+
+        With ``rate_limit_state_path`` the bucket lives in a file, so tap
+        processes on the same host share one ``max_requests_per_minute`` quota;
+        platforms without file locking fall back to a per-process bucket.
+        Replaying an archive sends no requests and is never throttled.
+        """
+        settings = self.flext_config
+        if not settings.enable_rate_limiting or self._replaying:
+            return None
+        with self._message_lock:
+            if self._rate_limiter is None:
+                state_path = settings.rate_limit_state_path
+                if state_path and not u.TapOracleWms.FileTokenBucket.supported():
+                    logger.warning(
+                        "Ignoring rate_limit_state_path %s: file locking is "
+                        "unavailable on this platform",
+                        state_path,
                     )
-                    breadcrumb_raw: t.JsonValue = entry_dict.get("breadcrumb", [])
-                    metadata_map_raw: t.JsonValue = entry_dict.get("metadata", {})
-                    metadata_entries.append(
-                        m.Meltano.SingerCatalogMetadata(
-                            breadcrumb=[str(item) for item in breadcrumb_raw]
-                            if isinstance(breadcrumb_raw, Sequence)
-                            and not isinstance(breadcrumb_raw, t.STR_BYTES_TYPES)
-                            else [],
-                            metadata=u.TapOracleWms.MappingConversion.safe_str_dict(
-                                metadata_map_raw
-                            )
-                            if isinstance(metadata_map_raw, Mapping)
-                            else {},
-                        )
+                    state_path = None
+                self._rate_limiter = (
+                    u.TapOracleWms.FileTokenBucket.shared_per_minute(
+                        Path(state_path),
+                        settings.max_requests_per_minute,
+                        settings.rate_limit_burst,
+                    )
+                    if state_path
+                    else u.TapOracleWms.TokenBucket.per_minute(
+                        settings.max_requests_per_minute,
+                        settings.rate_limit_burst,
                     )
-            schema_raw: t.JsonValue = s_dict.get("schema", {})
-            stream_name = str(s_dict.get("stream", ""))
-            entry_result = u.Meltano.build_catalog_entry(
-                stream_name=stream_name,
-                schema=(
-                    u.TapOracleWms.MappingConversion.safe_str_dict(schema_raw)
-                    if isinstance(schema_raw, Mapping)
-                    else {}
-                ),
-                key_properties=(),
-            )
-            if entry_result.failure or entry_result.value is None:
-                msg = (
-                    entry_result.error
-                    or f"Failed to build catalog entry for {stream_name}"
                 )
-                raise FlextTapOracleWmsConfigurationError(msg)
-            stream_entries.append(
-                entry_result.value.model_copy(
-                    update={
-                        "tap_stream_id": str(s_dict.get("tap_stream_id", "")),
-                        "stream": stream_name,
-                        "metadata": metadata_entries,
-                    }
+            return self._rate_limiter
+
+    @property
+    def page_concurrency(self) -> u.TapOracleWms.AdaptiveConcurrency | None:
+        """Adaptive in-flight page request limit shared by all streams.
+
+        None when ``max_concurrent_page_requests`` is 1 and pages are fetched
+        sequentially.
+        """
+        max_requests = self.flext_config.max_concurrent_page_requests
+        if max_requests <= 1:
+            return None
+        with self._message_lock:
+            if self._page_concurrency is None:
+                self._page_concurrency = u.TapOracleWms.AdaptiveConcurrency(
+                    max_requests,
                 )
+            return self._page_concurrency
+
+    @property
+    def circuit_breaker(self) -> u.TapOracleWms.CircuitBreaker | None:
+        """Circuit breaker shared by every WMS request, if enabled in settings.
+
+        Replaying an archive sends no requests, so it never trips a breaker.
+        """
+        breaker_settings = self.flext_config.circuit_breaker
+        if not breaker_settings.enabled or self._replaying:
+            return None
+        with self._message_lock:
+            if self._circuit_breaker is None:
+                self._circuit_breaker = u.TapOracleWms.CircuitBreaker(
+                    breaker_settings.failure_threshold,
+                    breaker_settings.recovery_timeout,
+                )
+            return self._circuit_breaker
+
+    def throttle(self) -> None:
+        """Wait for a rate limiter token before issuing a WMS request."""
+        limiter = self.rate_limiter
+        if limiter is not None:
+            limiter.acquire()
+
+    def _request_wms[T](self, request: Callable[[], p.Result[T]]) -> p.Result[T]:
+        """Issue one WMS request through the rate limiter and circuit breaker."""
+        self.throttle()
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return request()
+        open_for = breaker.admit()
+        if open_for > 0:
+            return r[T].fail(breaker.open_error(open_for))
+        try:
+            result = request()
+            breaker.record(
+                success=breaker.succeeded(success=result.success, error=result.error),
             )
-        catalog = m.Meltano.SingerCatalog(streams=stream_entries)
-        dumped_catalog = catalog.model_dump(
-            by_alias=True,
-            exclude_none=True,
-            mode="json",
-        )
-        return t.json_dict_adapter().validate_python(dumped_catalog)
+        finally:
+            breaker.release()
+        return result
+
+    def _archived[T](
+        self,
+        operation: str,
+        params: t.JsonMapping,
+        request: Callable[[], p.Result[t.SequenceOf[T]]],
+        decode: Callable[[t.JsonValue], T],
+    ) -> p.Result[t.SequenceOf[T]]:
+        """Route one WMS request through the record/replay archive, if any."""
+        archive = self.wms_archive
+        if archive is None:
+            return request()
+        return archive.exchange(operation, params, request, decode)
+
+    def shutdown_record_processor(self) -> None:
+        """Stop the record processing pool, if one was started."""
+        with self._message_lock:
+            processor, self._record_processor = self._record_processor, None
+        if processor is not None:
+            processor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def catalog_dict_typed(self) -> t.MutableJsonMapping:
+        """Singer catalog mapping normalized in a single pass."""
+        raw_catalog_dict: t.JsonMapping = getattr(super(), "catalog_dict", {})
+        if not isinstance(raw_catalog_dict, Mapping):
+            msg = f"Invalid catalog_dict format: {type(raw_catalog_dict).__name__}"
+            raise FlextTapOracleWmsConfigurationError(msg)
+        return self._to_typed_catalog(raw_catalog_dict)
+
+    @staticmethod
+    def _to_typed_catalog(
+        raw: t.JsonMapping,
+    ) -> t.MutableJsonMapping:
+        """Convert a raw catalog mapping into a Singer catalog dict."""
+        return u.TapOracleWms.CatalogCodec.load(raw)
 
     @property
     def flext_config(self) -> FlextTapOracleWmsSettings:
-        """Return validated tap settings."""
-        config_map = dict(self.settings)
-        try:
-            return FlextTapOracleWmsSettings.model_validate(config_map)
-        except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
-            msg = f"Invalid configuration: {exc}"
-            raise FlextTapOracleWmsConfigurationError(msg) from exc
+        """Validated tap settings, memoized until :meth:`invalidate_settings`.
+
+        The returned model is frozen and shared by every stream of the tap:
+        assigning one of its fields raises.
+        """
+        if self._flext_config_snapshot is None:
+            config_map = dict(self.settings)
+            try:
+                self._flext_config_snapshot = _FrozenSettings.model_validate(
+                    config_map,
+                )
+            except c.Meltano.SINGER_SAFE_EXCEPTIONS as exc:
+                msg = f"Invalid configuration: {exc}"
+                raise FlextTapOracleWmsConfigurationError(msg) from exc
+        return self._flext_config_snapshot
+
+    def invalidate_settings(self) -> None:
+        """Drop memoized settings and the client built from them.
+
+        The next access to :attr:`settings`, :attr:`flext_config` or
+        :attr:`wms_client` re-validates the current tap configuration. The
+        dropped client is stopped.
+        """
+        with self._message_lock:
+            client = self._wms_client
+            if client is not None:
+                stop_result = client.stop()
+                if stop_result.failure:
+                    logger.warning(
+                        "Failed to stop Oracle WMS client: %s",
+                        stop_result.error,
+                    )
+            self._settings_snapshot = None
+            self._flext_config_snapshot = None
+            self._wms_client = None
+            self._run_history = None
+            self._rate_limiter = None
+            self._page_concurrency = None
+            self._circuit_breaker = None
+            self._response_cache = None
+            self._wms_archive = None
 
     @property
     def wms_client(self) -> FlextOracleWmsUtilities.OracleWms.Client:
-        """Return a started WMS client instance."""
+        """Return a started WMS client instance.
+
+        The client makes a single attempt per request: retries, backoff and
+        the circuit breaker belong to the tap's own retry loop.
+        """
         if self._wms_client is None:
-            password = self.flext_config.password
+            settings = self.flext_config
+            password = settings.password
             wms_settings = FlextOracleWmsSettings.model_validate({
-                "base_url": str(self.flext_config.base_url),
-                "username": self.flext_config.username,
+                "base_url": str(settings.base_url),
+                "username": settings.username,
                 "password": (
                     password.get_secret_value()
                     if isinstance(password, t.SecretStr)
                     else password
                 ),
-                "timeout": float(self.flext_config.timeout),
-                "retry_attempts": self.flext_config.max_retries,
+                "timeout": float(settings.timeout),
+                "retry_attempts": 0,
             })
             client = FlextOracleWmsUtilities.OracleWms.Client(settings=wms_settings)
             start_result = client.start()
@@ -232,19 +444,227 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
         """Return a default Singer JSON schema for discovered entities."""
         return {"type": c.TapOracleWms.SCHEMA_TYPE_OBJECT}
 
+    def describe_entity(self, entity: str) -> p.Result[t.JsonDict]:
+        """Describe an entity by inferring its schema from a record sample.
+
+        With ``related_fields`` configured for the entity, a second sample
+        requests the sampled columns plus the traversals, so the schema
+        includes the expanded columns.
+        """
+        schema_result = self._sample_schema(entity, None)
+        related = self.flext_config.related_fields.get(entity)
+        if schema_result.failure or not related:
+            return schema_result
+        properties = schema_result.value.get("properties")
+        columns = list(properties) if isinstance(properties, Mapping) else []
+        if not columns:
+            return schema_result
+        return self._sample_schema(
+            entity,
+            {
+                c.TapOracleWms.Replication.FIELDS_PARAM: ",".join(
+                    dict.fromkeys([*columns, *related]),
+                ),
+            },
+        )
+
+    def _sample_schema(
+        self,
+        entity: str,
+        filters: t.MutableScalarMapping | None,
+    ) -> p.Result[t.JsonDict]:
+        """Infer an entity schema from one sampled page.
+
+        Samples are served from the response cache while its TTL lasts.
+        """
+        limit = self.flext_config.discovery_sample_size
+        cache = self.response_cache
+        cache_key = u.TapOracleWms.ResponseCache.key(entity, limit, filters)
+        cached = cache.get(cache_key) if cache is not None else None
+        if cached is not None:
+            return r[t.JsonDict].ok(u.TapOracleWms.SchemaInference.infer(cached))
+        sample_result = self._request_wms(
+            lambda: self._archived(
+                c.TapOracleWms.Archive.OPERATION_ENTITY_DATA,
+                {"entity": entity, "limit": limit, "filters": dict(filters or {})},
+                lambda: self.wms_client.get_entity_data(
+                    entity_name=entity,
+                    limit=limit,
+                    filters=filters,
+                ),
+                lambda item: item if isinstance(item, Mapping) else {},
+            ),
+        )
+        if sample_result.failure:
+            return r[t.JsonDict].fail(
+                sample_result.error or f"Failed to describe entity {entity}",
+            )
+        if cache is not None:
+            cache.put(cache_key, list(sample_result.value))
+        return r[t.JsonDict].ok(
+            u.TapOracleWms.SchemaInference.infer(sample_result.value),
+        )
+
+    def diff_catalog(self) -> p.Result[t.SequenceOf[m.TapOracleWms.SchemaDrift]]:
+        """Compare every cached entity schema with a fresh describe.
+
+        The catalog cache is left untouched; discovery refreshes drifted
+        entities when ``check_schema_drift`` is enabled.
+        """
+        cache_file = self._catalog_cache_file()
+        if cache_file is None:
+            return r[t.SequenceOf[m.TapOracleWms.SchemaDrift]].fail(
+                "catalog_cache_path is not configured",
+            )
+        reports: list[m.TapOracleWms.SchemaDrift] = []
+        for entity, cached_schema in self._read_cached_schemas(cache_file).items():
+            describe_result = self.describe_entity(entity)
+            if describe_result.failure:
+                return r[t.SequenceOf[m.TapOracleWms.SchemaDrift]].fail(
+                    describe_result.error or f"Failed to describe entity {entity}",
+                )
+            reports.append(
+                u.TapOracleWms.SchemaDrift.diff(
+                    entity,
+                    cached_schema,
+                    describe_result.value,
+                ),
+            )
+        return r[t.SequenceOf[m.TapOracleWms.SchemaDrift]].ok(reports)
+
+    def _catalog_cache_file(self) -> Path | None:
+        """Return the configured catalog cache file, if any."""
+        cache_path = self.flext_config.catalog_cache_path
+        return Path(cache_path) if cache_path else None
+
+    @staticmethod
+    def _read_cached_schemas(cache_file: Path) -> dict[str, t.JsonDict]:
+        """Read entity schemas from the catalog cache."""
+        schemas: dict[str, t.JsonDict] = {}
+        for entry in u.TapOracleWms.CatalogCodec.read_file(cache_file):
+            schema = entry.get("schema")
+            if isinstance(schema, Mapping):
+                schemas[str(entry.get("stream", ""))] = dict(schema)
+        return schemas
+
+    @staticmethod
+    def _write_cached_schemas(
+        cache_file: Path,
+        schemas: t.MappingKV[str, t.JsonDict],
+    ) -> None:
+        """Persist entity schemas to the catalog cache."""
+        u.TapOracleWms.CatalogCodec.write_file(
+            cache_file,
+            (
+                u.TapOracleWms.CatalogCodec.normalize_entry({
+                    "stream": entity,
+                    "schema": schema,
+                    "key_properties": ["id"],
+                })
+                for entity, schema in schemas.items()
+            ),
+        )
+
+    def _resolve_entity_schemas(
+        self,
+        entities: t.StrSequence,
+    ) -> p.Result[t.MappingKV[str, t.JsonDict]]:
+        """Return cached schemas, describing only new or drifted entities.
+
+        Without a catalog cache only entities with ``related_fields`` are
+        described, since their streams must list the columns they request.
+        """
+        cache_file = self._catalog_cache_file()
+        if cache_file is None:
+            return self._describe_entities(
+                [
+                    entity
+                    for entity in entities
+                    if entity in self.flext_config.related_fields
+                ],
+            )
+        schemas = self._read_cached_schemas(cache_file)
+        check_drift = self.flext_config.check_schema_drift
+        changed = False
+        for entity in entities:
+            if entity in schemas and not check_drift:
+                continue
+            describe_result = self.describe_entity(entity)
+            if describe_result.failure:
+                return r[t.MappingKV[str, t.JsonDict]].fail(
+                    describe_result.error or f"Failed to describe entity {entity}",
+                )
+            live_schema = describe_result.value
+            if entity in schemas:
+                drift = u.TapOracleWms.SchemaDrift.diff(
+                    entity,
+                    schemas[entity],
+                    live_schema,
+                )
+                if not drift.drifted:
+                    continue
+                logger.warning(
+                    "Schema drift for %s: added=%s removed=%s retyped=%s",
+                    entity,
+                    list(drift.added),
+                    list(drift.removed),
+                    [list(change) for change in drift.retyped],
+                )
+                live_schema = u.TapOracleWms.SchemaDrift.merge(
+                    schemas[entity],
+                    live_schema,
+                )
+            schemas[entity] = live_schema
+            changed = True
+        if changed:
+            self._write_cached_schemas(cache_file, schemas)
+        return r[t.MappingKV[str, t.JsonDict]].ok(schemas)
+
+    def _describe_entities(
+        self,
+        entities: t.StrSequence,
+    ) -> p.Result[t.MappingKV[str, t.JsonDict]]:
+        """Describe each entity without consulting the catalog cache."""
+        schemas: dict[str, t.JsonDict] = {}
+        for entity in entities:
+            describe_result = self.describe_entity(entity)
+            if describe_result.failure:
+                return r[t.MappingKV[str, t.JsonDict]].fail(
+                    describe_result.error or f"Failed to describe entity {entity}",
+                )
+            schemas[entity] = describe_result.value
+        return r[t.MappingKV[str, t.JsonDict]].ok(schemas)
+
     def discovercatalog_typed(self) -> p.Result[m.Meltano.SingerCatalog]:
         """Discover source entities and convert them into Singer catalog streams."""
-        discovery_result = self.wms_client.discover_entities()
+        discovery_result = self._request_wms(
+            lambda: self._archived(
+                c.TapOracleWms.Archive.OPERATION_DISCOVER,
+                {},
+                lambda: self.wms_client.discover_entities(),
+                str,
+            ),
+        )
         if discovery_result.failure:
             return r[m.Meltano.SingerCatalog].fail(
                 discovery_result.error or "Discovery failed",
             )
         entities: t.StrSequence = list(discovery_result.value)
+        schemas_result = self._resolve_entity_schemas(entities)
+        if schemas_result.failure:
+            return r[m.Meltano.SingerCatalog].fail(
+                schemas_result.error or "Schema resolution failed",
+            )
+        schemas = schemas_result.value
         streams: list[m.Meltano.SingerCatalogEntry] = []
         for entity in entities:
+            replication_key = self._replication_key_for(schemas.get(entity))
             entry_result = u.Meltano.build_catalog_entry(
                 stream_name=entity,
-                schema=dict(self._schema_for_entity()),
+                schema=self._with_deletion_column(
+                    dict(schemas.get(entity) or self._schema_for_entity()),
+                    incremental=replication_key is not None,
+                ),
                 key_properties=("id",),
             )
             if entry_result.failure:
@@ -253,19 +673,31 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
                     or f"Failed to build Singer catalog entry for {entity}",
                 )
             if entry_result.value is not None:
+                method = (
+                    c.TapOracleWms.Replication.METHOD_INCREMENTAL
+                    if replication_key
+                    else c.TapOracleWms.Replication.METHOD_FULL_TABLE
+                )
+                table_metadata: t.JsonDict = {
+                    "inclusion": "available",
+                    "forced-replication-method": method,
+                    "replication-method": method,
+                    "table-key-properties": ["id"],
+                }
+                if replication_key:
+                    table_metadata["replication-key"] = replication_key
+                    table_metadata["valid-replication-keys"] = [replication_key]
                 streams.append(
                     entry_result.value.model_copy(
                         update={
+                            "replication_key": replication_key,
+                            "replication_method": method,
                             "metadata": [
                                 m.Meltano.SingerCatalogMetadata(
                                     breadcrumb=[],
-                                    metadata={
-                                        "inclusion": "available",
-                                        "forced-replication-method": "FULL_TABLE",
-                                        "table-key-properties": ["id"],
-                                    },
+                                    metadata=table_metadata,
                                 ),
-                            ]
+                            ],
                         }
                     )
                 )
@@ -273,6 +705,51 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
             m.Meltano.SingerCatalog(type="CATALOG", streams=streams),
         )
 
+    def _with_deletion_column(
+        self,
+        schema: t.JsonDict,
+        *,
+        incremental: bool,
+    ) -> t.JsonDict:
+        """Add the deletion timestamp column to delete-detected schemas."""
+        properties = schema.get("properties")
+        if (
+            not incremental
+            or not self.flext_config.delete_detection_path
+            or not isinstance(properties, Mapping)
+            or not properties
+        ):
+            return schema
+        return {
+            **schema,
+            "properties": {
+                **properties,
+                c.TapOracleWms.Deletion.DELETED_AT_COLUMN: {
+                    "type": ["null", c.TapOracleWms.SCHEMA_TYPE_STRING],
+                    "format": c.TapOracleWms.SCHEMA_FORMAT_DATE_TIME,
+                },
+            },
+        }
+
+    def _replication_key_for(self, schema: t.JsonMapping | None) -> str | None:
+        """Return the replication key of an entity when incremental sync is on.
+
+        Every Oracle WMS entity carries the ``create_ts``/``mod_ts`` audit
+        columns, so entities whose schema was not described are assumed to
+        have the key; described schemas must list it.
+        """
+        settings = self.flext_config
+        if not settings.enable_incremental:
+            return None
+        properties = schema.get("properties") if schema is not None else None
+        if isinstance(properties, Mapping) and properties:
+            return (
+                settings.replication_key
+                if settings.replication_key in properties
+                else None
+            )
+        return settings.replication_key
+
     @override
     def discover_streams(self) -> t.SequenceOf[FlextTapOracleWmsStream]:
         """Build stream objects from the discovered catalog."""
@@ -292,6 +769,8 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
                     for k, v in stream_raw.schema_definition.items()
                     if not isinstance(v, Path)
                 },
+                replication_key=stream_raw.replication_key,
+                primary_keys=stream_raw.key_properties,
             )
             for stream_raw in streams_raw
         ]
@@ -300,9 +779,155 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
         """Run a full tap sync when no custom message is provided."""
         if message:
             return r[bool].fail("Tap does not support message execution")
-        self.sync_all()
+        settings = self.flext_config
+        if settings.snapshot_mode:
+            logger.info("Extracting a snapshot of rows before %s", self.run_started_at)
+        try:
+            if (
+                settings.enable_parallel_extraction
+                and settings.max_parallel_streams > 1
+            ):
+                self._sync_all_parallel(settings.max_parallel_streams)
+            else:
+                self.sync_all()
+        finally:
+            self.shutdown_record_processor()
+        history = self.run_history
+        if history is not None:
+            history.commit()
         return r[bool].ok(True)
 
+    @override
+    def sync_all(self) -> None:
+        """Sync selected top-level streams one after another.
+
+        Mirrors the SDK loop, which syncs streams in name order, but runs
+        them in :meth:`_sync_order` so configured child entities follow
+        their parents.
+        """
+        getattr(self, "_reset_state_progress_markers")()
+        getattr(self, "_set_compatible_replication_methods")()
+        self._write_initial_state()
+        for stream in self._sync_order():
+            self._sync_stream(stream)
+        for stream in self.streams.values():
+            stream.log_sync_costs()
+
+    def _sync_all_parallel(self, max_workers: int) -> None:
+        """Sync selected top-level streams concurrently.
+
+        Mirrors :meth:`sync_all`, including its initial STATE message; every
+        worker writes through :meth:`write_message` and changes state under
+        :attr:`message_lock`, so Singer output stays line-atomic and each
+        STATE message is a consistent snapshot. With a run history, streams
+        start longest-first so the longest one is not left for last. A
+        configured child entity starts only once its parent has finished, so
+        the parent's keys are complete.
+        """
+        getattr(self, "_reset_state_progress_markers")()
+        getattr(self, "_set_compatible_replication_methods")()
+        self._write_initial_state()
+        pending = self._sync_order()
+        history = self.run_history
+        if history is not None:
+            estimates = {
+                stream.name: history.estimate(stream.name) for stream in pending
+            }
+            pending = self._sync_order(estimates)
+            logger.info(
+                "Parallel stream plan: %s",
+                u.TapOracleWms.StreamScheduler.pack(
+                    [stream.name for stream in pending],
+                    estimates,
+                    max_workers,
+                ),
+            )
+        waiting_on = self._sync_dependencies([stream.name for stream in pending])
+        finished: set[str] = set()
+        with ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="tap-oracle-wms-stream",
+        ) as executor:
+            running: dict[Future[None], str] = {}
+            while pending or running:
+                ready = [
+                    stream
+                    for stream in pending
+                    if waiting_on.get(stream.name) in {None, *finished}
+                ]
+                for stream in ready:
+                    running[executor.submit(self._sync_stream, stream)] = stream.name
+                pending = [stream for stream in pending if stream not in ready]
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    if future.exception() is not None:
+                        for other in running:
+                            other.cancel()
+                        future.result()
+                    finished.add(name)
+        for stream in self.streams.values():
+            stream.log_sync_costs()
+
+    def _sync_order(
+        self,
+        estimates: t.MappingKV[str, float | None] | None = None,
+    ) -> t.SequenceOf[m.Meltano.SingerStreamBase]:
+        """Return selected top-level streams, configured parents first.
+
+        With ``estimates``, streams are otherwise ordered longest-first.
+        """
+        selected = [
+            stream
+            for stream in self.streams.values()
+            if (stream.selected or stream.has_selected_descendents)
+            and not stream.parent_stream_type
+        ]
+        by_name = {stream.name: stream for stream in selected}
+        names = [stream.name for stream in selected]
+        scheduler = u.TapOracleWms.StreamScheduler
+        if estimates is not None:
+            names = list(scheduler.longest_first(names, estimates))
+        parents = {
+            name: child.parent
+            for name, child in self.flext_config.child_entities.items()
+        }
+        return [by_name[name] for name in scheduler.parents_first(names, parents)]
+
+    def _sync_dependencies(self, order: t.StrSequence) -> t.StrMapping:
+        """Map each stream in ``order`` to the earlier parent it must wait for."""
+        position = {name: index for index, name in enumerate(order)}
+        waiting_on: dict[str, str] = {}
+        for name, child in self.flext_config.child_entities.items():
+            if (
+                name in position
+                and child.parent in position
+                and position[child.parent] < position[name]
+            ):
+                waiting_on[name] = child.parent
+        return waiting_on
+
+    def _write_initial_state(self) -> None:
+        """Write the input state as the first STATE message, like ``sync_all``."""
+        if not self.state:
+            return
+        writer = next(
+            (
+                stream
+                for stream in self.streams.values()
+                if isinstance(stream, FlextTapOracleWmsStream)
+            ),
+            None,
+        )
+        if writer is not None:
+            writer.write_tap_state()
+
+    def _sync_stream(self, stream: m.Meltano.SingerStreamBase) -> None:
+        """Sync one stream and finalize its state progress markers."""
+        stream.sync()
+        with self._message_lock:
+            stream.finalize_state_progress_markers()
+
     def get_implementation_metrics(self) -> p.Result[t.JsonValue]:
         """Return basic runtime metrics for observability."""
         return r[t.JsonValue].ok({
@@ -321,10 +946,11 @@ class FlextTapOracleWms(m.Meltano.SingerTapBase):
 
     def validate_configuration(self) -> p.Result[t.JsonValue]:
         """Expose non-secret validated configuration fields."""
+        settings = self.flext_config
         return r[t.JsonValue].ok({
-            "base_url": str(self.flext_config.base_url),
-            "api_version": self.flext_config.api_version,
-            "page_size": self.flext_config.page_size,
+            "base_url": str(settings.base_url),
+            "api_version": settings.api_version,
+            "page_size": settings.page_size,
         })
 
     def initialize(self) -> p.Result[bool]:
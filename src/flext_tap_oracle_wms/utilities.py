@@ -14,6 +14,34 @@ from flext_core import FlextUtilitiesConversion
 from flext_meltano import u
 from flext_oracle_wms import FlextOracleWmsUtilities
 from flext_tap_oracle_wms import c, t
+from flext_tap_oracle_wms._utilities.archive import (
+    FlextTapOracleWmsUtilitiesArchive,
+)
+from flext_tap_oracle_wms._utilities.batching import (
+    FlextTapOracleWmsUtilitiesBatching,
+)
+from flext_tap_oracle_wms._utilities.caching import (
+    FlextTapOracleWmsUtilitiesCaching,
+)
+from flext_tap_oracle_wms._utilities.catalog import FlextTapOracleWmsUtilitiesCatalog
+from flext_tap_oracle_wms._utilities.circuit import FlextTapOracleWmsUtilitiesCircuit
+from flext_tap_oracle_wms._utilities.concurrency import (
+    FlextTapOracleWmsUtilitiesConcurrency,
+)
+from flext_tap_oracle_wms._utilities.deletion import (
+    FlextTapOracleWmsUtilitiesDeletion,
+)
+from flext_tap_oracle_wms._utilities.hedging import (
+    FlextTapOracleWmsUtilitiesHedging,
+)
+from flext_tap_oracle_wms._utilities.retry import FlextTapOracleWmsUtilitiesRetry
+from flext_tap_oracle_wms._utilities.scheduling import (
+    FlextTapOracleWmsUtilitiesScheduling,
+)
+from flext_tap_oracle_wms._utilities.schema import FlextTapOracleWmsUtilitiesSchema
+from flext_tap_oracle_wms._utilities.throttling import (
+    FlextTapOracleWmsUtilitiesThrottling,
+)
 
 
 class FlextTapOracleWmsUtilities(u, FlextOracleWmsUtilities, FlextUtilitiesConversion):
@@ -22,7 +50,20 @@ class FlextTapOracleWmsUtilities(u, FlextOracleWmsUtilities, FlextUtilitiesConve
     Inherits from u to avoid duplication.
     """
 
-    class TapOracleWms:
+    class TapOracleWms(
+        FlextTapOracleWmsUtilitiesArchive,
+        FlextTapOracleWmsUtilitiesBatching,
+        FlextTapOracleWmsUtilitiesCaching,
+        FlextTapOracleWmsUtilitiesCatalog,
+        FlextTapOracleWmsUtilitiesCircuit,
+        FlextTapOracleWmsUtilitiesConcurrency,
+        FlextTapOracleWmsUtilitiesDeletion,
+        FlextTapOracleWmsUtilitiesHedging,
+        FlextTapOracleWmsUtilitiesRetry,
+        FlextTapOracleWmsUtilitiesScheduling,
+        FlextTapOracleWmsUtilitiesSchema,
+        FlextTapOracleWmsUtilitiesThrottling,
+    ):
         """Oracle WMS tap utilities namespace."""
 
         class ConfigurationProcessing:
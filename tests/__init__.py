@@ -52,9 +52,15 @@ if TYPE_CHECKING:
         TestsFlextTapOracleWmsModels as TestsFlextTapOracleWmsModels,
         m as m,
     )
+    from tests.performance.test_catalog_performance import (
+        TestsFlextTapOracleWmsCatalogPerformance as TestsFlextTapOracleWmsCatalogPerformance,
+    )
     from tests.performance.test_extraction_performance import (
         TestsFlextTapOracleWmsExtractionPerformance as TestsFlextTapOracleWmsExtractionPerformance,
     )
+    from tests.performance.test_settings_access_performance import (
+        TestsFlextTapOracleWmsSettingsAccessPerformance as TestsFlextTapOracleWmsSettingsAccessPerformance,
+    )
     from tests.protocols import (
         TestsFlextTapOracleWmsProtocols as TestsFlextTapOracleWmsProtocols,
         p as p,
@@ -66,6 +72,24 @@ if TYPE_CHECKING:
         TestsFlextTapOracleWmsTypes as TestsFlextTapOracleWmsTypes,
         t as t,
     )
+    from tests.unit.test_adaptive_concurrency import (
+        TestsFlextTapOracleWmsAdaptiveConcurrency as TestsFlextTapOracleWmsAdaptiveConcurrency,
+    )
+    from tests.unit.test_benchmark_baselines import (
+        TestsFlextTapOracleWmsBenchmarkBaselines as TestsFlextTapOracleWmsBenchmarkBaselines,
+    )
+    from tests.unit.test_catalog_codec import (
+        TestsFlextTapOracleWmsCatalogCodec as TestsFlextTapOracleWmsCatalogCodec,
+    )
+    from tests.unit.test_change_probe import (
+        TestsFlextTapOracleWmsChangeProbe as TestsFlextTapOracleWmsChangeProbe,
+    )
+    from tests.unit.test_child_batching import (
+        TestsFlextTapOracleWmsChildBatching as TestsFlextTapOracleWmsChildBatching,
+    )
+    from tests.unit.test_circuit_breaker import (
+        TestsFlextTapOracleWmsCircuitBreaker as TestsFlextTapOracleWmsCircuitBreaker,
+    )
     from tests.unit.test_cli import (
         TestsFlextTapOracleWmsCli as TestsFlextTapOracleWmsCli,
     )
@@ -75,12 +99,63 @@ if TYPE_CHECKING:
     from tests.unit.test_config_validation import (
         TestsFlextTapOracleWmsConfigValidation as TestsFlextTapOracleWmsConfigValidation,
     )
+    from tests.unit.test_delete_detection import (
+        TestsFlextTapOracleWmsDeleteDetection as TestsFlextTapOracleWmsDeleteDetection,
+    )
+    from tests.unit.test_fake_wms_client import (
+        TestsFlextTapOracleWmsFakeWmsClient as TestsFlextTapOracleWmsFakeWmsClient,
+    )
+    from tests.unit.test_incremental_replication import (
+        TestsFlextTapOracleWmsIncrementalReplication as TestsFlextTapOracleWmsIncrementalReplication,
+    )
+    from tests.unit.test_lgfapi_emulator import (
+        TestsFlextTapOracleWmsLgfapiEmulator as TestsFlextTapOracleWmsLgfapiEmulator,
+    )
+    from tests.unit.test_page_checkpoints import (
+        TestsFlextTapOracleWmsPageCheckpoints as TestsFlextTapOracleWmsPageCheckpoints,
+    )
+    from tests.unit.test_page_retry import (
+        TestsFlextTapOracleWmsPageRetry as TestsFlextTapOracleWmsPageRetry,
+    )
+    from tests.unit.test_parallel_sync import (
+        TestsFlextTapOracleWmsParallelSync as TestsFlextTapOracleWmsParallelSync,
+    )
+    from tests.unit.test_rate_limiting import (
+        TestsFlextTapOracleWmsRateLimiting as TestsFlextTapOracleWmsRateLimiting,
+    )
+    from tests.unit.test_record_processing import (
+        TestsFlextTapOracleWmsRecordProcessing as TestsFlextTapOracleWmsRecordProcessing,
+    )
+    from tests.unit.test_related_fields import (
+        TestsFlextTapOracleWmsRelatedFields as TestsFlextTapOracleWmsRelatedFields,
+    )
+    from tests.unit.test_request_hedging import (
+        TestsFlextTapOracleWmsRequestHedging as TestsFlextTapOracleWmsRequestHedging,
+    )
+    from tests.unit.test_response_cache import (
+        TestsFlextTapOracleWmsResponseCache as TestsFlextTapOracleWmsResponseCache,
+    )
+    from tests.unit.test_schema_drift import (
+        TestsFlextTapOracleWmsSchemaDrift as TestsFlextTapOracleWmsSchemaDrift,
+    )
+    from tests.unit.test_snapshot_mode import (
+        TestsFlextTapOracleWmsSnapshotMode as TestsFlextTapOracleWmsSnapshotMode,
+    )
+    from tests.unit.test_stream_scheduling import (
+        TestsFlextTapOracleWmsStreamScheduling as TestsFlextTapOracleWmsStreamScheduling,
+    )
+    from tests.unit.test_synthetic_dataset import (
+        TestsFlextTapOracleWmsSyntheticDataset as TestsFlextTapOracleWmsSyntheticDataset,
+    )
     from tests.unit.test_tap import (
         TestsFlextTapOracleWmsTap as TestsFlextTapOracleWmsTap,
     )
     from tests.unit.test_tap_initialization import (
         TestsFlextTapOracleWmsTapInitialization as TestsFlextTapOracleWmsTapInitialization,
     )
+    from tests.unit.test_wms_archive import (
+        TestsFlextTapOracleWmsArchive as TestsFlextTapOracleWmsArchive,
+    )
     from tests.utilities import (
         TestsFlextTapOracleWmsUtilities as TestsFlextTapOracleWmsUtilities,
         u as u,
@@ -119,9 +194,15 @@ _LAZY_IMPORTS = merge_lazy_imports(
                 "m",
             ),
             ".performance": ("performance",),
+            ".performance.test_catalog_performance": (
+                "TestsFlextTapOracleWmsCatalogPerformance",
+            ),
             ".performance.test_extraction_performance": (
                 "TestsFlextTapOracleWmsExtractionPerformance",
             ),
+            ".performance.test_settings_access_performance": (
+                "TestsFlextTapOracleWmsSettingsAccessPerformance",
+            ),
             ".protocols": (
                 "TestsFlextTapOracleWmsProtocols",
                 "p",
@@ -132,13 +213,42 @@ _LAZY_IMPORTS = merge_lazy_imports(
                 "t",
             ),
             ".unit": ("unit",),
+            ".unit.test_adaptive_concurrency": (
+                "TestsFlextTapOracleWmsAdaptiveConcurrency",
+            ),
+            ".unit.test_benchmark_baselines": (
+                "TestsFlextTapOracleWmsBenchmarkBaselines",
+            ),
+            ".unit.test_catalog_codec": ("TestsFlextTapOracleWmsCatalogCodec",),
+            ".unit.test_change_probe": ("TestsFlextTapOracleWmsChangeProbe",),
+            ".unit.test_child_batching": ("TestsFlextTapOracleWmsChildBatching",),
+            ".unit.test_circuit_breaker": ("TestsFlextTapOracleWmsCircuitBreaker",),
             ".unit.test_cli": ("TestsFlextTapOracleWmsCli",),
             ".unit.test_config": ("TestsFlextTapOracleWmsConfig",),
             ".unit.test_config_validation": ("TestsFlextTapOracleWmsConfigValidation",),
+            ".unit.test_delete_detection": ("TestsFlextTapOracleWmsDeleteDetection",),
+            ".unit.test_fake_wms_client": ("TestsFlextTapOracleWmsFakeWmsClient",),
+            ".unit.test_incremental_replication": (
+                "TestsFlextTapOracleWmsIncrementalReplication",
+            ),
+            ".unit.test_lgfapi_emulator": ("TestsFlextTapOracleWmsLgfapiEmulator",),
+            ".unit.test_page_checkpoints": ("TestsFlextTapOracleWmsPageCheckpoints",),
+            ".unit.test_page_retry": ("TestsFlextTapOracleWmsPageRetry",),
+            ".unit.test_parallel_sync": ("TestsFlextTapOracleWmsParallelSync",),
+            ".unit.test_rate_limiting": ("TestsFlextTapOracleWmsRateLimiting",),
+            ".unit.test_record_processing": ("TestsFlextTapOracleWmsRecordProcessing",),
+            ".unit.test_related_fields": ("TestsFlextTapOracleWmsRelatedFields",),
+            ".unit.test_request_hedging": ("TestsFlextTapOracleWmsRequestHedging",),
+            ".unit.test_response_cache": ("TestsFlextTapOracleWmsResponseCache",),
+            ".unit.test_schema_drift": ("TestsFlextTapOracleWmsSchemaDrift",),
+            ".unit.test_snapshot_mode": ("TestsFlextTapOracleWmsSnapshotMode",),
+            ".unit.test_stream_scheduling": ("TestsFlextTapOracleWmsStreamScheduling",),
+            ".unit.test_synthetic_dataset": ("TestsFlextTapOracleWmsSyntheticDataset",),
             ".unit.test_tap": ("TestsFlextTapOracleWmsTap",),
             ".unit.test_tap_initialization": (
                 "TestsFlextTapOracleWmsTapInitialization",
             ),
+            ".unit.test_wms_archive": ("TestsFlextTapOracleWmsArchive",),
             ".utilities": (
                 "TestsFlextTapOracleWmsUtilities",
                 "u",
@@ -0,0 +1,111 @@
+"""Stored benchmark baselines with a regression tolerance.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from tests.typings import t
+
+
+class TestsFlextTapOracleWmsUtilitiesBenchmark:
+    """Benchmark baseline mixin composed into ``u.TapOracleWms``."""
+
+    class BenchmarkBaselines:
+        """Named measurements compared with values stored in a JSON file.
+
+        Each entry keeps the value, its unit and whether higher is better.
+        A measurement regresses when it is worse than the stored value by
+        more than ``tolerance`` (a fraction of the baseline). With
+        ``update`` set, measurements replace the stored values instead;
+        otherwise a measurement without a stored baseline fails, so an
+        unrecorded benchmark cannot pass unchecked.
+        """
+
+        def __init__(
+            self,
+            path: Path,
+            *,
+            tolerance: float = 0.3,
+            update: bool = False,
+        ) -> None:
+            """Compare against, or with ``update`` rewrite, the file at ``path``."""
+            self.path = path
+            self.tolerance = tolerance
+            self.update = update
+            self._lock = threading.Lock()
+
+        def regression(
+            self,
+            name: str,
+            value: float,
+            *,
+            unit: str,
+            higher_is_better: bool,
+        ) -> str | None:
+            """Check one measurement against its baseline.
+
+            Args:
+                name: Benchmark name, the key in the baselines file.
+                value: Measured value.
+                unit: Unit of ``value``, stored alongside it.
+                higher_is_better: True for throughputs, False for costs.
+
+            Returns:
+                A description of the regression or missing baseline, or None
+                when within bounds.
+
+            """
+            with self._lock:
+                stored = self._load()
+                if self.update:
+                    stored[name] = {
+                        "value": value,
+                        "unit": unit,
+                        "higher_is_better": higher_is_better,
+                    }
+                    self._save(stored)
+                    return None
+            entry = stored.get(name)
+            baseline = entry.get("value") if isinstance(entry, Mapping) else None
+            if not isinstance(baseline, (int, float)) or baseline <= 0:
+                return (
+                    f"{name}: no baseline in {self.path.name}; record one with "
+                    "TAP_ORACLE_WMS_UPDATE_BASELINES=1"
+                )
+            if higher_is_better:
+                limit = baseline * (1 - self.tolerance)
+                regressed = value < limit
+            else:
+                limit = baseline * (1 + self.tolerance)
+                regressed = value > limit
+            if not regressed:
+                return None
+            return (
+                f"{name}: {value:.4g} {unit} is worse than the baseline "
+                f"{baseline:.4g} {unit} beyond the {self.tolerance:.0%} tolerance"
+            )
+
+        def _load(self) -> dict[str, t.JsonValue]:
+            try:
+                stored = json.loads(self.path.read_text(encoding="utf-8"))
+            except FileNotFoundError:
+                return {}
+            return dict(stored) if isinstance(stored, Mapping) else {}
+
+        def _save(self, stored: t.JsonMapping) -> None:
+            staging = self.path.with_suffix(f"{self.path.suffix}.tmp")
+            staging.write_text(
+                json.dumps(dict(sorted(stored.items())), indent=2) + "\n",
+                encoding="utf-8",
+            )
+            staging.replace(self.path)
+
+
+__all__: list[str] = ["TestsFlextTapOracleWmsUtilitiesBenchmark"]
@@ -0,0 +1,149 @@
+"""In-memory Oracle WMS client with modeled request latency.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import ClassVar
+
+from flext_tests import r
+
+from tests._utilities.emulator import TestsFlextTapOracleWmsUtilitiesEmulator
+from tests.typings import t
+
+
+class TestsFlextTapOracleWmsUtilitiesClient:
+    """Fake WMS client mixin composed into ``u.TapOracleWms``."""
+
+    class FakeWmsClient(TestsFlextTapOracleWmsUtilitiesEmulator.LgfapiRows):
+        """Drop-in ``OracleWms.Client`` answering from in-memory rows.
+
+        ``get_entity_data`` pages through ``page``/``limit`` and evaluates
+        the remaining filters, ``ordering`` and ``fields`` like the
+        emulator, without HTTP or JSON encoding. Each call first sleeps a
+        delay drawn from its latency distribution with a seeded generator;
+        the total is kept in ``latency_seconds`` so benchmarks can subtract
+        modeled network time from wall time. Unfiltered pages of list
+        entities are sliced directly, so the client adds little to the
+        tap's own cost; callable entities are regenerated on every call.
+        """
+
+        CONTROL_PARAMS: ClassVar[frozenset[str]] = frozenset({
+            "page",
+            "page_size",
+            "fields",
+            "ordering",
+        })
+
+        def __init__(
+            self,
+            entities: t.MappingKV[
+                str,
+                t.SequenceOf[t.JsonMapping] | Callable[[], t.IterableOf[t.JsonMapping]],
+            ],
+            *,
+            relations: t.StrMapping | None = None,
+            latency: Callable[[random.Random], float] | None = None,
+            discovery_latency: Callable[[random.Random], float] | None = None,
+            seed: int = 0,
+        ) -> None:
+            """Serve ``entities`` with per-call latency distributions."""
+            super().__init__(entities, relations)
+            self.latency = latency
+            self.discovery_latency = discovery_latency
+            self.requests = 0
+            self.latency_seconds = 0.0
+            self._random = random.Random(seed)
+            self._lock = threading.Lock()
+
+        @staticmethod
+        def constant(seconds: float) -> Callable[[random.Random], float]:
+            """Latency distribution always returning ``seconds``."""
+            return lambda _: seconds
+
+        @staticmethod
+        def uniform(low: float, high: float) -> Callable[[random.Random], float]:
+            """Latency distribution uniform between ``low`` and ``high``."""
+            return lambda generator: generator.uniform(low, high)
+
+        @staticmethod
+        def lognormal(median: float, sigma: float) -> Callable[[random.Random], float]:
+            """Right-skewed latency distribution around ``median`` seconds."""
+            return lambda generator: generator.lognormvariate(math.log(median), sigma)
+
+        def start(self) -> r[bool]:
+            """Accept the client start performed by the tap."""
+            return r[bool].ok(True)
+
+        def discover_entities(self) -> r[t.StrSequence]:
+            """Return the served entity names."""
+            self._wait(self.discovery_latency)
+            return r[t.StrSequence].ok(list(self.entities))
+
+        def get_entity_data(
+            self,
+            entity_name: str,
+            limit: int = 100,
+            filters: t.ScalarMapping | None = None,
+        ) -> r[t.SequenceOf[t.JsonMapping]]:
+            """Return one page of ``entity_name`` rows.
+
+            Args:
+                entity_name: Served entity.
+                limit: Page size.
+                filters: Page number, lgfapi filters and query parameters.
+
+            Returns:
+                The page rows, or a failure for an unknown entity.
+
+            """
+            self._wait(self.latency)
+            if entity_name not in self.entities:
+                return r[t.SequenceOf[t.JsonMapping]].fail(
+                    f"Unknown entity: {entity_name}",
+                )
+            query = {
+                name: str(value)
+                for name, value in (filters or {}).items()
+                if value is not None
+            }
+            page = max(int(query.get("page", "1")), 1)
+            fields = [name for name in query.get("fields", "").split(",") if name]
+            ordering = [name for name in query.get("ordering", "").split(",") if name]
+            row_filters = {
+                name: value
+                for name, value in query.items()
+                if name not in self.CONTROL_PARAMS
+            }
+            source = self.entities[entity_name]
+            window: t.IterableOf[t.JsonMapping] = (
+                source[(page - 1) * limit : page * limit]
+                if isinstance(source, Sequence) and not row_filters and not ordering
+                else itertools.islice(
+                    self.select(entity_name, row_filters, ordering),
+                    (page - 1) * limit,
+                    page * limit,
+                )
+            )
+            return r[t.SequenceOf[t.JsonMapping]].ok([
+                self._project(row, fields) for row in window
+            ])
+
+        def _wait(self, distribution: Callable[[random.Random], float] | None) -> None:
+            with self._lock:
+                self.requests += 1
+                delay = max(distribution(self._random), 0.0) if distribution else 0.0
+                self.latency_seconds += delay
+            if delay > 0:
+                time.sleep(delay)
+
+
+__all__: list[str] = ["TestsFlextTapOracleWmsUtilitiesClient"]
@@ -0,0 +1,234 @@
+"""Seeded synthetic WMS datasets at production cardinalities and widths.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import bisect
+import gzip
+import itertools
+import json
+import random
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import ClassVar
+
+from tests.typings import t
+
+
+class TestsFlextTapOracleWmsUtilitiesDataset:
+    """Synthetic dataset mixin composed into ``u.TapOracleWms``."""
+
+    class WmsDataset:
+        """Generator of ``item``, ``order_hdr``, ``order_dtl`` and ``allocation``.
+
+        Every order draws from its own generator seeded by ``(seed, order
+        id)``, so any entity can be regenerated in one streaming pass with
+        the same rows and foreign keys every time; nothing beyond the item
+        popularity table is kept in memory. Lines pick items from a Zipf
+        distribution, statuses come from small weighted vocabularies, order
+        creation times spread over ``span_days`` in id order and each row
+        gets ``wide_columns`` extra string attributes.
+        """
+
+        ENTITIES: ClassVar[tuple[str, ...]] = (
+            "item",
+            "order_hdr",
+            "order_dtl",
+            "allocation",
+        )
+        RELATIONS: ClassVar[t.StrMapping] = {
+            "item_id": "item",
+            "order_id": "order_hdr",
+            "order_dtl_id": "order_dtl",
+        }
+        ORDER_STATUSES: ClassVar[tuple[tuple[str, int], ...]] = (
+            ("SHIPPED", 70),
+            ("ALLOCATED", 12),
+            ("PICKED", 8),
+            ("CREATED", 6),
+            ("CANCELLED", 4),
+        )
+        LINE_STATUSES: ClassVar[tuple[tuple[str, int], ...]] = (
+            ("SHIPPED", 75),
+            ("ALLOCATED", 15),
+            ("SHORT", 6),
+            ("CANCELLED", 4),
+        )
+        UOMS: ClassVar[tuple[str, ...]] = ("EA", "CS", "PL")
+        FACILITIES: ClassVar[tuple[str, ...]] = ("DC01", "DC02", "DC03", "DC04")
+
+        def __init__(
+            self,
+            *,
+            orders: int,
+            items: int = 10_000,
+            max_lines_per_order: int = 8,
+            max_allocations_per_line: int = 3,
+            item_skew: float = 1.1,
+            wide_columns: int = 0,
+            start: datetime = datetime(2024, 1, 1, tzinfo=UTC),
+            span_days: int = 365,
+            seed: int = 0,
+        ) -> None:
+            """Describe the dataset; rows are only produced on iteration."""
+            self.orders = orders
+            self.items = items
+            self.max_lines_per_order = max_lines_per_order
+            self.max_allocations_per_line = max_allocations_per_line
+            self.item_skew = item_skew
+            self.wide_columns = wide_columns
+            self.start = start
+            self.span_days = span_days
+            self.seed = seed
+            self._popularity = list(
+                itertools.accumulate(
+                    1.0 / rank**item_skew for rank in range(1, items + 1)
+                ),
+            )
+
+        def rows(self, entity: str) -> Iterator[t.JsonDict]:
+            """Stream the rows of ``entity`` in primary key order.
+
+            Args:
+                entity: One of :attr:`ENTITIES`.
+
+            Returns:
+                Lazily generated rows.
+
+            """
+            if entity == "item":
+                return self._items()
+            if entity not in self.ENTITIES:
+                msg = f"Unknown synthetic entity: {entity}"
+                raise KeyError(msg)
+            depth = self.ENTITIES.index(entity) - 1
+            return (row for order in self._orders(depth) for row in order[depth])
+
+        def entities(self) -> dict[str, Callable[[], Iterator[t.JsonDict]]]:
+            """Return per-entity row factories for ``LgfapiEmulator``."""
+            return {
+                entity: (lambda entity=entity: self.rows(entity))
+                for entity in self.ENTITIES
+            }
+
+        def write(self, directory: Path) -> dict[str, Path]:
+            """Stream every entity to ``<entity>.jsonl.gz`` under ``directory``.
+
+            Returns:
+                Written file per entity.
+
+            """
+            directory.mkdir(parents=True, exist_ok=True)
+            written: dict[str, Path] = {}
+            for entity in self.ENTITIES:
+                path = directory / f"{entity}.jsonl.gz"
+                with gzip.open(path, "wt", encoding="utf-8") as handle:
+                    for row in self.rows(entity):
+                        handle.write(json.dumps(row) + "\n")
+                written[entity] = path
+            return written
+
+        def _items(self) -> Iterator[t.JsonDict]:
+            rng = random.Random(self.seed)
+            for item_id in range(1, self.items + 1):
+                row: t.JsonDict = {
+                    "id": item_id,
+                    "code": f"SKU{item_id:08d}",
+                    "description": f"Item {item_id}",
+                    "uom": rng.choice(self.UOMS),
+                    "unit_weight": round(rng.uniform(0.05, 40.0), 3),
+                    "active": rng.random() > 0.02,
+                }
+                self._widen(row, rng)
+                yield row
+
+        def _orders(
+            self,
+            depth: int,
+        ) -> Iterator[tuple[list[t.JsonDict], list[t.JsonDict], list[t.JsonDict]]]:
+            """Yield ``(header, lines, allocations)`` lists for each order.
+
+            With ``depth`` 0 only headers are generated. Line and allocation
+            ids are assigned in generation order, so they match across passes.
+            """
+            span_seconds = self.span_days * 86_400
+            step = span_seconds / max(self.orders, 1)
+            order_weights = [weight for _, weight in self.ORDER_STATUSES]
+            line_weights = [weight for _, weight in self.LINE_STATUSES]
+            line_id = 0
+            allocation_id = 0
+            for order_id in range(1, self.orders + 1):
+                rng = random.Random((self.seed << 40) | order_id)
+                created = self.start + timedelta(
+                    seconds=(order_id - 1) * step + rng.uniform(0, step),
+                )
+                status = rng.choices(self.ORDER_STATUSES, order_weights)[0][0]
+                header: t.JsonDict = {
+                    "id": order_id,
+                    "order_nbr": f"ORD{order_id:010d}",
+                    "facility_code": rng.choice(self.FACILITIES),
+                    "status": status,
+                    "priority": rng.choices((1, 2, 3), (10, 30, 60))[0],
+                    "create_ts": self._timestamp(created),
+                    "mod_ts": self._timestamp(
+                        created + timedelta(hours=rng.expovariate(1 / 36)),
+                    ),
+                    "ship_date": (
+                        (created + timedelta(days=rng.randint(1, 5))).date().isoformat()
+                        if status == "SHIPPED"
+                        else None
+                    ),
+                }
+                self._widen(header, rng)
+                lines: list[t.JsonDict] = []
+                allocations: list[t.JsonDict] = []
+                line_count = rng.randint(1, self.max_lines_per_order) if depth else 0
+                for line_nbr in range(1, line_count + 1):
+                    line_id += 1
+                    allocation_count = rng.randint(0, self.max_allocations_per_line)
+                    ordered = rng.choices((1, 2, 6, 12, 48), (40, 25, 15, 15, 5))[0]
+                    line: t.JsonDict = {
+                        "id": line_id,
+                        "order_id": order_id,
+                        "line_nbr": line_nbr,
+                        "item_id": self._popular_item(rng),
+                        "ord_qty": ordered,
+                        "status": rng.choices(self.LINE_STATUSES, line_weights)[0][0],
+                        "create_ts": header["create_ts"],
+                        "mod_ts": self._timestamp(
+                            created + timedelta(hours=rng.expovariate(1 / 48)),
+                        ),
+                    }
+                    self._widen(line, rng)
+                    lines.append(line)
+                    for _ in range(allocation_count):
+                        allocation_id += 1
+                        allocations.append({
+                            "id": allocation_id,
+                            "order_dtl_id": line_id,
+                            "item_id": line["item_id"],
+                            "alloc_qty": rng.randint(1, ordered),
+                            "location": f"{rng.choice('ABCDEFGH')}-"
+                            f"{rng.randint(1, 60):02d}-{rng.randint(1, 9)}",
+                            "mod_ts": line["mod_ts"],
+                        })
+                yield [header], lines, allocations
+
+        def _popular_item(self, rng: random.Random) -> int:
+            draw = rng.random() * self._popularity[-1]
+            return bisect.bisect_left(self._popularity, draw) + 1
+
+        def _widen(self, row: t.JsonDict, rng: random.Random) -> None:
+            for index in range(1, self.wide_columns + 1):
+                row[f"attr_{index:03d}"] = f"V{rng.randrange(64):02d}" * 4
+
+        @staticmethod
+        def _timestamp(moment: datetime) -> str:
+            return moment.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+__all__: list[str] = ["TestsFlextTapOracleWmsUtilitiesDataset"]
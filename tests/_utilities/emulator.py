@@ -0,0 +1,403 @@
+"""Local HTTP emulator of the Oracle WMS lgfapi for load and benchmark tests.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import math
+import random
+import threading
+import time
+from collections.abc import Callable, Mapping
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import ClassVar, Self, override
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from tests.typings import t
+
+
+class TestsFlextTapOracleWmsUtilitiesEmulator:
+    """lgfapi emulator mixin composed into ``u.TapOracleWms``."""
+
+    class LgfapiRows:
+        """Row source evaluating lgfapi query parameters over entity rows.
+
+        Entities are row sequences or zero-argument callables returning a
+        fresh row iterable, so generated datasets are streamed rather than
+        held in memory. Supports ``exact``/``__in``/``__gt(e)``/``__lt(e)``/
+        ``__isnull`` filters, ``ordering`` and ``fields`` projection,
+        including ``fk__column`` traversals through ``relations``. Ordering
+        materializes the filtered rows.
+        """
+
+        FILTER_OPERATORS: ClassVar[frozenset[str]] = frozenset({
+            "in",
+            "gt",
+            "gte",
+            "lt",
+            "lte",
+            "isnull",
+        })
+
+        def __init__(
+            self,
+            entities: t.MappingKV[
+                str,
+                t.SequenceOf[t.JsonMapping] | Callable[[], t.IterableOf[t.JsonMapping]],
+            ],
+            relations: t.StrMapping | None = None,
+        ) -> None:
+            """Serve ``entities``, resolving traversals through ``relations``."""
+            self.entities = entities
+            self.relations: t.StrMapping = relations or {}
+            self._related_lock = threading.Lock()
+            self._related: dict[str, dict[str, t.JsonMapping]] = {}
+
+        def select(
+            self,
+            entity: str,
+            filters: t.StrMapping,
+            ordering: t.StrSequence = (),
+        ) -> t.IterableOf[t.JsonMapping]:
+            """Return the rows of ``entity`` matching ``filters``, in order."""
+            rows: t.IterableOf[t.JsonMapping] = (
+                row for row in self._rows(entity) if self._matches(row, filters)
+            )
+            if not ordering:
+                return rows
+            ordered = list(rows)
+            for column in reversed(ordering):
+                name = column.removeprefix("-")
+                ordered.sort(
+                    key=lambda row, name=name: self._sort_key(row.get(name)),
+                    reverse=column.startswith("-"),
+                )
+            return ordered
+
+        def _rows(self, entity: str) -> t.IterableOf[t.JsonMapping]:
+            source = self.entities[entity]
+            return source() if callable(source) else source
+
+        def _matches(self, row: t.JsonMapping, filters: t.StrMapping) -> bool:
+            for name, expected in filters.items():
+                column, _, operator = name.rpartition("__")
+                if operator not in self.FILTER_OPERATORS:
+                    column, operator = name, "exact"
+                value = row.get(column)
+                if operator == "isnull":
+                    if (value is None) != (expected.lower() in {"true", "1"}):
+                        return False
+                    continue
+                if operator == "in":
+                    if str(value) not in expected.split(","):
+                        return False
+                    continue
+                if value is None:
+                    return False
+                actual, bound = self._comparable(value, expected)
+                if not {
+                    "exact": actual == bound,
+                    "gt": actual > bound,
+                    "gte": actual >= bound,
+                    "lt": actual < bound,
+                    "lte": actual <= bound,
+                }[operator]:
+                    return False
+            return True
+
+        @staticmethod
+        def _comparable(
+            value: t.JsonValue,
+            expected: str,
+        ) -> tuple[float, float] | tuple[str, str]:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                try:
+                    return float(value), float(expected)
+                except ValueError:
+                    pass
+            return str(value), expected
+
+        @staticmethod
+        def _sort_key(value: t.JsonValue) -> tuple[int, float, str]:
+            if value is None:
+                return (0, 0.0, "")
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return (1, float(value), "")
+            return (2, 0.0, str(value))
+
+        def _project(self, row: t.JsonMapping, fields: t.StrSequence) -> t.JsonDict:
+            if not fields:
+                return dict(row)
+            projected: t.JsonDict = {}
+            for name in fields:
+                if name in row:
+                    projected[name] = row[name]
+                    continue
+                foreign_key, _, column = name.partition("__")
+                related = self.relations.get(foreign_key)
+                target = (
+                    self._related_row(related, row.get(foreign_key))
+                    if related
+                    else None
+                )
+                projected[name] = target.get(column) if target is not None else None
+            return projected
+
+        def _related_row(
+            self,
+            entity: str,
+            key: t.JsonValue,
+        ) -> t.JsonMapping | None:
+            with self._related_lock:
+                index = self._related.get(entity)
+                if index is None:
+                    index = {str(row.get("id")): row for row in self._rows(entity)}
+                    self._related[entity] = index
+            return index.get(str(key))
+
+    class LgfapiEmulator(LgfapiRows):
+        """Threaded lgfapi stand-in serving entity list, describe and data.
+
+        Data requests evaluate filters, ``ordering`` and ``fields`` as
+        :class:`LgfapiRows` does and support ``page``/``page_size`` paging
+        with result counts and ``page_mode=sequenced`` cursor paging.
+
+        Latency, bandwidth, 429/5xx injection and the page-size cap are
+        configurable; injected failures are drawn from a seeded generator,
+        so a run is reproducible. Paged mode scans the filtered rows to
+        count them; sequenced mode only reads up to the requested page.
+        """
+
+        PATH_PREFIX: ClassVar[str] = "/wms/lgfapi/v10"
+
+        def __init__(
+            self,
+            entities: t.MappingKV[
+                str,
+                t.SequenceOf[t.JsonMapping] | Callable[[], t.IterableOf[t.JsonMapping]],
+            ],
+            *,
+            relations: t.StrMapping | None = None,
+            latency_seconds: float = 0.0,
+            bytes_per_second: float | None = None,
+            throttle_rate: float = 0.0,
+            error_rate: float = 0.0,
+            retry_after_seconds: int = 1,
+            max_page_size: int = 1250,
+            default_page_size: int = 100,
+            seed: int = 0,
+        ) -> None:
+            """Configure the emulated WMS; call :meth:`start` or use ``with``."""
+            super().__init__(entities, relations)
+            self.latency_seconds = latency_seconds
+            self.bytes_per_second = bytes_per_second
+            self.throttle_rate = throttle_rate
+            self.error_rate = error_rate
+            self.retry_after_seconds = retry_after_seconds
+            self.max_page_size = max_page_size
+            self.default_page_size = default_page_size
+            self.requests = 0
+            self.throttled = 0
+            self.errors = 0
+            self._random = random.Random(seed)
+            self._lock = threading.Lock()
+            self._server: ThreadingHTTPServer | None = None
+            self._thread: threading.Thread | None = None
+
+        @property
+        def base_url(self) -> str:
+            """Root URL of the running emulator."""
+            if self._server is None:
+                msg = "Emulator is not running"
+                raise RuntimeError(msg)
+            host, port = self._server.server_address[:2]
+            return f"http://{host!s}:{port}"
+
+        @property
+        def api_url(self) -> str:
+            """URL of the emulated lgfapi version root."""
+            return f"{self.base_url}{self.PATH_PREFIX}"
+
+        def start(self) -> Self:
+            """Serve on an ephemeral localhost port in a daemon thread."""
+            emulator = self
+
+            class Handler(BaseHTTPRequestHandler):
+                def do_GET(self) -> None:
+                    status, headers, body = emulator.handle(self.path)
+                    self.send_response(status)
+                    for name, value in headers.items():
+                        self.send_header(name, value)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+
+                @override
+                def log_message(self, format: str, *args: object) -> None:
+                    del format, args
+
+            self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+            self._server.daemon_threads = True
+            self._thread = threading.Thread(
+                target=self._server.serve_forever,
+                name="lgfapi-emulator",
+                daemon=True,
+            )
+            self._thread.start()
+            return self
+
+        def stop(self) -> None:
+            """Stop serving and release the port."""
+            if self._server is not None:
+                self._server.shutdown()
+                self._server.server_close()
+                self._server = None
+
+        def __enter__(self) -> Self:
+            """Start the emulator for the ``with`` block."""
+            return self.start()
+
+        def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            traceback: TracebackType | None,
+        ) -> None:
+            """Stop the emulator."""
+            self.stop()
+
+        def handle(self, raw_path: str) -> tuple[int, t.StrMapping, bytes]:
+            """Answer one GET request with status, headers and body.
+
+            Args:
+                raw_path: Request path with query string.
+
+            Returns:
+                HTTP status, response headers and encoded JSON body.
+
+            """
+            with self._lock:
+                self.requests += 1
+                draw = self._random.random()
+            if self.latency_seconds > 0:
+                time.sleep(self.latency_seconds)
+            if draw < self.throttle_rate:
+                with self._lock:
+                    self.throttled += 1
+                return self._error(
+                    HTTPStatus.TOO_MANY_REQUESTS,
+                    {"Retry-After": str(self.retry_after_seconds)},
+                )
+            if draw < self.throttle_rate + self.error_rate:
+                with self._lock:
+                    self.errors += 1
+                return self._error(HTTPStatus.SERVICE_UNAVAILABLE, {})
+            url = urlsplit(raw_path)
+            query = dict(parse_qsl(url.query, keep_blank_values=True))
+            parts = url.path.removeprefix(self.PATH_PREFIX).strip("/").split("/")
+            if parts == ["entity"]:
+                payload: t.JsonValue = {
+                    name: f"{self.api_url}/entity/{name}/" for name in self.entities
+                }
+            elif len(parts) == 3 and parts[0] == "entity" and parts[2] == "describe":
+                if parts[1] not in self.entities:
+                    return self._error(HTTPStatus.NOT_FOUND, {})
+                payload = self._describe(parts[1])
+            elif len(parts) == 2 and parts[0] == "entity":
+                if parts[1] not in self.entities:
+                    return self._error(HTTPStatus.NOT_FOUND, {})
+                payload = self._data(parts[1], query)
+            else:
+                return self._error(HTTPStatus.NOT_FOUND, {})
+            body = json.dumps(payload, default=str).encode("utf-8")
+            if self.bytes_per_second:
+                time.sleep(len(body) / self.bytes_per_second)
+            return HTTPStatus.OK, {"Content-Type": "application/json"}, body
+
+        def _describe(self, entity: str) -> t.JsonDict:
+            sample = next(iter(self._rows(entity)), {})
+            return {
+                "fields": {
+                    column: {"type": type(value).__name__}
+                    for column, value in sample.items()
+                },
+            }
+
+        def _data(self, entity: str, query: t.StrMapping) -> t.JsonDict:
+            page_size = min(
+                int(query.get("page_size", self.default_page_size)),
+                self.max_page_size,
+            )
+            fields = [name for name in query.get("fields", "").split(",") if name]
+            ordering = [name for name in query.get("ordering", "").split(",") if name]
+            control = {"page", "page_size", "page_mode", "cursor", "fields", "ordering"}
+            filters = {
+                name: value for name, value in query.items() if name not in control
+            }
+            rows = self.select(entity, filters, ordering)
+            link_query = {
+                name: value for name, value in query.items() if name != "cursor"
+            }
+            if query.get("page_mode") == "sequenced":
+                offset = int(query.get("cursor", "0"))
+                window = list(itertools.islice(rows, offset, offset + page_size + 1))
+                more = len(window) > page_size
+                return {
+                    "next_page": (
+                        self._link(entity, {**link_query, "cursor": offset + page_size})
+                        if more
+                        else None
+                    ),
+                    "results": [
+                        self._project(row, fields) for row in window[:page_size]
+                    ],
+                }
+            page = max(int(query.get("page", "1")), 1)
+            offset = (page - 1) * page_size
+            results: list[t.JsonDict] = []
+            count = 0
+            for row in rows:
+                if offset <= count < offset + page_size:
+                    results.append(self._project(row, fields))
+                count += 1
+            page_count = math.ceil(count / page_size) if count else 0
+            return {
+                "result_count": count,
+                "page_count": page_count,
+                "page_nbr": page,
+                "next_page": (
+                    self._link(entity, {**link_query, "page": page + 1})
+                    if page < page_count
+                    else None
+                ),
+                "previous_page": (
+                    self._link(entity, {**link_query, "page": page - 1})
+                    if page > 1
+                    else None
+                ),
+                "results": results,
+            }
+
+        def _link(self, entity: str, query: Mapping[str, str | int]) -> str:
+            return f"{self.api_url}/entity/{entity}/?{urlencode(query)}"
+
+        @staticmethod
+        def _error(
+            status: HTTPStatus,
+            headers: t.StrMapping,
+        ) -> tuple[int, t.StrMapping, bytes]:
+            body = json.dumps({"detail": status.phrase}).encode("utf-8")
+            return (
+                status,
+                {**headers, "Content-Type": "application/json"},
+                body,
+            )
+
+
+__all__: list[str] = ["TestsFlextTapOracleWmsUtilitiesEmulator"]
@@ -8,14 +8,15 @@ SPDX-License-Identifier: MIT
 from __future__ import annotations
 
 import os
-from collections.abc import Generator
+from collections.abc import Callable, Generator
 from pathlib import Path
-from unittest.mock import patch as _patch
+from unittest.mock import MagicMock, patch as _patch
 
 import pytest
-from flext_tests import reset_settings as _shared_reset_settings
+from flext_tests import r, reset_settings as _shared_reset_settings
 
 from flext_tap_oracle_wms.settings import FlextTapOracleWmsSettings
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
 from flext_tap_oracle_wms.tap import FlextTapOracleWms
 from tests.typings import t
 
@@ -88,6 +89,66 @@ def tap_instance(sample_config: FlextTapOracleWmsSettings) -> FlextTapOracleWms:
         return FlextTapOracleWms(settings=sample_config.model_dump(mode="json"))
 
 
+@pytest.fixture
+def tap_factory() -> Callable[..., FlextTapOracleWms]:
+    """Build taps on the test WMS settings (mocked discovery).
+
+    Keyword arguments override or extend the settings; ``state`` is passed
+    to the tap as its input state.
+    """
+
+    def build(
+        *,
+        state: t.StrMapping | None = None,
+        **overrides: t.JsonValue,
+    ) -> FlextTapOracleWms:
+        with _patch.object(FlextTapOracleWms, "discover_streams", return_value=[]):
+            return FlextTapOracleWms(
+                settings={
+                    "base_url": "https://test.wms.example.com",
+                    "username": "test_user",
+                    "password": "test_password",
+                    **overrides,
+                },
+                state=state,
+            )
+
+    return build
+
+
+@pytest.fixture
+def stream_factory() -> Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]]:
+    """Build streams of a tap whose page requests go to a mock WMS client.
+
+    ``pages`` is the side effect of the client's ``get_entity_data``: a
+    sequence of results returned in turn, or a callable taking the request
+    keywords. The stream and its client are returned together.
+    """
+
+    def build(
+        tap: FlextTapOracleWms,
+        pages: (
+            t.SequenceOf[r[t.SequenceOf[t.JsonMapping]]]
+            | Callable[..., r[t.SequenceOf[t.JsonMapping]]]
+        ),
+        name: str = "item",
+        *,
+        replication_key: str | None = None,
+    ) -> tuple[FlextTapOracleWmsStream, MagicMock]:
+        client = MagicMock()
+        client.get_entity_data.side_effect = pages
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name=name,
+            schema={"type": "object"},
+            replication_key=replication_key,
+            client=client,
+        )
+        return stream, client
+
+    return build
+
+
 @pytest.fixture
 def real_tap_instance(real_config: FlextTapOracleWmsSettings) -> FlextTapOracleWms:
     """Real tap instance for integration tests."""
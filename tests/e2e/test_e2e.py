@@ -172,10 +172,10 @@ class TestsFlextTapOracleWmsE2e:
         yesterday = datetime.now(UTC) - timedelta(days=1)
         context = {"replication_key_value": yesterday.isoformat()}
         params = stream._build_operation_kwargs(page=1, context=context)
-        kwargs_filter = params.get("filter")
-        assert kwargs_filter is not None and (
-            ">=" in str(kwargs_filter) or ">" in str(kwargs_filter)
-        ), f"No timestamp filters in incremental stream: {list(params.keys())}"
+        kwargs_filter = params.get(f"{stream.replication_key}__gte")
+        assert kwargs_filter is not None, (
+            f"No timestamp filters in incremental stream: {list(params.keys())}"
+        )
         logger.info("✅ Incremental extraction workflow validated for %s", stream.name)
 
     @pytest.mark.skip(
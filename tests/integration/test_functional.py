@@ -321,8 +321,8 @@ class TestsFlextTapOracleWmsFunctional:
         )
         context = {"replication_key_value": "2024-01-01T00:00:00Z"}
         url_params = stream._build_operation_kwargs(page=1, context=context)
-        kwargs_filter = url_params.get("filter")
-        if kwargs_filter and (">=" in str(kwargs_filter) or "<" in str(kwargs_filter)):
+        kwargs_filter = url_params.get(f"{stream.replication_key}__gte")
+        if kwargs_filter:
             logger.info(f"✅ Timestamp filters applied: {kwargs_filter}")
         if "ordering" in url_params:
             ordering = url_params["ordering"]
@@ -258,10 +258,10 @@ class TestsFlextTapOracleWmsStreamsFunctional:
             pytest.skip("No incremental streams found")
         context = {"replication_key_value": "2024-01-01T00:00:00Z"}
         params = incremental_stream._build_operation_kwargs(page=1, context=context)
-        kwargs_filter = params.get("filter")
-        assert kwargs_filter and (
-            ">=" in str(kwargs_filter) or ">" in str(kwargs_filter)
-        ), f"No timestamp filters found in params: {list(params.keys())}"
+        kwargs_filter = params.get(f"{incremental_stream.replication_key}__gte")
+        assert kwargs_filter, (
+            f"No timestamp filters found in params: {list(params.keys())}"
+        )
         for filter_value in [str(kwargs_filter)]:
             assert isinstance(filter_value, str), (
                 f"Filter value must be string: {filter_value}"
@@ -7,9 +7,13 @@ from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 _LAZY_IMPORTS = build_lazy_import_map(
     {
+        ".test_catalog_performance": ("TestsFlextTapOracleWmsCatalogPerformance",),
         ".test_extraction_performance": (
             "TestsFlextTapOracleWmsExtractionPerformance",
         ),
+        ".test_settings_access_performance": (
+            "TestsFlextTapOracleWmsSettingsAccessPerformance",
+        ),
         "flext_tests": (
             "c",
             "d",
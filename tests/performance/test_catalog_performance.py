@@ -0,0 +1,90 @@
+"""Benchmarks for loading and writing very large Singer catalogs.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import time
+import tracemalloc
+
+import pytest
+
+from tests.typings import t
+from tests.utilities import u
+
+_ENTITY_COUNT = 1_000
+_COLUMNS_PER_ENTITY = 150
+
+
+@pytest.fixture(scope="module")
+def synthetic_catalog() -> t.JsonDict:
+    """Build a synthetic catalog with 1000 wide entity schemas."""
+    streams: t.JsonList = []
+    for index in range(_ENTITY_COUNT):
+        name = f"entity_{index:04d}"
+        properties: t.JsonDict = {
+            f"column_{column:03d}": {"type": ["null", "string"], "maxLength": 255}
+            for column in range(_COLUMNS_PER_ENTITY)
+        }
+        streams.append({
+            "tap_stream_id": name,
+            "stream": name,
+            "schema": {"type": "object", "properties": properties},
+            "metadata": [
+                {
+                    "breadcrumb": [],
+                    "metadata": {
+                        "inclusion": "available",
+                        "forced-replication-method": "FULL_TABLE",
+                        "table-key-properties": ["id"],
+                    },
+                },
+            ],
+            "key_properties": ["id"],
+        })
+    return {"streams": streams}
+
+
+@pytest.mark.performance
+class TestsFlextTapOracleWmsCatalogPerformance:
+    """Catalog load and write cost must scale with stream count only."""
+
+    def test_load_1000_entity_catalog(self, synthetic_catalog: t.JsonDict) -> None:
+        """Loading 1000 wide entities stays well below a second."""
+        started = time.perf_counter()
+        catalog = u.TapOracleWms.CatalogCodec.load(synthetic_catalog)
+        elapsed = time.perf_counter() - started
+        streams = catalog["streams"]
+        assert isinstance(streams, list)
+        assert len(streams) == _ENTITY_COUNT
+        assert elapsed < 0.5
+
+    def test_load_does_not_copy_schemas(self, synthetic_catalog: t.JsonDict) -> None:
+        """Peak memory of loading is a small fraction of the schema payload."""
+        payload_size = len(json.dumps(synthetic_catalog))
+        tracemalloc.start()
+        try:
+            _ = u.TapOracleWms.CatalogCodec.load(synthetic_catalog)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < payload_size / 10
+
+    def test_write_1000_entity_catalog(self, synthetic_catalog: t.JsonDict) -> None:
+        """Writing streams entries and produces an equivalent catalog."""
+        buffer = io.StringIO()
+        started = time.perf_counter()
+        written = u.TapOracleWms.CatalogCodec.write(
+            u.TapOracleWms.CatalogCodec.iter_entries(synthetic_catalog),
+            buffer,
+        )
+        elapsed = time.perf_counter() - started
+        assert written == _ENTITY_COUNT
+        assert elapsed < 2.0
+        reloaded = json.loads(buffer.getvalue())
+        assert len(reloaded["streams"]) == _ENTITY_COUNT
@@ -0,0 +1,79 @@
+"""Micro-benchmarks for settings access on the record hot path.
+
+Copyright (c) 2025 FLEXT Team. All rights reserved.
+SPDX-License-Identifier: MIT
+
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from unittest.mock import patch
+
+import pytest
+
+from flext_tap_oracle_wms.settings import FlextTapOracleWmsSettings
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+
+_ITERATIONS = 2_000
+
+
+def _elapsed(action: Callable[[], object], iterations: int = _ITERATIONS) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        action()
+    return time.perf_counter() - started
+
+
+@pytest.fixture
+def tap(tap_factory: Callable[..., FlextTapOracleWms]) -> FlextTapOracleWms:
+    """Create a tap with column mappings that exercise post-processing."""
+    return tap_factory(
+        column_mappings={"inventory": {"qty": "quantity"}},
+        ignored_columns=["internal_note"],
+    )
+
+
+@pytest.mark.performance
+class TestsFlextTapOracleWmsSettingsAccessPerformance:
+    """Settings snapshot access must not re-validate configuration."""
+
+    def test_flext_config_access_is_cheaper_than_validation(
+        self,
+        tap: FlextTapOracleWms,
+    ) -> None:
+        """Memoized access is at least an order of magnitude below validation."""
+        raw_settings = dict(tap.settings)
+        validation = _elapsed(
+            lambda: FlextTapOracleWmsSettings.model_validate(raw_settings),
+        )
+        memoized = _elapsed(lambda: tap.flext_config)
+        assert memoized * 10 < validation
+
+    def test_post_process_does_not_revalidate_settings(
+        self,
+        tap: FlextTapOracleWms,
+    ) -> None:
+        """Per-record post-processing reuses the resolved record plan."""
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="inventory",
+            schema={"type": "object"},
+        )
+        with patch.object(
+            stream,
+            "_build_record_plan",
+            wraps=stream._build_record_plan,
+        ) as build_plan:
+            _elapsed(
+                lambda: stream.post_process({
+                    "id": 1,
+                    "qty": 5,
+                    "internal_note": "x",
+                }),
+            )
+        assert build_plan.call_count == 1
+        row = stream.post_process({"id": 1, "qty": 5, "internal_note": "x"})
+        assert row == {"id": 1, "quantity": 5}
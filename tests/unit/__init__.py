@@ -7,11 +7,36 @@ from flext_core.lazy import build_lazy_import_map, install_lazy_exports
 
 _LAZY_IMPORTS = build_lazy_import_map(
     {
+        ".test_adaptive_concurrency": ("TestsFlextTapOracleWmsAdaptiveConcurrency",),
+        ".test_benchmark_baselines": ("TestsFlextTapOracleWmsBenchmarkBaselines",),
+        ".test_catalog_codec": ("TestsFlextTapOracleWmsCatalogCodec",),
+        ".test_change_probe": ("TestsFlextTapOracleWmsChangeProbe",),
+        ".test_child_batching": ("TestsFlextTapOracleWmsChildBatching",),
+        ".test_circuit_breaker": ("TestsFlextTapOracleWmsCircuitBreaker",),
         ".test_cli": ("TestsFlextTapOracleWmsCli",),
         ".test_config": ("TestsFlextTapOracleWmsConfig",),
         ".test_config_validation": ("TestsFlextTapOracleWmsConfigValidation",),
+        ".test_delete_detection": ("TestsFlextTapOracleWmsDeleteDetection",),
+        ".test_fake_wms_client": ("TestsFlextTapOracleWmsFakeWmsClient",),
+        ".test_incremental_replication": (
+            "TestsFlextTapOracleWmsIncrementalReplication",
+        ),
+        ".test_lgfapi_emulator": ("TestsFlextTapOracleWmsLgfapiEmulator",),
+        ".test_page_checkpoints": ("TestsFlextTapOracleWmsPageCheckpoints",),
+        ".test_page_retry": ("TestsFlextTapOracleWmsPageRetry",),
+        ".test_parallel_sync": ("TestsFlextTapOracleWmsParallelSync",),
+        ".test_rate_limiting": ("TestsFlextTapOracleWmsRateLimiting",),
+        ".test_record_processing": ("TestsFlextTapOracleWmsRecordProcessing",),
+        ".test_related_fields": ("TestsFlextTapOracleWmsRelatedFields",),
+        ".test_request_hedging": ("TestsFlextTapOracleWmsRequestHedging",),
+        ".test_response_cache": ("TestsFlextTapOracleWmsResponseCache",),
+        ".test_schema_drift": ("TestsFlextTapOracleWmsSchemaDrift",),
+        ".test_snapshot_mode": ("TestsFlextTapOracleWmsSnapshotMode",),
+        ".test_stream_scheduling": ("TestsFlextTapOracleWmsStreamScheduling",),
+        ".test_synthetic_dataset": ("TestsFlextTapOracleWmsSyntheticDataset",),
         ".test_tap": ("TestsFlextTapOracleWmsTap",),
         ".test_tap_initialization": ("TestsFlextTapOracleWmsTapInitialization",),
+        ".test_wms_archive": ("TestsFlextTapOracleWmsArchive",),
         "flext_tests": (
             "c",
             "d",
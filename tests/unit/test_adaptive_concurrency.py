@@ -0,0 +1,109 @@
+"""Unit tests for AIMD adaptive page request concurrency."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+def _settle(
+    limiter: u.TapOracleWms.AdaptiveConcurrency,
+    latency: float,
+    *,
+    overloaded: bool = False,
+    retry_after: float | None = None,
+) -> None:
+    limiter.acquire()
+    limiter.release(latency, overloaded=overloaded, retry_after=retry_after)
+
+
+class TestsFlextTapOracleWmsAdaptiveConcurrency:
+    """Validate the AIMD limiter and concurrent page fetching."""
+
+    def test_additive_increase_is_capped(self) -> None:
+        """Healthy responses grow the limit up to ``max_limit``."""
+        limiter = u.TapOracleWms.AdaptiveConcurrency(4)
+        assert limiter.limit == 1
+        for _ in range(20):
+            _settle(limiter, 0.1)
+        assert limiter.limit == 4
+
+    def test_overload_and_latency_spike_decrease(self) -> None:
+        """429/503 responses and latency spikes shrink the limit."""
+        limiter = u.TapOracleWms.AdaptiveConcurrency(8)
+        for _ in range(40):
+            _settle(limiter, 0.1)
+        assert limiter.limit == 8
+        _settle(limiter, 0.1, overloaded=True)
+        assert limiter.limit == 4
+        _settle(limiter, 1.0)
+        assert limiter.limit == 2
+        metrics = limiter.metrics()
+        assert metrics.overloads == 2
+        assert metrics.max_limit == 8
+        assert metrics.in_flight == 0
+        assert metrics.max_in_flight == 1
+
+    def test_retry_after_pauses_new_requests(self) -> None:
+        """A Retry-After holds back the next request until it elapses."""
+        limiter = u.TapOracleWms.AdaptiveConcurrency(2)
+        _settle(limiter, 0.1, overloaded=True, retry_after=0.2)
+        started = time.monotonic()
+        limiter.acquire()
+        assert time.monotonic() - started >= 0.15
+        assert limiter.limit == 1
+
+    def test_overload_signal_parsing(self) -> None:
+        """Status codes and Retry-After are read from client error text."""
+        signal = u.TapOracleWms.AdaptiveConcurrency.overload_signal
+        assert signal("HTTP 429 Too Many Requests; Retry-After: 30") == (True, 30.0)
+        assert signal("503 Service Unavailable") == (True, None)
+        assert signal("HTTP 404 Not Found") == (False, None)
+
+    def test_invalid_limits_are_rejected(self) -> None:
+        """The minimum limit must fit under the maximum."""
+        with pytest.raises(ValueError, match="min_limit"):
+            u.TapOracleWms.AdaptiveConcurrency(2, min_limit=3)
+
+    def test_concurrent_pages_keep_order(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Pages fetched ahead are yielded in page order up to the last page."""
+        tap = tap_factory(page_size=2, max_concurrent_page_requests=3)
+
+        def page_data(
+            entity_name: str,
+            limit: int,
+            filters: t.JsonMapping,
+        ) -> r[t.SequenceOf[t.JsonMapping]]:
+            _ = entity_name
+            page = int(str(filters["page"]))
+            size = limit if page < 4 else 1
+            first = (page - 1) * limit
+            return r[t.SequenceOf[t.JsonMapping]].ok([
+                {"id": first + offset} for offset in range(size if page <= 4 else 0)
+            ])
+
+        client = MagicMock()
+        client.get_entity_data.side_effect = page_data
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="item",
+            schema={"type": "object"},
+            client=client,
+        )
+        ids = [row["id"] for row in stream.get_records(context=None)]
+        assert ids == list(range(7))
+        limiter = tap.page_concurrency
+        assert limiter is not None
+        assert limiter.metrics().in_flight == 0
@@ -0,0 +1,61 @@
+"""Unit tests for stored benchmark baselines and regression checks."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from tests.utilities import u
+
+
+class TestsFlextTapOracleWmsBenchmarkBaselines:
+    """Validate baseline recording and tolerance-bounded comparisons."""
+
+    def test_missing_baseline_fails(self, tmp_path: Path) -> None:
+        """Without a stored value a measurement fails unless it is recorded."""
+        path = tmp_path / "baselines.json"
+        baselines = u.TapOracleWms.BenchmarkBaselines(path)
+        missing = baselines.regression("x", 9.0, unit="s", higher_is_better=False)
+        assert missing is not None
+        assert "no baseline" in missing
+        recorder = u.TapOracleWms.BenchmarkBaselines(path, update=True)
+        assert recorder.regression("x", 9.0, unit="s", higher_is_better=False) is None
+        assert baselines.regression("x", 9.0, unit="s", higher_is_better=False) is None
+
+    def test_update_records_measurements(self, tmp_path: Path) -> None:
+        """Update mode stores value, unit and direction per benchmark."""
+        path = tmp_path / "baselines.json"
+        baselines = u.TapOracleWms.BenchmarkBaselines(path, update=True)
+        baselines.regression("rps", 100.0, unit="records/s", higher_is_better=True)
+        assert json.loads(path.read_text(encoding="utf-8")) == {
+            "rps": {"value": 100.0, "unit": "records/s", "higher_is_better": True},
+        }
+
+    def test_regressions_beyond_tolerance_are_reported(self, tmp_path: Path) -> None:
+        """Only measurements worse than the tolerance allows are reported."""
+        path = tmp_path / "baselines.json"
+        recorder = u.TapOracleWms.BenchmarkBaselines(path, update=True)
+        recorder.regression("cost", 1.0, unit="s", higher_is_better=False)
+        recorder.regression("rps", 100.0, unit="records/s", higher_is_better=True)
+        baselines = u.TapOracleWms.BenchmarkBaselines(path, tolerance=0.3)
+        assert (
+            baselines.regression("cost", 1.2, unit="s", higher_is_better=False) is None
+        )
+        assert (
+            baselines.regression(
+                "rps",
+                80.0,
+                unit="records/s",
+                higher_is_better=True,
+            )
+            is None
+        )
+        slower = baselines.regression("cost", 1.4, unit="s", higher_is_better=False)
+        assert slower is not None
+        assert "30% tolerance" in slower
+        assert baselines.regression(
+            "rps",
+            60.0,
+            unit="records/s",
+            higher_is_better=True,
+        )
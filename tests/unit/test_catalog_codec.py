@@ -0,0 +1,121 @@
+"""Unit tests for the single-pass Singer catalog codec."""
+
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+class TestsFlextTapOracleWmsCatalogCodec:
+    """Validate catalog normalization and incremental writing."""
+
+    @staticmethod
+    def _raw_catalog() -> t.JsonDict:
+        return {
+            "streams": [
+                {
+                    "stream": "inventory",
+                    "schema": {
+                        "type": "object",
+                        "properties": {"id": {"type": "integer"}},
+                    },
+                    "metadata": [
+                        {
+                            "breadcrumb": [],
+                            "metadata": {"inclusion": "available"},
+                        },
+                        "not-a-mapping",
+                    ],
+                    "key_properties": ["id"],
+                    "replication_method": "FULL_TABLE",
+                },
+                "not-a-stream",
+            ],
+        }
+
+    def test_load_normalizes_skeleton_without_copying_schema(self) -> None:
+        """Entries get canonical keys while schema bodies are shared."""
+        raw = self._raw_catalog()
+        catalog = u.TapOracleWms.CatalogCodec.load(raw)
+        streams = catalog["streams"]
+        assert isinstance(streams, list)
+        assert len(streams) == 1
+        entry = streams[0]
+        assert isinstance(entry, dict)
+        assert entry["tap_stream_id"] == "inventory"
+        assert entry["metadata"] == [
+            {"breadcrumb": [], "metadata": {"inclusion": "available"}},
+        ]
+        assert entry["key_properties"] == ["id"]
+        assert entry["replication_method"] == "FULL_TABLE"
+        raw_streams = raw["streams"]
+        assert isinstance(raw_streams, list)
+        raw_entry = raw_streams[0]
+        assert isinstance(raw_entry, dict)
+        assert entry["schema"] is raw_entry["schema"]
+
+    def test_load_keeps_top_level_keys(self) -> None:
+        """Keys other than ``streams``, such as ``type``, survive loading."""
+        catalog = u.TapOracleWms.CatalogCodec.load({
+            "type": "CATALOG",
+            **self._raw_catalog(),
+        })
+        assert catalog["type"] == "CATALOG"
+        assert isinstance(catalog["streams"], list)
+
+    @pytest.mark.parametrize("chunk_chars", [1, 7, 1 << 16])
+    def test_read_file_decodes_entries_incrementally(
+        self,
+        tmp_path: Path,
+        chunk_chars: int,
+    ) -> None:
+        """Entries split across read chunks decode like a whole-file load."""
+        path = tmp_path / "catalog.json"
+        path.write_text(
+            json.dumps({
+                "type": "CATALOG",
+                **self._raw_catalog(),
+                "version": 10,
+            }),
+            encoding="utf-8",
+        )
+        codec = u.TapOracleWms.CatalogCodec
+        with patch.object(codec, "READ_CHUNK_CHARS", chunk_chars):
+            entries = list(codec.read_file(path))
+        assert entries == list(codec.iter_entries(self._raw_catalog()))
+
+    def test_read_file_rejects_truncated_catalog(self, tmp_path: Path) -> None:
+        """A catalog cut off inside ``streams`` fails instead of ending early."""
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(self._raw_catalog())[:-3], encoding="utf-8")
+        with pytest.raises(json.JSONDecodeError):
+            list(u.TapOracleWms.CatalogCodec.read_file(path))
+
+    def test_write_round_trips_through_json(self) -> None:
+        """Incremental writer emits one valid JSON catalog document."""
+        buffer = io.StringIO()
+        entries = u.TapOracleWms.CatalogCodec.iter_entries(self._raw_catalog())
+        written = u.TapOracleWms.CatalogCodec.write(entries, buffer)
+        assert written == 1
+        assert json.loads(buffer.getvalue()) == u.TapOracleWms.CatalogCodec.load(
+            self._raw_catalog(),
+        )
+
+    def test_write_empty_catalog(self) -> None:
+        """An empty entry iterable still produces a valid catalog."""
+        buffer = io.StringIO()
+        assert u.TapOracleWms.CatalogCodec.write([], buffer) == 0
+        assert json.loads(buffer.getvalue()) == {"streams": []}
+
+    def test_tap_to_typed_catalog_uses_codec(self) -> None:
+        """Tap catalog conversion delegates to the single-pass codec."""
+        catalog = FlextTapOracleWms._to_typed_catalog(self._raw_catalog())
+        assert catalog == u.TapOracleWms.CatalogCodec.load(self._raw_catalog())
@@ -0,0 +1,106 @@
+"""Unit tests for skipping unchanged full-table streams by change probe."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+
+
+def _run(
+    tap_factory: Callable[..., FlextTapOracleWms],
+    history_path: Path,
+    rows: list[t.JsonMapping],
+    replication_key: str | None = None,
+) -> tuple[list[t.JsonDict], MagicMock]:
+    tap = tap_factory(run_history_path=str(history_path), skip_unchanged_streams=True)
+
+    def _page(
+        entity_name: str,
+        limit: int,
+        filters: t.MutableScalarMapping,
+    ) -> r[t.SequenceOf[t.JsonMapping]]:
+        del entity_name
+        ordering = str(filters.get("ordering", ""))
+        if ordering.startswith("-"):
+            column = ordering[1:]
+            latest = max(rows, key=lambda row: str(row[column]))
+            return r[t.SequenceOf[t.JsonMapping]].ok([{column: latest[column]}][:limit])
+        return r[t.SequenceOf[t.JsonMapping]].ok(rows if filters["page"] == 1 else [])
+
+    client = MagicMock()
+    client.get_entity_data.side_effect = _page
+    stream = FlextTapOracleWmsStream(
+        tap=tap,
+        name="company",
+        schema={"type": "object"},
+        replication_key=replication_key,
+        client=client,
+    )
+    records = list(stream.get_records(context=None))
+    history = tap.run_history
+    assert history is not None
+    history.commit()
+    return records, client
+
+
+class TestsFlextTapOracleWmsChangeProbe:
+    """Validate change probes against the stored run history."""
+
+    def test_unchanged_stream_is_skipped(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """A second run with the same latest values fetches no pages."""
+        history_path = tmp_path / "history.json"
+        rows: list[t.JsonMapping] = [{"id": 1, "mod_ts": "2025-01-01T00:00:00"}]
+        first, _ = _run(tap_factory, history_path, rows)
+        assert len(first) == 1
+        second, client = _run(tap_factory, history_path, rows)
+        assert second == []
+        orderings = [
+            call.kwargs["filters"]["ordering"]
+            for call in client.get_entity_data.call_args_list
+        ]
+        assert orderings == ["-mod_ts", "-id"]
+        assert {
+            call.kwargs["limit"] for call in client.get_entity_data.call_args_list
+        } == {1}
+
+    def test_changed_stream_is_extracted(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """A newer id since the last run triggers a full extraction."""
+        history_path = tmp_path / "history.json"
+        rows: list[t.JsonMapping] = [{"id": 1, "mod_ts": "2025-01-01T00:00:00"}]
+        _run(tap_factory, history_path, rows)
+        changed = [*rows, {"id": 2, "mod_ts": "2025-01-01T00:00:00"}]
+        records, _ = _run(tap_factory, history_path, changed)
+        assert len(records) == 2
+
+    def test_incremental_streams_are_not_probed(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Bookmarked streams already read only changes and skip the probe."""
+        rows: list[t.JsonMapping] = [{"id": 1, "mod_ts": "2025-01-01T00:00:00"}]
+        _, client = _run(
+            tap_factory,
+            tmp_path / "history.json",
+            rows,
+            replication_key="mod_ts",
+        )
+        assert all(
+            not str(call.kwargs["filters"].get("ordering", "")).startswith("-")
+            for call in client.get_entity_data.call_args_list
+        )
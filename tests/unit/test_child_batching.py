@@ -0,0 +1,155 @@
+"""Unit tests for child entity extraction batched by parent keys."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import MagicMock, PropertyMock, patch
+from urllib.parse import quote
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+_CHILDREN: t.JsonMapping = {
+    "order_dtl": {"parent": "order_hdr", "foreign_key": "order_id"},
+}
+
+
+def _rows(rows: list[t.JsonMapping]) -> Callable[..., r[t.SequenceOf[t.JsonMapping]]]:
+    return lambda **_: r[t.SequenceOf[t.JsonMapping]].ok(rows)
+
+
+class TestsFlextTapOracleWmsChildBatching:
+    """Validate parent key collection and ``__in`` filter batching."""
+
+    def test_chunks_stay_within_encoded_length(self) -> None:
+        """Every chunk fits the URL budget and all keys are kept in order."""
+        keys = [f"{index:04d}" for index in range(100)]
+        chunks = u.TapOracleWms.KeyBatching.chunk(keys, 50)
+        assert all(len(quote(chunk, safe="")) <= 50 for chunk in chunks)
+        assert ",".join(chunks).split(",") == keys
+
+    def test_oversized_key_gets_its_own_chunk(self) -> None:
+        """A key longer than the budget is still sent, alone."""
+        chunks = u.TapOracleWms.KeyBatching.chunk(["a", "b" * 20, "c"], 10)
+        assert chunks == ["a", "b" * 20, "c"]
+
+    def test_registry_distinguishes_unextracted_parents(self) -> None:
+        """Keys are handed out only once the parent finished, even if empty."""
+        registry = u.TapOracleWms.ParentKeys()
+        assert registry.collected("order_hdr", "id") is None
+        registry.start("order_hdr", "id")
+        registry.add("order_hdr", "id", "7")
+        assert registry.collected("order_hdr", "id") is None
+        registry.finish("order_hdr", "id")
+        assert registry.collected("order_hdr", "id") == frozenset({"7"})
+        registry.finish("order_dtl", "id")
+        assert registry.collected("order_dtl", "id") == frozenset()
+
+    def test_child_filters_on_parent_keys(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """A child runs one ``__in`` request per batch of emitted parent keys."""
+        tap = tap_factory(child_entities=_CHILDREN, max_in_filter_length=9)
+        parent, _ = stream_factory(
+            tap, _rows([{"id": 1}, {"id": 2}, {"id": 30}]), "order_hdr"
+        )
+        assert len(list(parent.get_records(context=None))) == 3
+        child, client = stream_factory(
+            tap, _rows([{"id": 5, "order_id": 1}]), "order_dtl"
+        )
+        assert len(list(child.get_records(context=None))) == 2
+        batches = [
+            call.kwargs["filters"]["order_id__in"]
+            for call in client.get_entity_data.call_args_list
+        ]
+        assert batches == ["1,2", "30"]
+
+    def test_child_without_changed_parents_makes_no_requests(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """No emitted parent keys means no child requests at all."""
+        tap = tap_factory(child_entities=_CHILDREN)
+        parent, _ = stream_factory(tap, _rows([]), "order_hdr")
+        assert list(parent.get_records(context=None)) == []
+        child, client = stream_factory(tap, _rows([{"id": 5}]), "order_dtl")
+        assert list(child.get_records(context=None)) == []
+        client.get_entity_data.assert_not_called()
+
+    def test_child_falls_back_without_parent_run(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """A child whose parent did not run is extracted without a key filter."""
+        tap = tap_factory(child_entities=_CHILDREN)
+        child, client = stream_factory(tap, _rows([{"id": 5}]), "order_dtl")
+        assert len(list(child.get_records(context=None))) == 1
+        assert "order_id__in" not in client.get_entity_data.call_args.kwargs["filters"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_sync_runs_chained_parents_first(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        *,
+        parallel: bool,
+    ) -> None:
+        """Both sync paths run chained children after their parents, by name or not."""
+        tap = tap_factory(
+            child_entities={
+                **_CHILDREN,
+                "allocation": {"parent": "order_dtl", "foreign_key": "order_dtl_id"},
+            },
+        )
+        client = u.TapOracleWms.FakeWmsClient(
+            {
+                "allocation": [
+                    {"id": 100, "order_dtl_id": 10},
+                    {"id": 101, "order_dtl_id": 11},
+                ],
+                "order_dtl": [{"id": 10, "order_id": 1}, {"id": 11, "order_id": 3}],
+                "order_hdr": [{"id": 1}, {"id": 2}],
+            },
+            latency=u.TapOracleWms.FakeWmsClient.constant(0.01),
+        )
+        streams: dict[str, FlextTapOracleWmsStream] = {}
+        for name in ("allocation", "order_dtl", "order_hdr"):
+            streams[name] = FlextTapOracleWmsStream(
+                tap=tap,
+                name=name,
+                schema={"type": "object"},
+                client=client,
+            )
+        written: list[object] = []
+        with (
+            patch.object(
+                FlextTapOracleWms,
+                "streams",
+                new_callable=PropertyMock,
+                return_value=streams,
+            ),
+            patch.object(tap, "write_message", side_effect=written.append),
+        ):
+            if parallel:
+                tap._sync_all_parallel(4)
+            else:
+                tap.sync_all()
+        emitted = [
+            (getattr(message, "stream"), getattr(message, "record")["id"])
+            for message in written
+            if hasattr(message, "record")
+        ]
+        assert sorted(emitted) == [
+            ("allocation", 100),
+            ("order_dtl", 10),
+            ("order_hdr", 1),
+            ("order_hdr", 2),
+        ]
@@ -0,0 +1,187 @@
+"""Unit tests for the WMS circuit breaker shared by streams and discovery."""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.errors import FlextTapOracleWmsError
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+class TestsFlextTapOracleWmsCircuitBreaker:
+    """Validate breaker transitions and fail-fast behavior across streams."""
+
+    def test_opens_after_threshold(self) -> None:
+        """Consecutive failures open the circuit; a success resets the count."""
+        breaker = u.TapOracleWms.CircuitBreaker(2, 60.0)
+        breaker.record(success=False)
+        breaker.record(success=True)
+        breaker.record(success=False)
+        assert breaker.state == "closed"
+        assert breaker.admit() == pytest.approx(0.0)
+        breaker.record(success=False)
+        assert breaker.state == "open"
+        assert breaker.admit() > 59.0
+
+    def test_half_open_admits_a_single_probe(self) -> None:
+        """After recovery one probe runs; its outcome closes or reopens."""
+        breaker = u.TapOracleWms.CircuitBreaker(1, 0.0)
+        breaker.record(success=False)
+        assert breaker.admit() == pytest.approx(0.0)
+        assert breaker.state == "half_open"
+        breaker.record(success=False)
+        assert breaker.admit() == pytest.approx(0.0)
+        breaker.record(success=True)
+        assert breaker.state == "closed"
+        assert breaker.admit() == pytest.approx(0.0)
+
+    def test_callers_wait_for_the_probe_outcome(self) -> None:
+        """A caller arriving during the probe is admitted once it succeeds."""
+        breaker = u.TapOracleWms.CircuitBreaker(1, 0.0)
+        breaker.record(success=False)
+        assert breaker.admit() == pytest.approx(0.0)
+        admitted: list[float] = []
+        waiter = threading.Thread(target=lambda: admitted.append(breaker.admit()))
+        waiter.start()
+        waiter.join(0.1)
+        assert waiter.is_alive()
+        breaker.record(success=True)
+        waiter.join(5)
+        assert admitted == [0.0]
+
+    def test_stale_completion_does_not_settle_the_probe(self) -> None:
+        """Requests admitted before the circuit opened cannot end the probe."""
+        breaker = u.TapOracleWms.CircuitBreaker(1, 0.0)
+        stale_admitted = threading.Event()
+        probe_admitted = threading.Event()
+
+        def stale_request() -> None:
+            assert breaker.admit() == pytest.approx(0.0)
+            stale_admitted.set()
+            probe_admitted.wait(5)
+            breaker.record(success=True)
+
+        stale = threading.Thread(target=stale_request)
+        stale.start()
+        assert stale_admitted.wait(5)
+        breaker.record(success=False)
+        assert breaker.admit() == pytest.approx(0.0)
+        probe_admitted.set()
+        stale.join(5)
+        assert breaker.state == "half_open"
+        breaker.record(success=True)
+        assert breaker.state == "closed"
+
+    def test_raising_probe_is_released(self) -> None:
+        """A probe that ends without an outcome lets the next probe in."""
+        breaker = u.TapOracleWms.CircuitBreaker(1, 0.0)
+        breaker.record(success=False)
+        assert breaker.admit() == pytest.approx(0.0)
+        breaker.release()
+        assert breaker.admit() == pytest.approx(0.0)
+        assert breaker.state == "half_open"
+
+    def test_breaker_follows_circuit_breaker_block(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The ``circuit_breaker`` config block enables one shared breaker."""
+        assert tap_factory().circuit_breaker is None
+        tap = tap_factory(
+            circuit_breaker={
+                "enabled": True,
+                "failure_threshold": 3,
+                "recovery_timeout": 5,
+            },
+        )
+        breaker = tap.circuit_breaker
+        assert breaker is not None
+        assert breaker is tap.circuit_breaker
+        assert breaker.failure_threshold == 3
+        assert breaker.recovery_timeout == pytest.approx(5.0)
+
+    def test_open_circuit_fails_streams_and_discovery_fast(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Once open, other streams and discovery do not reach the client."""
+        tap = tap_factory(
+            max_retries=0,
+            circuit_breaker={
+                "enabled": True,
+                "failure_threshold": 1,
+                "recovery_timeout": 60,
+            },
+        )
+        client = MagicMock()
+        client.get_entity_data.return_value = r[t.SequenceOf[t.JsonMapping]].fail(
+            "502 Bad Gateway",
+        )
+        first = FlextTapOracleWmsStream(
+            tap=tap,
+            name="item",
+            schema={"type": "object"},
+            client=client,
+        )
+        second = FlextTapOracleWmsStream(
+            tap=tap,
+            name="order_hdr",
+            schema={"type": "object"},
+            client=client,
+        )
+        with pytest.raises(FlextTapOracleWmsError, match="502"):
+            list(first.get_records(context=None))
+        with pytest.raises(FlextTapOracleWmsError, match="circuit breaker is open"):
+            list(second.get_records(context=None))
+        assert client.get_entity_data.call_count == 1
+        with patch.object(
+            FlextTapOracleWms,
+            "wms_client",
+            new_callable=PropertyMock,
+            return_value=client,
+        ):
+            result = tap.discovercatalog_typed()
+        assert result.failure
+        assert "circuit breaker is open" in (result.error or "")
+        client.discover_entities.assert_not_called()
+
+    def test_client_errors_do_not_open_the_circuit(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Streams and discovery both count a 404 as a server that answers."""
+        tap = tap_factory(
+            max_retries=0,
+            circuit_breaker={
+                "enabled": True,
+                "failure_threshold": 1,
+                "recovery_timeout": 60,
+            },
+        )
+        result = tap._request_wms(
+            lambda: r[t.StrSequence].fail("404 Not Found"),
+        )
+        assert result.failure
+        client = MagicMock()
+        client.get_entity_data.return_value = r[t.SequenceOf[t.JsonMapping]].fail(
+            "404 Not Found",
+        )
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="item",
+            schema={"type": "object"},
+            client=client,
+        )
+        with pytest.raises(FlextTapOracleWmsError, match="404"):
+            list(stream.get_records(context=None))
+        breaker = tap.circuit_breaker
+        assert breaker is not None
+        assert breaker.state == "closed"
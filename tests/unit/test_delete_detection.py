@@ -0,0 +1,118 @@
+"""Unit tests for key snapshot delete detection."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+def _key_pass(
+    keys: list[t.JsonValue],
+) -> Callable[..., r[t.SequenceOf[t.JsonMapping]]]:
+    def page(
+        entity_name: str,
+        limit: int,
+        filters: t.MutableScalarMapping,
+    ) -> r[t.SequenceOf[t.JsonMapping]]:
+        del entity_name, limit
+        if filters.get("fields") == "id":
+            return r[t.SequenceOf[t.JsonMapping]].ok([{"id": key} for key in keys])
+        return r[t.SequenceOf[t.JsonMapping]].ok([])
+
+    return page
+
+
+def _tap(
+    tap_factory: Callable[..., FlextTapOracleWms],
+    snapshot_dir: Path,
+) -> FlextTapOracleWms:
+    return tap_factory(
+        delete_detection_path=str(snapshot_dir),
+        delete_detection_interval_hours=0,
+    )
+
+
+class TestsFlextTapOracleWmsDeleteDetection:
+    """Validate key snapshots and emitted deletion records."""
+
+    def test_missing_merges_sorted_keys(self) -> None:
+        """Keys absent from the current pass are reported in order."""
+        missing = u.TapOracleWms.KeySnapshot.missing([1, 3, 5, 7], [2, 3, 7, 9])
+        assert missing == [1, 5]
+
+    def test_snapshot_round_trips_sorted_keys(self, tmp_path: Path) -> None:
+        """A saved snapshot loads back sorted and reports its age."""
+        snapshot = u.TapOracleWms.KeySnapshot(tmp_path / "order_hdr.keys")
+        assert snapshot.age_seconds() is None
+        assert list(snapshot.load()) == []
+        snapshot.save([30, 10, 20])
+        assert list(snapshot.load()) == [10, 20, 30]
+        age = snapshot.age_seconds()
+        assert age is not None
+        assert age >= 0
+
+    def test_first_pass_records_baseline(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """Without a previous snapshot nothing is reported deleted."""
+        stream, client = stream_factory(
+            _tap(tap_factory, tmp_path),
+            _key_pass([2, 1]),
+            "order_hdr",
+            replication_key="mod_ts",
+        )
+        assert list(stream.get_records(context=None)) == []
+        key_pass = client.get_entity_data.call_args
+        assert key_pass.kwargs["limit"] == 1000
+        assert key_pass.kwargs["filters"] == {
+            "page": 1,
+            "fields": "id",
+            "ordering": "id",
+        }
+        snapshot = u.TapOracleWms.KeySnapshot(tmp_path / "order_hdr.keys")
+        assert list(snapshot.load()) == [1, 2]
+
+    def test_vanished_keys_become_deletion_records(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """Keys missing since the last pass are emitted with a deletion time."""
+        u.TapOracleWms.KeySnapshot(tmp_path / "order_hdr.keys").save([1, 2, 3])
+        stream, _ = stream_factory(
+            _tap(tap_factory, tmp_path),
+            _key_pass([1, 3]),
+            "order_hdr",
+            replication_key="mod_ts",
+        )
+        records = list(stream.get_records(context=None))
+        assert [record["id"] for record in records] == [2]
+        assert records[0]["_sdc_deleted_at"]
+
+    def test_non_integer_keys_skip_detection(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """Entities keyed by non-integers keep no snapshot."""
+        stream, _ = stream_factory(
+            _tap(tap_factory, tmp_path),
+            _key_pass(["A-1"]),
+            "order_hdr",
+            replication_key="mod_ts",
+        )
+        assert list(stream.get_records(context=None)) == []
+        assert not (tmp_path / "order_hdr.keys").exists()
@@ -0,0 +1,107 @@
+"""Unit tests for the in-memory fake WMS client used by benchmarks."""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+_ROWS: list[t.JsonMapping] = [
+    {"id": index, "item_id": index % 2, "status": "A" if index % 3 else "B"}
+    for index in range(1, 8)
+]
+_ITEMS: list[t.JsonMapping] = [{"id": 0, "code": "SKU0"}, {"id": 1, "code": "SKU1"}]
+
+
+def _client(latency: float = 0.0) -> u.TapOracleWms.FakeWmsClient:
+    return u.TapOracleWms.FakeWmsClient(
+        {"order_dtl": _ROWS, "item": _ITEMS},
+        relations={"item_id": "item"},
+        latency=u.TapOracleWms.FakeWmsClient.constant(latency),
+    )
+
+
+class TestsFlextTapOracleWmsFakeWmsClient:
+    """Validate paging, query evaluation, latency modeling and tap wiring."""
+
+    def test_pages_by_page_and_limit(self) -> None:
+        """``page`` and ``limit`` select consecutive windows of rows."""
+        client = _client()
+        pages = [
+            [
+                row["id"]
+                for row in client.get_entity_data("order_dtl", 3, {"page": page}).value
+            ]
+            for page in (1, 2, 3)
+        ]
+        assert pages == [[1, 2, 3], [4, 5, 6], [7]]
+
+    def test_filters_ordering_and_fields(self) -> None:
+        """Filters, ordering and traversing ``fields`` apply before paging."""
+        result = _client().get_entity_data(
+            "order_dtl",
+            2,
+            {"status": "A", "ordering": "-id", "fields": "id,item_id__code"},
+        )
+        assert result.value == [
+            {"id": 7, "item_id__code": "SKU1"},
+            {"id": 5, "item_id__code": "SKU1"},
+        ]
+
+    def test_unknown_entity_fails(self) -> None:
+        """Requests for entities that are not served return a failure."""
+        result = _client().get_entity_data("missing", 10, None)
+        assert result.failure
+        assert "Unknown entity" in (result.error or "")
+
+    def test_latency_is_drawn_and_accounted(self) -> None:
+        """Each call draws one delay and the total is kept for subtraction."""
+        client = _client(latency=0.01)
+        client.discover_entities()
+        client.get_entity_data("item", 10, None)
+        assert client.requests == 2
+        assert client.latency_seconds == pytest.approx(0.01)
+
+    def test_distributions_are_seeded(self) -> None:
+        """Latency distributions draw from the generator they are given."""
+        lognormal = u.TapOracleWms.FakeWmsClient.lognormal(0.002, 0.5)
+        uniform = u.TapOracleWms.FakeWmsClient.uniform(0.001, 0.003)
+        first, second = random.Random(3), random.Random(3)
+        assert [lognormal(first) for _ in range(5)] == [
+            lognormal(second) for _ in range(5)
+        ]
+        assert all(0.001 <= uniform(first) <= 0.003 for _ in range(20))
+
+    def test_drives_discovery_and_streams(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The tap discovers and extracts served entities through the fake."""
+        tap = tap_factory(page_size=3)
+        client = _client()
+        with patch.object(
+            FlextTapOracleWms,
+            "wms_client",
+            new_callable=PropertyMock,
+            return_value=client,
+        ):
+            catalog = tap.discovercatalog_typed()
+        assert [entry.stream for entry in catalog.value.streams] == [
+            "order_dtl",
+            "item",
+        ]
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="order_dtl",
+            schema={"type": "object"},
+            client=client,
+        )
+        ids = [row["id"] for row in stream.get_records(context=None)]
+        assert ids == [row["id"] for row in _ROWS]
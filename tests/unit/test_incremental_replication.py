@@ -0,0 +1,163 @@
+"""Unit tests for bookmark-based incremental replication."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+
+_SAMPLES: dict[str, list[t.JsonMapping]] = {
+    "order_hdr": [{"id": 1, "mod_ts": "2025-01-01T00:00:00+00:00"}],
+    "company": [{"id": 1, "code": "ACME"}],
+}
+
+
+def _catalog_methods(tap: FlextTapOracleWms) -> dict[str, tuple[str, str | None]]:
+    client = MagicMock()
+    client.discover_entities.return_value = r[t.StrSequence].ok(list(_SAMPLES))
+    client.get_entity_data.side_effect = lambda entity_name, **_: r[
+        t.SequenceOf[t.JsonMapping]
+    ].ok(_SAMPLES[entity_name])
+    with patch.object(
+        FlextTapOracleWms,
+        "wms_client",
+        new_callable=PropertyMock,
+        return_value=client,
+    ):
+        catalog = tap.discovercatalog_typed().value
+    methods: dict[str, tuple[str, str | None]] = {}
+    for entry in catalog.streams:
+        metadata = entry.metadata[0].metadata
+        assert metadata["replication-method"] == entry.replication_method
+        assert metadata.get("replication-key") == entry.replication_key
+        methods[entry.stream] = (str(entry.replication_method), entry.replication_key)
+    return methods
+
+
+class TestsFlextTapOracleWmsIncrementalReplication:
+    """Validate incremental discovery, filters and bookmark resume."""
+
+    def test_discovery_marks_timestamped_entities(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Entities with the replication key become incremental streams."""
+        tap = tap_factory(
+            enable_incremental=True,
+            catalog_cache_path=str(tmp_path / "catalog.json"),
+        )
+        assert _catalog_methods(tap) == {
+            "order_hdr": ("INCREMENTAL", "mod_ts"),
+            "company": ("FULL_TABLE", None),
+        }
+
+    def test_discovery_is_full_table_when_disabled(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Without enable_incremental every stream stays FULL_TABLE."""
+        assert _catalog_methods(tap_factory()) == {
+            "order_hdr": ("FULL_TABLE", None),
+            "company": ("FULL_TABLE", None),
+        }
+
+    def test_start_date_bounds_first_run(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Without a bookmark the ``__gte`` filter starts at start_date."""
+        tap = tap_factory(enable_incremental=True, start_date="2024-01-01T00:00:00Z")
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="order_hdr",
+            schema={"type": "object"},
+            replication_key="mod_ts",
+        )
+        assert stream.replication_method == "INCREMENTAL"
+        params = stream._build_operation_kwargs(page=3, context=None)
+        assert params["page"] == 3
+        assert params["ordering"] == "mod_ts,id"
+        assert str(params["mod_ts__gte"]).startswith("2024-01-01T00:00:00")
+
+    def test_bookmark_bounds_next_run(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """A saved bookmark replaces start_date as the lower bound."""
+        tap = tap_factory(
+            state={
+                "bookmarks": {
+                    "order_hdr": {
+                        "replication_key": "mod_ts",
+                        "replication_key_value": "2025-03-04T05:06:07+00:00",
+                    },
+                },
+            },
+            enable_incremental=True,
+            start_date="2024-01-01T00:00:00Z",
+        )
+        client = MagicMock()
+        client.get_entity_data.return_value = r[t.SequenceOf[t.JsonMapping]].ok([])
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="order_hdr",
+            schema={"type": "object"},
+            replication_key="mod_ts",
+            client=client,
+        )
+        assert list(stream.get_records(context=None)) == []
+        filters = client.get_entity_data.call_args.kwargs["filters"]
+        assert str(filters["mod_ts__gte"]).startswith("2025-03-04T05:06:07")
+
+    def test_lookback_widens_lower_bound(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The lookback window is subtracted from the bookmark."""
+        tap = tap_factory(
+            enable_incremental=True,
+            start_date="2024-01-01T00:00:00Z",
+            replication_lookback_minutes=30,
+        )
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="order_hdr",
+            schema={"type": "object"},
+            replication_key="mod_ts",
+        )
+        params = stream._build_operation_kwargs(page=1, context=None)
+        assert str(params["mod_ts__gte"]).startswith("2023-12-31T23:30:00")
+
+    def test_run_start_bounds_every_stream(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """All incremental streams of a run share one ``__lt`` upper bound."""
+        tap = tap_factory(enable_incremental=True, start_date="2024-01-01T00:00:00Z")
+        bounds: list[str] = []
+        for name in ("order_hdr", "order_dtl"):
+            client = MagicMock()
+            client.get_entity_data.return_value = r[t.SequenceOf[t.JsonMapping]].ok(
+                [],
+            )
+            stream = FlextTapOracleWmsStream(
+                tap=tap,
+                name=name,
+                schema={"type": "object"},
+                replication_key="mod_ts",
+                primary_keys=["id"],
+                client=client,
+            )
+            assert stream.primary_keys == ["id"]
+            assert list(stream.get_records(context=None)) == []
+            bounds.append(
+                str(client.get_entity_data.call_args.kwargs["filters"]["mod_ts__lt"]),
+            )
+        assert bounds == [tap.run_started_at, tap.run_started_at]
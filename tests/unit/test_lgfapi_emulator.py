@@ -0,0 +1,130 @@
+"""Unit tests for the local lgfapi emulator used by load and benchmark tests."""
+
+from __future__ import annotations
+
+import http.client
+import json
+from urllib.parse import urlsplit
+
+from tests.typings import t
+from tests.utilities import u
+
+_ROWS: list[t.JsonMapping] = [
+    {
+        "id": index,
+        "item_id": index % 3,
+        "status": "A" if index % 2 else "B",
+        "mod_ts": f"2025-01-{index + 1:02d}T00:00:00",
+    }
+    for index in range(10)
+]
+
+
+def _items() -> t.IterableOf[t.JsonMapping]:
+    return ({"id": index, "code": f"SKU{index}"} for index in range(3))
+
+
+def _request(url: str) -> tuple[int, t.StrMapping, t.JsonDict]:
+    parts = urlsplit(url)
+    connection = http.client.HTTPConnection(parts.netloc, timeout=5)
+    try:
+        connection.request("GET", f"{parts.path}?{parts.query}")
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+        headers = dict(response.getheaders())
+    finally:
+        connection.close()
+    assert isinstance(payload, dict)
+    return response.status, headers, payload
+
+
+def _get(url: str) -> t.JsonDict:
+    status, _, payload = _request(url)
+    assert status == 200
+    return payload
+
+
+def _emulator(**options: float) -> u.TapOracleWms.LgfapiEmulator:
+    return u.TapOracleWms.LgfapiEmulator(
+        {"order_dtl": _ROWS, "item": _items},
+        relations={"item_id": "item"},
+        max_page_size=4,
+        **options,
+    )
+
+
+class TestsFlextTapOracleWmsLgfapiEmulator:
+    """Validate the emulated endpoints, query features and fault injection."""
+
+    def test_lists_and_describes_entities(self) -> None:
+        """The entity list links every entity and describe reports columns."""
+        with _emulator() as emulator:
+            api_url = emulator.api_url
+            entities = _get(f"{api_url}/entity/")
+            described = _get(f"{api_url}/entity/item/describe/")
+        assert entities == {
+            "order_dtl": f"{api_url}/entity/order_dtl/",
+            "item": f"{api_url}/entity/item/",
+        }
+        assert described == {"fields": {"id": {"type": "int"}, "code": {"type": "str"}}}
+
+    def test_paged_mode_counts_filters_and_orders(self) -> None:
+        """Paged responses carry counts and links over filtered, ordered rows."""
+        with _emulator() as emulator:
+            page = _get(
+                f"{emulator.api_url}/entity/order_dtl/"
+                "?page_size=3&page=2&status=A&ordering=-id",
+            )
+        assert page["result_count"] == 5
+        assert page["page_count"] == 2
+        assert page["next_page"] is None
+        assert isinstance(page["previous_page"], str)
+        assert [row["id"] for row in page["results"]] == [3, 1]
+
+    def test_page_size_is_capped(self) -> None:
+        """Requests above the configured cap get at most ``max_page_size`` rows."""
+        with _emulator() as emulator:
+            page = _get(f"{emulator.api_url}/entity/order_dtl/?page_size=50")
+        assert len(page["results"]) == 4
+        assert page["page_count"] == 3
+
+    def test_sequenced_mode_follows_cursor(self) -> None:
+        """Sequenced paging walks every row through ``next_page`` cursors."""
+        seen: list[t.JsonValue] = []
+        with _emulator() as emulator:
+            url: str | None = (
+                f"{emulator.api_url}/entity/order_dtl/?page_mode=sequenced"
+            )
+            while url:
+                page = _get(url)
+                seen.extend(row["id"] for row in page["results"])
+                url = page["next_page"]
+        assert seen == list(range(10))
+        assert "result_count" not in page
+
+    def test_fields_project_columns_and_traversals(self) -> None:
+        """``fields`` selects columns and resolves ``fk__column`` traversals."""
+        with _emulator() as emulator:
+            page = _get(
+                f"{emulator.api_url}/entity/order_dtl/"
+                "?fields=id,item_id__code&id__in=1,2&mod_ts__gte=2025-01-03",
+            )
+        assert page["results"] == [{"id": 2, "item_id__code": "SKU2"}]
+
+    def test_throttling_returns_retry_after(self) -> None:
+        """Injected throttling answers 429 with the configured Retry-After."""
+        with _emulator(throttle_rate=1.0) as emulator:
+            status, headers, _ = _request(f"{emulator.api_url}/entity/order_dtl/")
+        assert status == 429
+        assert headers["Retry-After"] == "1"
+        assert (emulator.requests, emulator.throttled) == (1, 1)
+
+    def test_fault_injection_is_seeded(self) -> None:
+        """The same seed injects the same failures in the same order."""
+        first = _emulator(throttle_rate=0.3, error_rate=0.2)
+        second = _emulator(throttle_rate=0.3, error_rate=0.2)
+        path = "/wms/lgfapi/v10/entity/item/"
+        assert [first.handle(path)[0] for _ in range(20)] == [
+            second.handle(path)[0] for _ in range(20)
+        ]
+        assert first.throttled + first.errors > 0
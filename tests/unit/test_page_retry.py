@@ -0,0 +1,104 @@
+"""Unit tests for per-page retries with jittered exponential backoff."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import MagicMock, patch
+
+import pytest
+from flext_tests import r
+
+from flext_oracle_wms.utilities import FlextOracleWmsUtilities
+from flext_tap_oracle_wms.errors import FlextTapOracleWmsError
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+def _ok(*ids: int) -> r[t.SequenceOf[t.JsonMapping]]:
+    return r[t.SequenceOf[t.JsonMapping]].ok([{"id": item} for item in ids])
+
+
+def _fail(error: str) -> r[t.SequenceOf[t.JsonMapping]]:
+    return r[t.SequenceOf[t.JsonMapping]].fail(error)
+
+
+class TestsFlextTapOracleWmsPageRetry:
+    """Validate that only failed pages are retried and exhaustion surfaces."""
+
+    def test_backoff_grows_with_jitter_and_cap(self) -> None:
+        """Delays double per attempt, stay in their upper half and are capped."""
+        backoff = u.TapOracleWms.RetryBackoff
+        assert 1.0 <= backoff.delay(1, 2.0) <= 2.0
+        assert 4.0 <= backoff.delay(3, 2.0) <= 8.0
+        assert backoff.delay(30, 2.0) <= 60.0
+        assert backoff.delay(1, 1.0, retry_after=30.0) == pytest.approx(30.0)
+
+    def test_client_errors_are_not_retryable(self) -> None:
+        """Gateway errors are retried; missing entities are not."""
+        backoff = u.TapOracleWms.RetryBackoff
+        assert backoff.retryable("502 Bad Gateway")
+        assert backoff.retryable("Connection reset by peer")
+        assert not backoff.retryable("404 Not Found")
+
+    def test_failed_page_is_retried_alone(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """A transient failure costs one extra request for that page only."""
+        stream, client = stream_factory(
+            tap_factory(page_size=1, retry_delay=0),
+            [
+                _ok(1),
+                _fail("502 Bad Gateway"),
+                _ok(2),
+                _ok(),
+            ],
+        )
+        assert [row["id"] for row in stream.get_records(context=None)] == [1, 2]
+        pages = [
+            call.kwargs["filters"]["page"]
+            for call in client.get_entity_data.call_args_list
+        ]
+        assert pages == [1, 2, 2, 3]
+
+    def test_exhausted_retries_raise(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """After ``max_retries`` retries the page failure ends the stream."""
+        stream, client = stream_factory(
+            tap_factory(page_size=1, retry_delay=0, max_retries=2),
+            [_fail("503 Service Unavailable")] * 3,
+        )
+        with pytest.raises(FlextTapOracleWmsError, match="page 1"):
+            list(stream.get_records(context=None))
+        assert client.get_entity_data.call_count == 3
+
+    def test_non_retryable_error_raises_immediately(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """Client errors are surfaced without spending retries."""
+        stream, client = stream_factory(
+            tap_factory(page_size=1, retry_delay=0),
+            [_fail("404 Not Found")],
+        )
+        with pytest.raises(FlextTapOracleWmsError, match="404"):
+            list(stream.get_records(context=None))
+        assert client.get_entity_data.call_count == 1
+
+    def test_client_leaves_retries_to_the_tap(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The WMS client makes one attempt; only the tap loop retries."""
+        tap = tap_factory(max_retries=5)
+        with patch.object(FlextOracleWmsUtilities.OracleWms, "Client") as client_type:
+            client_type.return_value.start.return_value = r[bool].ok(True)
+            assert tap.wms_client is client_type.return_value
+        assert client_type.call_args.kwargs["settings"].retry_attempts == 0
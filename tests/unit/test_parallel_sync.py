@@ -0,0 +1,165 @@
+"""Unit tests for parallel multi-stream extraction."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+
+
+class _Concurrency:
+    """Track peak concurrent stream syncs."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def run(self, delay: float) -> None:
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(delay)
+        with self._lock:
+            self.active -= 1
+
+
+def _stream(
+    name: str,
+    tracker: _Concurrency,
+    *,
+    selected: bool = True,
+    parent: type | None = None,
+) -> MagicMock:
+    stream = MagicMock()
+    stream.name = name
+    stream.selected = selected
+    stream.has_selected_descendents = False
+    stream.parent_stream_type = parent
+    stream.sync.side_effect = lambda: tracker.run(0.1)
+    return stream
+
+
+@pytest.fixture
+def parallel_tap(tap_factory: Callable[..., FlextTapOracleWms]) -> FlextTapOracleWms:
+    """Tap with parallel extraction over four streams."""
+    tap = tap_factory(enable_parallel_extraction=True, max_parallel_streams=4)
+    tap._reset_state_progress_markers = MagicMock()  # type: ignore[method-assign]
+    tap._set_compatible_replication_methods = MagicMock()  # type: ignore[method-assign]
+    return tap
+
+
+class TestsFlextTapOracleWmsParallelSync:
+    """Validate concurrent stream sync honoring parallel extraction settings."""
+
+    def test_execute_uses_parallel_sync_when_enabled(
+        self,
+        parallel_tap: FlextTapOracleWms,
+    ) -> None:
+        """execute() dispatches to the parallel path with max_parallel_streams."""
+        with (
+            patch.object(parallel_tap, "_sync_all_parallel") as parallel,
+            patch.object(parallel_tap, "sync_all") as serial,
+        ):
+            result = parallel_tap.execute()
+        assert result.success
+        parallel.assert_called_once_with(4)
+        serial.assert_not_called()
+
+    def test_streams_run_concurrently(
+        self,
+        parallel_tap: FlextTapOracleWms,
+    ) -> None:
+        """Independent streams overlap instead of running back to back."""
+        tracker = _Concurrency()
+        streams = {f"s{i}": _stream(f"s{i}", tracker) for i in range(4)}
+        with patch.object(
+            FlextTapOracleWms,
+            "streams",
+            new_callable=PropertyMock,
+            return_value=streams,
+        ):
+            parallel_tap._sync_all_parallel(4)
+        assert tracker.peak == 4
+        for stream in streams.values():
+            stream.sync.assert_called_once()
+            stream.finalize_state_progress_markers.assert_called_once()
+            stream.log_sync_costs.assert_called_once()
+
+    def test_deselected_and_child_streams_are_skipped(
+        self,
+        parallel_tap: FlextTapOracleWms,
+    ) -> None:
+        """Only selected top-level streams are scheduled."""
+        tracker = _Concurrency()
+        streams = {
+            "top": _stream("top", tracker),
+            "off": _stream("off", tracker, selected=False),
+            "child": _stream("child", tracker, parent=FlextTapOracleWms),
+        }
+        with patch.object(
+            FlextTapOracleWms,
+            "streams",
+            new_callable=PropertyMock,
+            return_value=streams,
+        ):
+            parallel_tap._sync_all_parallel(4)
+        streams["top"].sync.assert_called_once()
+        streams["off"].sync.assert_not_called()
+        streams["child"].sync.assert_not_called()
+
+    def test_initial_state_message_is_written(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Like ``sync_all``, the parallel path first writes the input state."""
+        state = {"bookmarks": {"item": {"replication_key_value": "2025-01-01"}}}
+        tap = tap_factory(state=state)
+        tap._reset_state_progress_markers = MagicMock()  # type: ignore[method-assign]
+        tap._set_compatible_replication_methods = MagicMock()  # type: ignore[method-assign]
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="item",
+            schema={"type": "object"},
+        )
+        written: list[object] = []
+        with (
+            patch.object(
+                FlextTapOracleWms,
+                "streams",
+                new_callable=PropertyMock,
+                return_value={"item": stream},
+            ),
+            patch.object(tap, "write_message", side_effect=written.append),
+            patch.object(stream, "sync") as sync,
+            patch.object(stream, "finalize_state_progress_markers"),
+        ):
+            tap._sync_all_parallel(2)
+        sync.assert_called_once()
+        assert len(written) == 1
+        assert getattr(written[0], "value") == state
+
+    def test_stream_failure_is_raised(
+        self,
+        parallel_tap: FlextTapOracleWms,
+    ) -> None:
+        """A failing stream surfaces its exception to the caller."""
+        tracker = _Concurrency()
+        failing = _stream("bad", tracker)
+        failing.sync.side_effect = RuntimeError("boom")
+        with (
+            patch.object(
+                FlextTapOracleWms,
+                "streams",
+                new_callable=PropertyMock,
+                return_value={"bad": failing, "ok": _stream("ok", tracker)},
+            ),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            parallel_tap._sync_all_parallel(2)
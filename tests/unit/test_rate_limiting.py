@@ -0,0 +1,107 @@
+"""Unit tests for the shared token-bucket request rate limiter."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+class TestsFlextTapOracleWmsRateLimiting:
+    """Validate token buckets and their use by the tap and streams."""
+
+    def test_bucket_allows_burst_then_waits(self) -> None:
+        """A full bucket admits ``capacity`` requests, then asks to wait."""
+        bucket = u.TapOracleWms.TokenBucket.per_minute(60, 3)
+        assert [bucket.try_acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.try_acquire() == pytest.approx(1.0, abs=0.05)
+
+    def test_bucket_rejects_invalid_rate(self) -> None:
+        """A bucket without throughput cannot be built."""
+        with pytest.raises(ValueError, match="positive rate"):
+            u.TapOracleWms.TokenBucket(0.0, 1)
+
+    def test_file_bucket_is_shared_between_instances(self, tmp_path: Path) -> None:
+        """Buckets opened on one file draw from the same quota."""
+        state = tmp_path / "bucket.json"
+        first = u.TapOracleWms.FileTokenBucket.shared_per_minute(state, 60, 2)
+        second = u.TapOracleWms.FileTokenBucket.shared_per_minute(state, 60, 2)
+        assert first.try_acquire() == pytest.approx(0.0)
+        assert second.try_acquire() == pytest.approx(0.0)
+        assert first.try_acquire() > 0.0
+        assert second.try_acquire() > 0.0
+
+    def test_tap_limiter_follows_settings(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Off by default; otherwise one limiter, file-backed with a state path."""
+        assert tap_factory().rate_limiter is None
+        tap = tap_factory(
+            enable_rate_limiting=True,
+            max_requests_per_minute=120,
+            rate_limit_burst=4,
+        )
+        limiter = tap.rate_limiter
+        assert isinstance(limiter, u.TapOracleWms.TokenBucket)
+        assert limiter is tap.rate_limiter
+        assert limiter.rate_per_second == pytest.approx(2.0)
+        assert limiter.capacity == 4
+        shared = tap_factory(
+            enable_rate_limiting=True,
+            rate_limit_state_path=str(tmp_path / "bucket.json"),
+        )
+        assert isinstance(shared.rate_limiter, u.TapOracleWms.FileTokenBucket)
+
+    def test_tap_limiter_falls_back_without_file_locking(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Platforms without ``fcntl`` get a per-process bucket instead."""
+        tap = tap_factory(
+            enable_rate_limiting=True,
+            rate_limit_state_path=str(tmp_path / "bucket.json"),
+        )
+        with patch.object(
+            u.TapOracleWms.FileTokenBucket,
+            "supported",
+            return_value=False,
+        ):
+            limiter = tap.rate_limiter
+        assert isinstance(limiter, u.TapOracleWms.TokenBucket)
+        assert not isinstance(limiter, u.TapOracleWms.FileTokenBucket)
+        assert not (tmp_path / "bucket.json").exists()
+
+    def test_every_page_request_takes_a_token(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """Streams acquire a token from the tap limiter before each page."""
+        stream, _ = stream_factory(
+            tap_factory(page_size=1),
+            [
+                r[t.SequenceOf[t.JsonMapping]].ok([{"id": 1}]),
+                r[t.SequenceOf[t.JsonMapping]].ok([{"id": 2}]),
+                r[t.SequenceOf[t.JsonMapping]].ok([]),
+            ],
+        )
+        limiter = MagicMock()
+        with patch.object(
+            FlextTapOracleWms,
+            "rate_limiter",
+            new_callable=PropertyMock,
+            return_value=limiter,
+        ):
+            assert len(list(stream.get_records(context=None))) == 2
+        assert limiter.acquire.call_count == 3
@@ -0,0 +1,89 @@
+"""Unit tests for page normalization and off-process record processing."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+
+
+def _pages() -> list[list[t.JsonMapping]]:
+    return [
+        [{"id": 1, "tags": ["a"]}, {"id": 2, "dims": {"w": 1}}],
+        [{"id": 3, "tags": []}, {"id": 4, "dims": {}}],
+        [{"id": 5, "code": "X"}],
+    ]
+
+
+def _results() -> list[r[t.SequenceOf[t.JsonMapping]]]:
+    return [r[t.SequenceOf[t.JsonMapping]].ok(page) for page in _pages()]
+
+
+class TestsFlextTapOracleWmsRecordProcessing:
+    """Validate that pooled normalization matches in-process normalization."""
+
+    def test_normalize_page_stringifies_containers(self) -> None:
+        """Nested values are rendered as strings, scalars pass through."""
+        rows = FlextTapOracleWmsStream.normalize_page(_pages()[0])
+        assert rows == [
+            {"id": 1, "tags": "['a']"},
+            {"id": 2, "dims": "{'w': 1}"},
+        ]
+
+    def test_normalize_page_runs_on_worker_process(self) -> None:
+        """Worker processes can import the page normalizer by reference."""
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(FlextTapOracleWmsStream.normalize_page, _pages()[2])
+            assert future.result() == [{"id": 5, "code": "X"}]
+
+    def test_records_without_pool(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """Without workers, pages are normalized in the extraction process."""
+        stream, _ = stream_factory(tap_factory(page_size=2), _results())
+        assert stream._record_processor() is None
+        ids = [row["id"] for row in stream.get_records(context=None)]
+        assert ids == [1, 2, 3, 4, 5]
+
+    def test_pool_preserves_page_order(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """Pooled normalization yields the same records in the same order."""
+        in_process, _ = stream_factory(tap_factory(page_size=2), _results())
+        expected = list(in_process.get_records(context=None))
+        stream, _ = stream_factory(
+            tap_factory(page_size=2, record_processing_workers=2),
+            _results(),
+        )
+        with (
+            ThreadPoolExecutor(max_workers=2) as pool,
+            patch.object(
+                FlextTapOracleWms,
+                "record_processor",
+                new_callable=PropertyMock,
+                return_value=pool,
+            ),
+        ):
+            assert list(stream.get_records(context=None)) == expected
+
+    def test_record_processor_lifecycle(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The tap starts one shared pool lazily and shuts it down."""
+        tap = tap_factory(record_processing_workers=2)
+        processor = tap.record_processor
+        assert processor is not None
+        assert tap.record_processor is processor
+        tap.shutdown_record_processor()
+        assert tap._record_processor is None
@@ -0,0 +1,103 @@
+"""Unit tests for related-field expansion through the lgfapi ``fields`` param."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms import FlextTapOracleWmsSettings
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.constants import c
+from tests.typings import t
+
+_RELATED: t.JsonMapping = {"order_dtl": ["item_id__code", "order_id__order_nbr"]}
+
+
+def _sample(
+    entity_name: str,
+    filters: t.MutableScalarMapping | None = None,
+    **_: t.JsonValue,
+) -> r[t.SequenceOf[t.JsonMapping]]:
+    row: dict[str, t.JsonValue] = {"id": 1, "qty": 2}
+    if filters and entity_name == "order_dtl":
+        row.update({"item_id__code": "SKU-1", "order_id__order_nbr": "ORD-1"})
+    return r[t.SequenceOf[t.JsonMapping]].ok([row])
+
+
+class TestsFlextTapOracleWmsRelatedFields:
+    """Validate related-field settings, discovery and page requests."""
+
+    def test_settings_reject_plain_columns(self) -> None:
+        """Only foreign key traversals are accepted as related fields."""
+        with pytest.raises(c.ValidationError, match="not traversals"):
+            FlextTapOracleWmsSettings(
+                base_url="https://wms.example.com",
+                username="user",
+                password="pass",
+                related_fields={"order_dtl": ["item_id__code", "qty"]},
+            )
+
+    def test_discovery_adds_traversals_to_schema(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Entities with related fields are described with the traversals."""
+        tap = tap_factory(related_fields=_RELATED)
+        client = MagicMock()
+        client.discover_entities.return_value = r[t.StrSequence].ok(
+            ["order_dtl", "item"],
+        )
+        client.get_entity_data.side_effect = _sample
+        with patch.object(
+            FlextTapOracleWms,
+            "wms_client",
+            new_callable=PropertyMock,
+            return_value=client,
+        ):
+            catalog = tap.discovercatalog_typed().value
+        schemas = {entry.stream: entry.schema_definition for entry in catalog.streams}
+        assert list(schemas["order_dtl"]["properties"]) == [
+            "id",
+            "qty",
+            "item_id__code",
+            "order_id__order_nbr",
+        ]
+        assert client.get_entity_data.call_count == 2
+        expanded = client.get_entity_data.call_args_list[-1].kwargs["filters"]
+        assert expanded == {"fields": "id,qty,item_id__code,order_id__order_nbr"}
+
+    def test_pages_request_schema_columns_and_traversals(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Page requests list schema columns and traversals, not ``_sdc_`` ones."""
+        stream = FlextTapOracleWmsStream(
+            tap=tap_factory(related_fields=_RELATED),
+            name="order_dtl",
+            schema={
+                "type": "object",
+                "properties": {
+                    "id": {"type": ["null", "integer"]},
+                    "item_id__code": {"type": ["null", "string"]},
+                    "_sdc_deleted_at": {"type": ["null", "string"]},
+                },
+            },
+        )
+        params = stream._build_operation_kwargs(page=1, context=None)
+        assert params["fields"] == "id,item_id__code,order_id__order_nbr"
+
+    def test_expansion_needs_described_schema(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Without schema columns the stream fetches entities unexpanded."""
+        stream = FlextTapOracleWmsStream(
+            tap=tap_factory(related_fields=_RELATED),
+            name="order_dtl",
+            schema={"type": "object"},
+        )
+        assert "fields" not in stream._build_operation_kwargs(page=1, context=None)
@@ -0,0 +1,118 @@
+"""Unit tests for budgeted hedging of slow page requests."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+_SLOW_PAGE = 26
+
+
+class TestsFlextTapOracleWmsRequestHedging:
+    """Validate hedge thresholds, the budget and hedged page fetching."""
+
+    def test_threshold_needs_samples(self) -> None:
+        """The threshold is the latency percentile once enough pages finished."""
+        policy = u.TapOracleWms.HedgePolicy(95.0, 0.05)
+        for index in range(1, 20):
+            policy.record(index / 100)
+        assert policy.threshold() is None
+        policy.record(0.2)
+        assert policy.threshold() == pytest.approx(0.19)
+
+    def test_budget_caps_extra_requests(self) -> None:
+        """Hedges never exceed the budget share of page requests."""
+        policy = u.TapOracleWms.HedgePolicy(95.0, 0.05)
+        assert not policy.try_spend()
+        for _ in range(20):
+            policy.record(0.1)
+        assert policy.try_spend()
+        assert not policy.try_spend()
+        assert policy.hedges == 1
+        assert policy.requests == 20
+
+    def test_hedges_do_not_grow_the_budget(self) -> None:
+        """Only primary requests count toward the hedge budget."""
+        policy = u.TapOracleWms.HedgePolicy(95.0, 0.5)
+        begun = policy.begin(1, primary=True)
+        assert policy.started(1) == begun
+        policy.finish(1, begun, primary=True)
+        assert policy.started(1) is None
+        policy.record(0.1)
+        assert policy.try_spend()
+        policy.finish(2, policy.begin(2, primary=False), primary=False)
+        assert policy.requests == 2
+        assert not policy.try_spend()
+
+    def test_invalid_percentile_is_rejected(self) -> None:
+        """Percentiles must lie strictly between 0 and 100."""
+        with pytest.raises(ValueError, match="percentile"):
+            u.TapOracleWms.HedgePolicy(100.0, 0.05)
+
+    def test_policy_is_kept_across_page_runs(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Latencies from earlier runs and key batches keep counting."""
+        tap = tap_factory(enable_request_hedging=True)
+        stream = FlextTapOracleWmsStream(
+            tap=tap,
+            name="item",
+            schema={"type": "object"},
+        )
+        hedging = stream._hedge_policy()
+        assert hedging is not None
+        hedging.record(0.1)
+        assert stream._hedge_policy() is hedging
+        assert hedging.requests == 1
+        tap.invalidate_settings()
+        assert stream._hedge_policy() is not hedging
+
+    def test_slow_page_is_served_by_hedge(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+    ) -> None:
+        """A straggling page is re-requested and the faster answer is used."""
+        tap = tap_factory(
+            page_size=1,
+            max_concurrent_page_requests=2,
+            enable_request_hedging=True,
+            hedge_budget_percent=100,
+        )
+        calls: Counter[int] = Counter()
+        lock = threading.Lock()
+
+        def page_data(
+            entity_name: str,
+            limit: int,
+            filters: t.JsonMapping,
+        ) -> r[t.SequenceOf[t.JsonMapping]]:
+            _ = entity_name, limit
+            page = int(str(filters["page"]))
+            with lock:
+                calls[page] += 1
+                attempt = calls[page]
+            if page > _SLOW_PAGE:
+                return r[t.SequenceOf[t.JsonMapping]].ok([])
+            if page == _SLOW_PAGE and attempt == 1:
+                time.sleep(1.0)
+                return r[t.SequenceOf[t.JsonMapping]].ok([{"id": page, "via": "slow"}])
+            return r[t.SequenceOf[t.JsonMapping]].ok([{"id": page, "via": "fast"}])
+
+        stream, _ = stream_factory(tap, page_data)
+        rows = list(stream.get_records(context=None))
+        assert [row["id"] for row in rows] == list(range(1, _SLOW_PAGE + 1))
+        assert rows[-1]["via"] == "fast"
+        assert calls[_SLOW_PAGE] == 2
@@ -0,0 +1,117 @@
+"""Unit tests for the on-disk response cache."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+_ROWS: list[t.JsonMapping] = [{"id": 1, "mod_ts": "2025-01-01T00:00:00"}]
+
+
+def _page(
+    entity_name: str,
+    limit: int,
+    filters: t.MutableScalarMapping | None,
+) -> r[t.SequenceOf[t.JsonMapping]]:
+    del entity_name, limit
+    ordering = str((filters or {}).get("ordering", ""))
+    if ordering.startswith("-"):
+        column = ordering[1:]
+        return r[t.SequenceOf[t.JsonMapping]].ok([{column: _ROWS[0][column]}])
+    page = (filters or {}).get("page", 1)
+    return r[t.SequenceOf[t.JsonMapping]].ok(_ROWS if page == 1 else [])
+
+
+def _page_requests(client: MagicMock) -> int:
+    return sum(
+        1
+        for call in client.get_entity_data.call_args_list
+        if not str(call.kwargs["filters"].get("ordering", "")).startswith("-")
+    )
+
+
+class TestsFlextTapOracleWmsResponseCache:
+    """Validate cache revalidation and its use by streams and discovery."""
+
+    def test_validator_decides_freshness(self, tmp_path: Path) -> None:
+        """Entries stored with a validator match only the same validator."""
+        cache = u.TapOracleWms.ResponseCache(tmp_path, ttl_seconds=0)
+        key = cache.key("company", 10, {"page": 1})
+        cache.put(key, _ROWS, validator="probe-1")
+        assert cache.get(key, "probe-1") == _ROWS
+        assert cache.get(key, "probe-2") is None
+
+    def test_ttl_applies_without_validator(self, tmp_path: Path) -> None:
+        """Entries without a validator expire after the TTL."""
+        key = u.TapOracleWms.ResponseCache.key("company", 10, None)
+        u.TapOracleWms.ResponseCache(tmp_path, ttl_seconds=60).put(key, _ROWS)
+        assert u.TapOracleWms.ResponseCache(tmp_path, 60).get(key) == _ROWS
+        assert u.TapOracleWms.ResponseCache(tmp_path, 0).get(key) is None
+
+    def test_unchanged_probe_serves_cached_pages(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """A second run with the same probe fetches no full-table pages."""
+        for expected_requests in (1, 0):
+            stream, client = stream_factory(
+                tap_factory(response_cache_path=str(tmp_path)),
+                _page,
+                "company",
+            )
+            assert len(list(stream.get_records(context=None))) == 1
+            assert _page_requests(client) == expected_requests
+
+    def test_cached_pages_take_no_rate_limit_token(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """Only requests that reach the WMS acquire a rate limiter token."""
+        for expected_requests in (1, 0):
+            stream, client = stream_factory(
+                tap_factory(response_cache_path=str(tmp_path)),
+                _page,
+                "company",
+            )
+            limiter = MagicMock()
+            with patch.object(
+                FlextTapOracleWms,
+                "rate_limiter",
+                new_callable=PropertyMock,
+                return_value=limiter,
+            ):
+                assert len(list(stream.get_records(context=None))) == 1
+            assert _page_requests(client) == expected_requests
+            assert limiter.acquire.call_count == client.get_entity_data.call_count
+
+    def test_discovery_samples_are_cached(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Describing an entity twice samples the WMS once."""
+        tap = tap_factory(response_cache_path=str(tmp_path))
+        client = MagicMock()
+        client.get_entity_data.side_effect = _page
+        with patch.object(
+            FlextTapOracleWms,
+            "wms_client",
+            new_callable=PropertyMock,
+            return_value=client,
+        ):
+            first = tap.describe_entity("company")
+            second = tap.describe_entity("company")
+        assert first.value == second.value
+        assert client.get_entity_data.call_count == 1
@@ -0,0 +1,166 @@
+"""Unit tests for schema inference, drift detection and catalog caching."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+
+def _client(samples: t.MappingKV[str, t.SequenceOf[t.JsonMapping]]) -> MagicMock:
+    client = MagicMock()
+    client.discover_entities.return_value = r[t.StrSequence].ok(list(samples))
+    client.get_entity_data.side_effect = lambda entity_name, **_: r[
+        t.SequenceOf[t.JsonMapping]
+    ].ok(samples[entity_name])
+    return client
+
+
+@pytest.fixture
+def cached_tap(
+    tmp_path: Path,
+    tap_factory: Callable[..., FlextTapOracleWms],
+) -> FlextTapOracleWms:
+    """Tap configured with a catalog cache and drift checking."""
+    return tap_factory(
+        catalog_cache_path=str(tmp_path / "catalog.json"),
+        check_schema_drift=True,
+    )
+
+
+class TestsFlextTapOracleWmsSchemaDrift:
+    """Validate describe, diff and targeted catalog refresh."""
+
+    def test_infer_widens_mixed_types(self) -> None:
+        """Integer/number widen to number, other mixes widen to string."""
+        schema = u.TapOracleWms.SchemaInference.infer([
+            {"id": 1, "qty": 1, "code": "A", "flag": True, "note": None},
+            {"id": 2, "qty": 1.5, "code": 3, "flag": False, "note": None},
+        ])
+        assert schema["properties"] == {
+            "id": {"type": ["null", "integer"]},
+            "qty": {"type": ["null", "number"]},
+            "code": {"type": ["null", "string"]},
+            "flag": {"type": ["null", "boolean"]},
+            "note": {},
+        }
+
+    def test_infer_marks_timestamp_columns(self) -> None:
+        """Columns sampled only as ISO timestamps get ``format: date-time``."""
+        schema = u.TapOracleWms.SchemaInference.infer([
+            {
+                "mod_ts": "2025-01-01T10:00:00",
+                "create_ts": "2025-01-01 10:00:00.123+00:00",
+                "ship_date": "2025-01-01",
+                "ref": "2025-01-01T10:00:00",
+            },
+            {
+                "mod_ts": None,
+                "create_ts": "2025-01-02T08:30:00Z",
+                "ship_date": "2025-01-02",
+                "ref": "R-1",
+            },
+        ])
+        assert schema["properties"] == {
+            "mod_ts": {"type": ["null", "string"], "format": "date-time"},
+            "create_ts": {"type": ["null", "string"], "format": "date-time"},
+            "ship_date": {"type": ["null", "string"]},
+            "ref": {"type": ["null", "string"]},
+        }
+
+    def test_diff_reports_added_removed_and_retyped(self) -> None:
+        """Drift lists column-level changes between two schemas."""
+        cached = u.TapOracleWms.SchemaInference.infer([{"id": 1, "old": "x"}])
+        live = u.TapOracleWms.SchemaInference.infer([{"id": "1", "new": 2}])
+        drift = u.TapOracleWms.SchemaDrift.diff("item", cached, live)
+        assert drift.drifted
+        assert drift.added == ("new",)
+        assert drift.removed == ("old",)
+        assert drift.retyped == (("id", "integer", "string"),)
+
+    def test_all_null_columns_are_not_retyped(self) -> None:
+        """A column null in every sample is unknown, not drifted to string."""
+        cached = u.TapOracleWms.SchemaInference.infer([{"id": 1, "qty": 2}])
+        live = u.TapOracleWms.SchemaInference.infer([{"id": 1, "qty": None}])
+        assert not u.TapOracleWms.SchemaDrift.diff("item", cached, live).drifted
+        merged = u.TapOracleWms.SchemaDrift.merge(
+            cached,
+            u.TapOracleWms.SchemaInference.infer([{"qty": None, "new": "A"}]),
+        )
+        assert merged["properties"] == {
+            "qty": {"type": ["null", "integer"]},
+            "new": {"type": ["null", "string"]},
+        }
+
+    def test_diff_ignores_empty_live_sample(self) -> None:
+        """An empty describe sample is not reported as dropped columns."""
+        cached = u.TapOracleWms.SchemaInference.infer([{"id": 1}])
+        live = u.TapOracleWms.SchemaInference.infer([])
+        assert not u.TapOracleWms.SchemaDrift.diff("item", cached, live).drifted
+
+    def test_discovery_caches_described_schemas(
+        self,
+        cached_tap: FlextTapOracleWms,
+    ) -> None:
+        """First discovery describes entities and writes the catalog cache."""
+        client = _client({"item": [{"id": 1, "code": "A"}]})
+        with patch.object(
+            FlextTapOracleWms,
+            "wms_client",
+            new_callable=PropertyMock,
+            return_value=client,
+        ):
+            result = cached_tap.discovercatalog_typed()
+        assert result.success
+        cache_file = cached_tap._catalog_cache_file()
+        assert cache_file is not None
+        assert cache_file.is_file()
+        assert (
+            "code" in cached_tap._read_cached_schemas(cache_file)["item"]["properties"]
+        )
+
+    def test_discovery_refreshes_only_drifted_entities(
+        self,
+        cached_tap: FlextTapOracleWms,
+    ) -> None:
+        """Only entities whose live schema changed are rewritten in the cache."""
+        cache_file = cached_tap._catalog_cache_file()
+        assert cache_file is not None
+        infer = u.TapOracleWms.SchemaInference.infer
+        FlextTapOracleWms._write_cached_schemas(
+            cache_file,
+            {
+                "item": infer([{"id": 1, "code": "A"}]),
+                "location": infer([{"id": 1}]),
+            },
+        )
+        client = _client({
+            "item": [{"id": 1, "code": "A", "weight": 1.5}],
+            "location": [{"id": 2}],
+        })
+        with patch.object(
+            FlextTapOracleWms,
+            "wms_client",
+            new_callable=PropertyMock,
+            return_value=client,
+        ):
+            report = cached_tap.diff_catalog()
+            result = cached_tap.discovercatalog_typed()
+        assert report.success
+        assert [drift.entity for drift in report.value if drift.drifted] == ["item"]
+        assert result.success
+        schemas = cached_tap._read_cached_schemas(cache_file)
+        assert "weight" in schemas["item"]["properties"]
+
+    def test_diff_catalog_requires_cache(self, tap_instance: FlextTapOracleWms) -> None:
+        """Drift reporting fails clearly without a catalog cache."""
+        result = tap_instance.diff_catalog()
+        assert result.failure
+        assert "catalog_cache_path" in str(result.error)
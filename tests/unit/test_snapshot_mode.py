@@ -0,0 +1,73 @@
+"""Unit tests for the point-in-time snapshot mode."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+from flext_tests import r
+
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+
+
+def _first_filters(
+    tap: FlextTapOracleWms,
+    name: str,
+    schema: t.JsonMapping,
+) -> t.ScalarMapping:
+    client = MagicMock()
+    client.get_entity_data.return_value = r[t.SequenceOf[t.JsonMapping]].ok([])
+    stream = FlextTapOracleWmsStream(tap=tap, name=name, schema=schema, client=client)
+    assert list(stream.get_records(context=None)) == []
+    filters: t.ScalarMapping = client.get_entity_data.call_args.kwargs["filters"]
+    return filters
+
+
+class TestsFlextTapOracleWmsSnapshotMode:
+    """Validate the shared run-start upper bound of full-table streams."""
+
+    def test_full_table_streams_share_run_start_bound(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Every full-table stream is read strictly before the run start."""
+        tap = tap_factory(snapshot_mode=True)
+        bounds = [
+            _first_filters(tap, name, {"type": "object"})["mod_ts__lt"]
+            for name in ("order_hdr", "order_dtl")
+        ]
+        assert bounds == [tap.run_started_at, tap.run_started_at]
+
+    def test_configured_replication_key_bounds_snapshot(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The snapshot column follows the replication_key setting."""
+        tap = tap_factory(snapshot_mode=True, replication_key="create_ts")
+        filters = _first_filters(tap, "company", {"type": "object"})
+        assert filters["create_ts__lt"] == tap.run_started_at
+
+    def test_entities_without_key_stay_unbounded(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """A described schema without the key column is read unbounded."""
+        schema: t.JsonMapping = {
+            "type": "object",
+            "properties": {"code": {"type": ["null", "string"]}},
+        }
+        filters = _first_filters(tap_factory(snapshot_mode=True), "lookup", schema)
+        assert "mod_ts__lt" not in filters
+
+    def test_full_table_streams_unbounded_by_default(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """Without snapshot mode full-table streams have no upper bound."""
+        assert "mod_ts__lt" not in _first_filters(
+            tap_factory(),
+            "company",
+            {"type": "object"},
+        )
@@ -0,0 +1,112 @@
+"""Unit tests for run history and longest-first stream scheduling."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.utilities import u
+
+
+def _record(history: u.TapOracleWms.RunHistory, durations: dict[str, float]) -> None:
+    for name, duration in durations.items():
+        history.add(name, duration_seconds=duration, records=10, byte_count=100)
+    history.commit()
+
+
+class TestsFlextTapOracleWmsStreamScheduling:
+    """Validate the run history store and LPT scheduling."""
+
+    def test_run_history_round_trip(self, tmp_path: Path) -> None:
+        """Committed runs persist and estimates use the median duration."""
+        store = tmp_path / "history.json"
+        history = u.TapOracleWms.RunHistory(store)
+        for duration in (10.0, 30.0, 20.0):
+            _record(history, {"order_dtl": duration})
+        reloaded = u.TapOracleWms.RunHistory(store)
+        assert reloaded.estimate("order_dtl") == pytest.approx(20.0)
+        assert reloaded.estimate("company") is None
+        assert [run.records for run in reloaded.runs("order_dtl")] == [10, 10, 10]
+
+    def test_run_history_accumulates_partitions_and_trims(
+        self,
+        tmp_path: Path,
+    ) -> None:
+        """Several extractions of one stream add up; old runs are dropped."""
+        history = u.TapOracleWms.RunHistory(tmp_path / "history.json", depth=2)
+        for _ in range(3):
+            history.add("item", duration_seconds=1.0, records=5, byte_count=50)
+            history.add("item", duration_seconds=2.0, records=5, byte_count=50)
+            history.commit()
+        runs = history.runs("item")
+        assert len(runs) == 2
+        assert runs[-1].duration_seconds == pytest.approx(3.0)
+        assert runs[-1].records == 10
+        assert runs[-1].finished_at
+
+    def test_unreadable_history_is_empty(self, tmp_path: Path) -> None:
+        """A corrupted store never blocks extraction."""
+        store = tmp_path / "history.json"
+        store.write_text("{not json", encoding="utf-8")
+        assert u.TapOracleWms.RunHistory(store).estimate("item") is None
+
+    def test_longest_first_and_pack(self) -> None:
+        """Unknown streams lead, then known streams by descending duration."""
+        estimates: dict[str, float | None] = {
+            "company": 1.0,
+            "order_dtl": 50.0,
+            "order_hdr": 20.0,
+            "item": 18.0,
+            "new_entity": None,
+        }
+        scheduler = u.TapOracleWms.StreamScheduler
+        order = scheduler.longest_first(list(estimates), estimates)
+        assert order == ["new_entity", "order_dtl", "order_hdr", "item", "company"]
+        lanes = scheduler.pack(list(estimates), estimates, 2)
+        assert lanes == [["new_entity", "order_hdr"], ["order_dtl", "item", "company"]]
+
+    def test_parents_first_keeps_order_otherwise(self) -> None:
+        """Parents move ahead of their children; cycles do not loop forever."""
+        scheduler = u.TapOracleWms.StreamScheduler
+        order = scheduler.parents_first(
+            ["allocation", "item", "order_dtl", "order_hdr"],
+            {"allocation": "order_dtl", "order_dtl": "order_hdr", "item": "absent"},
+        )
+        assert order == ["order_hdr", "order_dtl", "allocation", "item"]
+        assert scheduler.parents_first(["a", "b"], {"a": "b", "b": "a"}) == ["b", "a"]
+
+    def test_parallel_sync_starts_longest_stream_first(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Parallel sync submits streams in longest-processing-time order."""
+        store = tmp_path / "history.json"
+        _record(
+            u.TapOracleWms.RunHistory(store),
+            {"company": 1.0, "order_dtl": 90.0, "order_hdr": 30.0},
+        )
+        tap = tap_factory(run_history_path=str(store))
+        tap._reset_state_progress_markers = MagicMock()  # type: ignore[method-assign]
+        tap._set_compatible_replication_methods = MagicMock()  # type: ignore[method-assign]
+        started: list[str] = []
+        streams: dict[str, MagicMock] = {}
+        for name in ("company", "order_hdr", "order_dtl"):
+            stream = MagicMock()
+            stream.name = name
+            stream.selected = True
+            stream.parent_stream_type = None
+            stream.sync.side_effect = lambda name=name: started.append(name)
+            streams[name] = stream
+        with patch.object(
+            FlextTapOracleWms,
+            "streams",
+            new_callable=PropertyMock,
+            return_value=streams,
+        ):
+            tap._sync_all_parallel(1)
+        assert started == ["order_dtl", "order_hdr", "company"]
@@ -0,0 +1,92 @@
+"""Unit tests for the seeded synthetic WMS dataset generator."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from tests.utilities import u
+
+
+def _dataset(**options: int) -> u.TapOracleWms.WmsDataset:
+    return u.TapOracleWms.WmsDataset(orders=200, items=500, seed=7, **options)
+
+
+class TestsFlextTapOracleWmsSyntheticDataset:
+    """Validate determinism, fan-out, distributions and streaming output."""
+
+    def test_same_seed_regenerates_same_rows(self) -> None:
+        """Two passes with one seed agree; another seed changes the data."""
+        first = list(_dataset().rows("allocation"))
+        assert first == list(_dataset().rows("allocation"))
+        assert first != list(
+            u.TapOracleWms.WmsDataset(orders=200, seed=8).rows(
+                "allocation",
+            )
+        )
+
+    def test_foreign_keys_resolve_across_passes(self) -> None:
+        """Every line and allocation points at rows of its parent entity."""
+        dataset = _dataset()
+        orders = {row["id"] for row in dataset.rows("order_hdr")}
+        lines = {row["id"]: row for row in dataset.rows("order_dtl")}
+        allocations = list(dataset.rows("allocation"))
+        assert len(orders) == 200
+        assert {row["order_id"] for row in lines.values()} <= orders
+        assert len(lines) > len(orders)
+        assert allocations
+        for allocation in allocations:
+            line = lines[allocation["order_dtl_id"]]
+            assert allocation["item_id"] == line["item_id"]
+            assert 1 <= allocation["alloc_qty"] <= line["ord_qty"]
+
+    def test_distributions_are_skewed_and_low_cardinality(self) -> None:
+        """Popular items dominate lines and statuses stay in the vocabulary."""
+        lines = list(_dataset().rows("order_dtl"))
+        popularity = Counter(row["item_id"] for row in lines).most_common()
+        top_share = sum(count for _, count in popularity[:10]) / len(lines)
+        assert top_share > 10 / 500 * 5
+        assert {row["status"] for row in lines} <= {
+            status for status, _ in u.TapOracleWms.WmsDataset.LINE_STATUSES
+        }
+        created = [row["create_ts"] for row in _dataset().rows("order_hdr")]
+        assert created == sorted(created)
+
+    def test_wide_columns_extend_rows(self) -> None:
+        """``wide_columns`` adds that many attribute columns to each row."""
+        header = next(_dataset(wide_columns=40).rows("order_hdr"))
+        assert sum(name.startswith("attr_") for name in header) == 40
+
+    def test_write_streams_gzip_json_lines(self, tmp_path: Path) -> None:
+        """Every entity is written as one gzip JSON-lines file."""
+        dataset = _dataset()
+        written = dataset.write(tmp_path)
+        assert set(written) == set(dataset.ENTITIES)
+        with gzip.open(written["order_dtl"], "rt", encoding="utf-8") as handle:
+            rows = [json.loads(line) for line in handle]
+        assert rows == list(dataset.rows("order_dtl"))
+
+    def test_feeds_the_emulator(self) -> None:
+        """Row factories and relations plug straight into the emulator."""
+        dataset = _dataset()
+        with u.TapOracleWms.LgfapiEmulator(
+            dataset.entities(),
+            relations=dataset.RELATIONS,
+        ) as emulator:
+            status, _, body = emulator.handle(
+                f"{emulator.PATH_PREFIX}/entity/order_dtl/"
+                "?page_size=5&fields=id,order_id__order_nbr",
+            )
+        page = json.loads(body)
+        assert status == 200
+        assert page["result_count"] == sum(1 for _ in dataset.rows("order_dtl"))
+        assert page["results"][0]["order_id__order_nbr"] == "ORD0000000001"
+
+    def test_unknown_entity_is_rejected(self) -> None:
+        """Entities outside the generated set raise ``KeyError``."""
+        with pytest.raises(KeyError, match="Unknown synthetic entity"):
+            _dataset().rows("facility")
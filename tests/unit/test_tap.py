@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import (
+    Callable,
     Mapping,
 )
 from unittest.mock import MagicMock, PropertyMock, patch
@@ -206,3 +207,41 @@ class TestsFlextTapOracleWmsTap:
         assert metrics["tap_name"] == "flext-tap-oracle-wms"
         assert "version" in metrics
         assert "streams_available" in metrics
+
+    def test_settings_snapshot_is_memoized(
+        self,
+        tap_instance: FlextTapOracleWms,
+    ) -> None:
+        """Settings and validated config are computed once per tap instance."""
+        assert tap_instance.settings is tap_instance.settings
+        assert tap_instance.flext_config is tap_instance.flext_config
+        with pytest.raises(TypeError):
+            tap_instance.settings["page_size"] = 1  # type: ignore[index]
+
+    def test_flext_config_snapshot_is_frozen(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+    ) -> None:
+        """The validated settings model rejects field assignment."""
+        tap = tap_factory(ignored_columns=["internal_note"])
+        config = tap.flext_config
+        assert isinstance(config, FlextTapOracleWmsSettings)
+        with pytest.raises(ValueError, match="frozen"):
+            config.page_size = 1
+        assert config.ignored_columns == ["internal_note"]
+
+    def test_invalidate_settings_rebuilds_snapshot_and_client(
+        self,
+        tap_instance: FlextTapOracleWms,
+    ) -> None:
+        """Invalidation drops memoized settings and the client built from them."""
+        settings_before = tap_instance.settings
+        config_before = tap_instance.flext_config
+        client = MagicMock()
+        tap_instance._wms_client = client
+        tap_instance.invalidate_settings()
+        client.stop.assert_called_once_with()
+        assert tap_instance._wms_client is None
+        assert tap_instance.settings is not settings_before
+        assert tap_instance.flext_config is not config_before
+        assert tap_instance.flext_config == config_before
@@ -0,0 +1,161 @@
+"""Unit tests for recording and replaying WMS responses."""
+
+from __future__ import annotations
+
+import gzip
+import json
+from collections.abc import Callable
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from flext_tests import r
+
+from flext_tap_oracle_wms.errors import (
+    FlextTapOracleWmsConfigurationError,
+    FlextTapOracleWmsError,
+)
+from flext_tap_oracle_wms.streams import FlextTapOracleWmsStream
+from flext_tap_oracle_wms.tap import FlextTapOracleWms
+from tests.typings import t
+from tests.utilities import u
+
+_ROWS: list[t.JsonMapping] = [{"id": 1, "code": "ACME"}, {"id": 2, "code": "BETA"}]
+
+
+def _tap(
+    tap_factory: Callable[..., FlextTapOracleWms],
+    archive: Path,
+    mode: str,
+    **overrides: t.JsonValue,
+) -> FlextTapOracleWms:
+    return tap_factory(
+        wms_archive_path=str(archive),
+        wms_archive_mode=mode,
+        **overrides,
+    )
+
+
+class TestsFlextTapOracleWmsArchive:
+    """Validate the gzip response archive in record and replay modes."""
+
+    def test_record_then_replay_offline(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """A replay run yields the recorded rows without touching the WMS."""
+        archive = tmp_path / "wms.jsonl.gz"
+        live, _ = stream_factory(
+            _tap(tap_factory, archive, "record"),
+            lambda entity_name, limit, filters: r[t.SequenceOf[t.JsonMapping]].ok(
+                _ROWS if filters["page"] == 1 else [],
+            ),
+            "company",
+        )
+        recorded = list(live.get_records(context=None))
+        offline, client = stream_factory(
+            _tap(tap_factory, archive, "replay"),
+            [],
+            "company",
+        )
+        assert list(offline.get_records(context=None)) == recorded
+        client.get_entity_data.assert_not_called()
+
+    def test_archive_keeps_params_and_timing(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """Each archived line holds the request parameters and elapsed time."""
+        archive = tmp_path / "wms.jsonl.gz"
+        live, _ = stream_factory(
+            _tap(tap_factory, archive, "record"),
+            [r[t.SequenceOf[t.JsonMapping]].ok([])],
+            "company",
+        )
+        list(live.get_records(context=None))
+        with gzip.open(archive, "rt", encoding="utf-8") as handle:
+            entries = [json.loads(line) for line in handle]
+        assert len(entries) == 1
+        assert entries[0]["operation"] == "get_entity_data"
+        assert entries[0]["params"]["filters"]["page"] == 1
+        assert entries[0]["elapsed_seconds"] >= 0
+
+    def test_unrecorded_request_fails_replay(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        stream_factory: Callable[..., tuple[FlextTapOracleWmsStream, MagicMock]],
+        tmp_path: Path,
+    ) -> None:
+        """Replaying a request missing from the archive fails the stream."""
+        archive = tmp_path / "wms.jsonl.gz"
+        live, _ = stream_factory(
+            _tap(tap_factory, archive, "record"),
+            [r[t.SequenceOf[t.JsonMapping]].ok([])],
+            "company",
+        )
+        list(live.get_records(context=None))
+        stream, _ = stream_factory(
+            _tap(tap_factory, archive, "replay", max_retries=0),
+            [],
+        )
+        with pytest.raises(FlextTapOracleWmsError, match="No recorded response"):
+            list(stream.get_records(context=None))
+
+    def test_replay_requires_archive(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Replay mode without an archive file is a configuration error."""
+        tap = _tap(tap_factory, tmp_path / "missing.jsonl.gz", "replay")
+        with pytest.raises(FlextTapOracleWmsConfigurationError, match="not found"):
+            _ = tap.wms_archive
+
+    def test_replay_skips_throttling_and_circuit_breaker(
+        self,
+        tap_factory: Callable[..., FlextTapOracleWms],
+        tmp_path: Path,
+    ) -> None:
+        """Replayed responses neither wait for tokens nor feed the breaker."""
+        archive = tmp_path / "wms.jsonl.gz"
+        guards = {
+            "enable_rate_limiting": True,
+            "circuit_breaker": {"enabled": True},
+        }
+        recording = _tap(tap_factory, archive, "record", **guards)
+        assert recording.rate_limiter is not None
+        assert recording.circuit_breaker is not None
+        replaying = _tap(tap_factory, archive, "replay", **guards)
+        assert replaying.rate_limiter is None
+        assert replaying.circuit_breaker is None
+
+    def test_request_key_ignores_timestamp_bounds(self) -> None:
+        """Clock-derived bounds do not change the replay key; others do."""
+        key = u.TapOracleWms.WmsArchive.request_key
+
+        def params(**filters: t.JsonValue) -> t.JsonMapping:
+            return {"entity_name": "item", "filters": {"page": 1, **filters}}
+
+        recorded = key(
+            "get_entity_data",
+            params(
+                mod_ts__gte="2025-01-01T10:00:00+00:00",
+                mod_ts__lt="2025-01-02T10:00:00+00:00",
+            ),
+        )
+        replayed = key(
+            "get_entity_data",
+            params(
+                mod_ts__gte="2025-01-01T10:05:00+00:00",
+                mod_ts__lt="2025-01-02T10:05:00+00:00",
+            ),
+        )
+        assert replayed == recorded
+        assert key("get_entity_data", params(id__gte=5)) != key(
+            "get_entity_data",
+            params(id__gte=6),
+        )
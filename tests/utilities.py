@@ -10,6 +10,10 @@ from __future__ import annotations
 from flext_tests import FlextTestsUtilities
 
 from flext_tap_oracle_wms import FlextTapOracleWmsUtilities
+from tests._utilities.benchmark import TestsFlextTapOracleWmsUtilitiesBenchmark
+from tests._utilities.client import TestsFlextTapOracleWmsUtilitiesClient
+from tests._utilities.dataset import TestsFlextTapOracleWmsUtilitiesDataset
+from tests._utilities.emulator import TestsFlextTapOracleWmsUtilitiesEmulator
 
 
 class TestsFlextTapOracleWmsUtilities(FlextTestsUtilities, FlextTapOracleWmsUtilities):
@@ -29,7 +33,14 @@ class TestsFlextTapOracleWmsUtilities(FlextTestsUtilities, FlextTapOracleWmsUtil
     - Generic utilities accessed via Tests namespace
     """
 
-    pass
+    class TapOracleWms(
+        FlextTapOracleWmsUtilities.TapOracleWms,
+        TestsFlextTapOracleWmsUtilitiesBenchmark,
+        TestsFlextTapOracleWmsUtilitiesClient,
+        TestsFlextTapOracleWmsUtilitiesDataset,
+        TestsFlextTapOracleWmsUtilitiesEmulator,
+    ):
+        """flext-tap-oracle-wms utilities plus test-only load fixtures."""
 
 
 u = TestsFlextTapOracleWmsUtilities